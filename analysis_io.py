@@ -0,0 +1,831 @@
+import os
+import sys
+import json
+import struct
+from array import array
+from itertools import islice, repeat
+from concurrent.futures import ThreadPoolExecutor
+
+from parse_cache import content_hash
+from code_model import Record, as_file_info, model_default
+
+# 분석 결과 읽기/쓰기 (JSON, 줄 단위 NDJSON 스트림, 문자열 테이블 바이너리)
+#
+# NDJSON 스트림은 한 줄에 레코드 하나:
+#   {"type": "header", "format": ..., "version": ..., "project_path": ...}
+#   {"type": "file", "path": ..., "info": {...}}           파싱되는 즉시 기록 (관계 분석 전 AST 정보)
+#   {"type": "relationships", "path": ..., ...}           관계 분석 후 파일별 결과
+#   {"type": "trailer", "file_count": ..., ...}           프로젝트 수준 결과 (git_revision 등)
+
+NDJSON_FORMAT = "java-ast-ndjson"
+NDJSON_VERSION = 1
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+# 바이너리 형식 (.jab, 모든 정수는 리틀 엔디언)
+#   매직 "JAB\x01" | 헤더 길이 u32 | JSON 헤더 {format, version, string_count, scalar_count, shape_count,
+#                                              token_count, file_count}
+#   문자열 테이블: string_count x (UTF-8 바이트 길이 u32, UTF-8 바이트)
+#   스칼라 테이블: scalar_count x (종류 u8, 값 8바이트)  종류 0 None, 1 False, 2 True, 3 정수 i64, 4 실수 f64
+#   모양 테이블:   shape_count x (키 수 u32, 키 수 x 문자열 번호 u32)   dict 키 순서 목록
+#   토큰 열:       token_count x u32
+# 값 번호(풀 번호)는 문자열 테이블 번호, 스칼라는 string_count + 스칼라 번호입니다.
+# 토큰은 (내용 << 3) | 태그이며, 태그별로 뒤따르는 u32가 다릅니다.
+#   LEAF      내용 = 값 번호
+#   LIST      내용 = 항목 수, 항목마다 토큰
+#   LEAF_LIST 내용 = 항목 수, 항목마다 값 번호 (컨테이너가 없는 목록)
+#   DICT      내용 = 모양 번호, 키마다 값 토큰
+#   LEAF_DICT 내용 = 모양 번호, 키마다 값 번호 (컨테이너가 없는 dict)
+#   RECORDS   내용 = 행 수, 모양 번호 1개, 행마다 키 수만큼 값 번호 (모양이 같은 LEAF_DICT 목록)
+BINARY_MAGIC = b"JAB\x01"
+BINARY_FORMAT = "java-ast-binary"
+BINARY_VERSION = 2
+BINARY_EXTENSIONS = ('.jab',)
+BINARY_LEAF, BINARY_LIST, BINARY_LEAF_LIST, BINARY_DICT, BINARY_LEAF_DICT, BINARY_RECORDS = range(6)
+BINARY_TAG_BITS = 3
+# 스칼라 종류 (None/False/True는 값 없이 종류만 의미가 있음)
+BINARY_SCALAR_KINDS = {None: 0, False: 1, True: 2}
+BINARY_INT, BINARY_FLOAT = 3, 4
+# marshal 형식 버전 4 (Python 3.4 이후 동일, 객체 참조 지원)
+MARSHAL_VERSION = 4
+
+# 샤드 출력: 디렉토리에 manifest.json + 샤드 파일들 (패키지별 또는 N개 파일별)
+SHARD_FORMAT = "java-ast-shards"
+SHARD_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+DEFAULT_SHARD_SIZE = 1000
+
+# 관계 분석 단계에서 채워지는 파일별 키 (relationships 레코드에 기록)
+RELATIONSHIP_KEYS = ('dependencies', 'object_references', 'method_calls')
+
+# 파싱 시점에는 없는 키 (file 레코드에서 제외, object_references는 해석 전 목록이 file 레코드에 남음)
+RESOLVED_ONLY_KEYS = ('dependencies', 'method_calls')
+
+# 해석용 중간 결과 (호출 지점, 해석 후 method_calls로 바뀌므로 call_sites 옵션이 있을 때만 기록)
+CALL_SITE_KEY = 'calls'
+
+# 호출 지점 사이드카: 결과에서 뺀 호출 지점을 파일 내용 해시(source_hash)별로 보관하는 NDJSON 파일
+#   {"type": "header", "format": ..., "version": ...}
+#   {"type": "calls", "source_hash": ..., "calls": [...]}
+# 증분 분석은 선언이 바뀐 파일의 호출자만 여기서 호출 지점을 되살려 다시 해석합니다 (다시 파싱하지 않음).
+CALL_SITES_FORMAT = "java-ast-call-sites"
+CALL_SITES_VERSION = 1
+CALL_SITES_SUFFIX = '.calls.ndjson'
+
+def is_ndjson_path(path):
+    """확장자로 NDJSON 스트림 출력/입력인지 판단합니다."""
+    return str(path).endswith(NDJSON_EXTENSIONS)
+
+def is_binary_path(path):
+    """확장자로 바이너리 분석 결과인지 판단합니다."""
+    return str(path).endswith(BINARY_EXTENSIONS)
+
+def _dumps(record):
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=model_default)
+
+def compact_file_info(file_info):
+    """관계 분석에 필요한 정보만 남긴 파일 정보 사본을 반환합니다 (메서드 본문 제외)."""
+    compact = dict(file_info)
+    for key in ('classes', 'interfaces'):
+        if key in compact:
+            compact[key] = [dict(type_info, methods=[{k: v for k, v in method_info.items() if k != 'body'}
+                                                     for method_info in type_info.get('methods', [])])
+                            for type_info in compact[key]]
+    return compact
+
+class NdjsonAnalysisWriter:
+    """분석 결과를 파일 단위 레코드로 바로 기록하는 스트림 작성기.
+
+    파싱 직후 기록하는 file 레코드에는 call_sites가 아니면 호출 지점(calls)을 넣지 않습니다.
+    바이너리 모드로 기록하며 지금까지 쓴 바이트 수(offset)를 직접 세므로, write_file이 반환하는
+    레코드 시작 위치로 같은 파일을 다시 열어 seek할 수 있습니다.
+    """
+
+    def __init__(self, path, project_path, call_sites=False):
+        self.path = path
+        self.file_count = 0
+        self.offset = 0
+        self.excluded_keys = RESOLVED_ONLY_KEYS if call_sites else RESOLVED_ONLY_KEYS + (CALL_SITE_KEY,)
+        self.file = open(path, 'wb')
+        self._write_record({
+            'type': 'header',
+            'format': NDJSON_FORMAT,
+            'version': NDJSON_VERSION,
+            'project_path': project_path
+        })
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_record(self, record):
+        """레코드 한 줄을 기록하고 그 시작 바이트 위치를 반환합니다."""
+        data = (_dumps(record) + '\n').encode('utf-8')
+        offset = self.offset
+        self.file.write(data)
+        self.offset += len(data)
+        return offset
+
+    def write_file(self, file_path, file_info):
+        """파일 하나의 AST 정보를 기록하고 레코드 시작 바이트 위치를 반환합니다 (관계 분석에서만 생기는 키는 제외)."""
+        info = {key: value for key, value in file_info.items() if key not in self.excluded_keys}
+        offset = self._write_record({'type': 'file', 'path': file_path, 'info': info})
+        self.file_count += 1
+        return offset
+
+    def write_relationships(self, project_structure):
+        """관계 분석이 끝난 파일별 의존/객체 참조/호출 결과를 기록합니다."""
+        for file_path, file_info in project_structure['files'].items():
+            self.write_file_relationships(file_path, file_info)
+
+    def write_file_relationships(self, file_path, file_info):
+        """파일 하나의 관계 분석 결과를 기록합니다."""
+        record = {'type': 'relationships', 'path': file_path}
+        record.update((key, file_info[key]) for key in RELATIONSHIP_KEYS if key in file_info)
+        self._write_record(record)
+
+    def write_trailer(self, project_structure):
+        """프로젝트 수준 결과(git_revision, 인덱스 등)를 마지막 레코드로 기록합니다."""
+        record = {'type': 'trailer', 'file_count': self.file_count}
+        record.update((key, value) for key, value in project_structure.items() if key not in ('project_path', 'files'))
+        self._write_record(record)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+class JsonAnalysisWriter:
+    """json.dump(indent=2)와 같은 바이트의 분석 JSON을 파일 레코드 단위로 기록하는 스트림 작성기."""
+
+    def __init__(self, path, project_path):
+        self.path = path
+        self.file_count = 0
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write('{\n  "project_path": ' + self._dumps(project_path, 2) + ',\n  "files": {')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _dumps(value, level):
+        # JSON 문자열 안의 줄바꿈은 이스케이프되므로 줄 단위 들여쓰기를 그대로 덧붙여도 안전함
+        return json.dumps(value, indent=2, ensure_ascii=False, default=model_default).replace('\n', '\n' + '  ' * level)
+
+    def write_file(self, file_path, file_info):
+        """관계 분석까지 끝난 파일 하나의 전체 레코드를 기록합니다."""
+        self.file.write((',' if self.file_count else '') + '\n    ' + self._dumps(file_path, 2) + ': ' +
+                        self._dumps(file_info, 2))
+        self.file_count += 1
+
+    def write_trailer(self, project_structure):
+        """files 객체를 닫고 프로젝트 수준 결과(git_revision, 인덱스 등)를 기록합니다."""
+        self.file.write('\n  }' if self.file_count else '}')
+        for key, value in project_structure.items():
+            if key not in ('project_path', 'files'):
+                self.file.write(',\n  ' + self._dumps(key, 1) + ': ' + self._dumps(value, 1))
+        self.file.write('\n}')
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+def write_ndjson(project_structure, path):
+    """메모리에 있는 분석 결과 전체를 NDJSON 스트림 형식으로 저장합니다 (남아 있는 호출 지점도 그대로 기록)."""
+    with NdjsonAnalysisWriter(path, project_structure['project_path'], call_sites=True) as writer:
+        for file_path, file_info in project_structure['files'].items():
+            writer.write_file(file_path, file_info)
+        writer.write_relationships(project_structure)
+        writer.write_trailer(project_structure)
+
+def call_sites_path(output_path):
+    """분석 결과 경로(파일 또는 샤드 디렉토리)에 딸린 호출 지점 사이드카 경로."""
+    return str(output_path).rstrip('/\\') + CALL_SITES_SUFFIX
+
+class CallSiteWriter:
+    """파일별 호출 지점을 내용 해시별 레코드로 기록하는 사이드카 작성기 (같은 해시는 한 번만)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.written = set()
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write(_dumps({'type': 'header', 'format': CALL_SITES_FORMAT, 'version': CALL_SITES_VERSION}) + '\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, source_hash, calls):
+        if not source_hash or calls is None or source_hash in self.written:
+            return
+        self.written.add(source_hash)
+        self.file.write(_dumps({'type': 'calls', 'source_hash': source_hash, 'calls': calls}) + '\n')
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+def write_call_sites(project_structure, path, keep_call_sites=False):
+    """파일 정보의 호출 지점을 사이드카에 기록하고, keep_call_sites가 아니면 파일 정보에서 지웁니다."""
+    with CallSiteWriter(path) as writer:
+        for file_info in project_structure['files'].values():
+            writer.write(file_info.get('source_hash'), file_info.get(CALL_SITE_KEY))
+            if not keep_call_sites:
+                file_info.pop(CALL_SITE_KEY, None)
+
+def load_call_sites(path):
+    """사이드카를 {내용 해시: 호출 지점 목록}으로 읽습니다 (없거나 형식이 다르면 빈 dict)."""
+    call_sites = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline() or 'null')
+            if not header or header.get('format') != CALL_SITES_FORMAT or header.get('version') != CALL_SITES_VERSION:
+                return call_sites
+            for line in f:
+                record = json.loads(line)
+                call_sites[record['source_hash']] = record['calls']
+    except OSError:
+        pass
+    return call_sites
+
+class _BinaryEncoder:
+    """project_structure를 바이너리 형식의 테이블(문자열/스칼라/모양)과 토큰 열로 바꿉니다."""
+
+    def __init__(self):
+        self.strings = {}
+        self.scalars = {}
+        self.shapes = {}
+        # 스칼라 값 번호는 문자열 수가 정해진 뒤에 정하므로 (스칼라 번호,) 또는 ('leaf', 스칼라 번호)로 임시 기록
+        self.tokens = []
+
+    def leaf(self, value):
+        """컨테이너가 아닌 값의 값 번호 (스칼라는 임시 표기)."""
+        if isinstance(value, str):
+            index = self.strings.get(value)
+            if index is None:
+                index = self.strings[value] = len(self.strings)
+            return index
+        if value is None or value is True or value is False:
+            key = (BINARY_SCALAR_KINDS[value], 0)
+        elif isinstance(value, int):
+            if not -2 ** 63 <= value < 2 ** 63:
+                raise ValueError(f"바이너리 형식에 기록할 수 없는 정수입니다: {value}")
+            key = (BINARY_INT, value)
+        elif isinstance(value, float):
+            key = (BINARY_FLOAT, struct.pack('<d', value))
+        else:
+            raise TypeError(f"바이너리 형식에 기록할 수 없는 값입니다: {type(value).__name__}")
+        index = self.scalars.get(key)
+        if index is None:
+            index = self.scalars[key] = len(self.scalars)
+        return (index,)
+
+    def shape(self, keys):
+        index = self.shapes.get(keys)
+        if index is None:
+            for key in keys:
+                if not isinstance(key, str):
+                    raise TypeError(f"바이너리 형식의 dict 키는 문자열이어야 합니다: {key!r}")
+                self.leaf(key)
+            index = self.shapes[keys] = len(self.shapes)
+        return index
+
+    def value(self, value):
+        """값 하나를 토큰으로 기록합니다 (Record/dict는 dict, list/tuple은 목록)."""
+        tokens = self.tokens
+        if isinstance(value, (dict, Record)):
+            items = list(value.items())
+            shape = self.shape(tuple(key for key, _ in items))
+            if _is_leaf_values(item for _, item in items):
+                tokens.append(shape << BINARY_TAG_BITS | BINARY_LEAF_DICT)
+                tokens.extend(self.leaf(item) for _, item in items)
+            else:
+                tokens.append(shape << BINARY_TAG_BITS | BINARY_DICT)
+                for _, item in items:
+                    self.value(item)
+        elif isinstance(value, (list, tuple)):
+            if _is_leaf_values(value):
+                tokens.append(len(value) << BINARY_TAG_BITS | BINARY_LEAF_LIST)
+                tokens.extend(map(self.leaf, value))
+            elif _is_records(value):
+                tokens.append(len(value) << BINARY_TAG_BITS | BINARY_RECORDS)
+                tokens.append(self.shape(tuple(value[0].keys())))
+                for row in value:
+                    tokens.extend(self.leaf(item) for _, item in row.items())
+            else:
+                tokens.append(len(value) << BINARY_TAG_BITS | BINARY_LIST)
+                for item in value:
+                    self.value(item)
+        else:
+            index = self.leaf(value)
+            tokens.append(('leaf',) + index if isinstance(index, tuple) else index << BINARY_TAG_BITS | BINARY_LEAF)
+
+    def token_array(self):
+        """임시 표기를 값 번호로 바꾼 u32 토큰 배열을 반환합니다."""
+        base = len(self.strings)
+        tokens = array('I', [token if token.__class__ is int
+                             else (base + token[1]) << BINARY_TAG_BITS | BINARY_LEAF if len(token) == 2
+                             else base + token[0]
+                             for token in self.tokens])
+        if sys.byteorder != 'little':
+            tokens.byteswap()
+        return tokens
+
+def _is_leaf_values(values):
+    """값들 중 컨테이너(dict/Record/list/tuple)가 없는지 확인합니다."""
+    return not any(isinstance(value, (dict, Record, list, tuple)) for value in values)
+
+def _is_records(values):
+    """모두 키 순서가 같고 컨테이너 값이 없는, 비어 있지 않은 dict인 목록인지 확인합니다."""
+    if not all(isinstance(value, (dict, Record)) for value in values):
+        return False
+    keys = list(values[0].keys())
+    if not keys:
+        return False
+    return all(list(value.keys()) == keys and _is_leaf_values(item for _, item in value.items()) for value in values)
+
+def write_binary(project_structure, path):
+    """분석 결과를 문자열 테이블 + u32 토큰 열의 바이너리 형식으로 저장합니다 (형식은 모듈 상단 설명 참고)."""
+    encoder = _BinaryEncoder()
+    encoder.value(project_structure)
+    tokens = encoder.token_array()
+    header = json.dumps({
+        'format': BINARY_FORMAT,
+        'version': BINARY_VERSION,
+        'string_count': len(encoder.strings),
+        'scalar_count': len(encoder.scalars),
+        'shape_count': len(encoder.shapes),
+        'token_count': len(tokens),
+        'file_count': len(project_structure['files'])
+    }).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(BINARY_MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        for string in encoder.strings:
+            data = string.encode('utf-8', 'surrogatepass')
+            f.write(struct.pack('<I', len(data)))
+            f.write(data)
+        for kind, payload in encoder.scalars:
+            if kind == BINARY_INT:
+                f.write(struct.pack('<Bq', kind, payload))
+            elif kind == BINARY_FLOAT:
+                f.write(struct.pack('<B', kind) + payload)
+            else:
+                f.write(struct.pack('<Bq', kind, 0))
+        strings = encoder.strings
+        for keys in encoder.shapes:
+            f.write(struct.pack(f'<I{len(keys)}I', len(keys), *map(strings.__getitem__, keys)))
+        f.write(tokens.tobytes())
+
+def read_binary_header(data):
+    """바이너리 분석 결과의 (헤더, 본문 시작 위치)를 반환합니다."""
+    if bytes(data[:len(BINARY_MAGIC)]) != BINARY_MAGIC:
+        raise ValueError("바이너리 분석 결과 형식이 아닙니다.")
+    offset = len(BINARY_MAGIC)
+    (header_length,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    header = json.loads(bytes(data[offset:offset + header_length]))
+    if header.get('format') != BINARY_FORMAT or header.get('version') != BINARY_VERSION:
+        raise ValueError(f"지원하지 않는 바이너리 분석 결과 버전입니다: {header.get('version')}")
+    return header, offset + header_length
+
+def read_binary(path):
+    """바이너리 분석 결과를 project_structure로 읽습니다 (테이블을 읽은 뒤 토큰 열을 한 번 순회)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    header, offset = read_binary_header(data)
+
+    pool = []
+    for _ in range(header['string_count']):
+        (length,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        pool.append(data[offset:offset + length].decode('utf-8', 'surrogatepass'))
+        offset += length
+    constants = (None, False, True)
+    for kind, integer in struct.iter_unpack('<Bq', data[offset:offset + 9 * header['scalar_count']]):
+        if kind == BINARY_INT:
+            pool.append(integer)
+        elif kind == BINARY_FLOAT:
+            pool.append(struct.unpack('<d', struct.pack('<q', integer))[0])
+        else:
+            pool.append(constants[kind])
+    offset += 9 * header['scalar_count']
+    shapes = []
+    for _ in range(header['shape_count']):
+        (key_count,) = struct.unpack_from('<I', data, offset)
+        shapes.append([pool[index] for index in struct.unpack_from(f'<{key_count}I', data, offset + 4)])
+        offset += 4 + 4 * key_count
+    tokens = array('I')
+    tokens.frombytes(data[offset:offset + 4 * header['token_count']])
+    if len(tokens) != header['token_count']:
+        raise ValueError("바이너리 분석 결과가 잘렸습니다.")
+    if sys.byteorder != 'little':
+        tokens.byteswap()
+    return _decode_tokens(tokens.tolist(), pool, shapes)
+
+def _decode_tokens(tokens, pool, shapes):
+    """토큰 열을 값 하나로 복원합니다 (컨테이너가 없는 목록/dict/레코드 목록은 C 수준 map으로 한 번에 복원)."""
+    stream = iter(tokens)
+    next_token = stream.__next__
+    lookup = pool.__getitem__
+
+    def value(token):
+        tag = token & 7
+        payload = token >> BINARY_TAG_BITS
+        if tag == BINARY_LEAF:
+            return pool[payload]
+        if tag == BINARY_LEAF_DICT:
+            keys = shapes[payload]
+            return dict(zip(keys, map(lookup, islice(stream, len(keys)))))
+        if tag == BINARY_LEAF_LIST:
+            return list(map(lookup, islice(stream, payload)))
+        if tag == BINARY_RECORDS:
+            keys = shapes[next_token()]
+            rows = zip(*[map(lookup, islice(stream, payload * len(keys)))] * len(keys))
+            return list(map(dict, map(zip, repeat(keys), rows)))
+        # 일반 컨테이너: 값 토큰이 LEAF이면 재귀 호출 없이 바로 풀에서 꺼냄
+        if tag == BINARY_DICT:
+            result = {}
+            for key in shapes[payload]:
+                token = next_token()
+                result[key] = pool[token >> BINARY_TAG_BITS] if token & 7 == BINARY_LEAF else value(token)
+            return result
+        result = []
+        append = result.append
+        for token in islice(stream, payload):
+            append(pool[token >> BINARY_TAG_BITS] if token & 7 == BINARY_LEAF else value(token))
+        return result
+
+    return value(next_token())
+
+def write_analysis(project_structure, path):
+    """확장자에 따라 JSON, NDJSON 또는 바이너리로 분석 결과를 저장합니다."""
+    if is_ndjson_path(path):
+        write_ndjson(project_structure, path)
+    elif is_binary_path(path):
+        write_binary(project_structure, path)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(project_structure, f, indent=2, ensure_ascii=False, default=model_default)
+
+def iter_ndjson_records(path):
+    """NDJSON 스트림의 레코드를 한 줄씩 반환합니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def read_ndjson(path):
+    """NDJSON 스트림을 기존 JSON과 같은 project_structure로 조립합니다."""
+    project_structure = {'project_path': None, 'files': {}}
+    files = {}
+    order = []
+    for record in iter_ndjson_records(path):
+        record_type = record.pop('type')
+        if record_type == 'header':
+            project_structure['project_path'] = record['project_path']
+        elif record_type == 'file':
+            files[record['path']] = record['info']
+        elif record_type == 'relationships':
+            order.append(record['path'])
+            files.setdefault(record.pop('path'), {}).update(record)
+        elif record_type == 'trailer':
+            record.pop('file_count', None)
+            project_structure.update(record)
+
+    # file 레코드는 파싱이 끝난 순서이므로 relationships 레코드(프로젝트 파일 순서) 기준으로 정렬
+    project_structure['files'] = {file_path: files.pop(file_path) for file_path in order if file_path in files}
+    project_structure['files'].update(files)
+    return project_structure
+
+def write_output(project_structure, path, output_options=None):
+    """출력 옵션에 따라 샤드 출력 또는 단일 파일(확장자별 형식)로 저장하고 저장 경로를 반환합니다.
+
+    output_options: {'shard_by': 'package' | 'files', 'shard_size': N, 'shard_format': 'json' | 'ndjson' | 'jab',
+                     'call_sites': 해석 전 호출 지점 유지 여부 (분석 단계에서 사용)}
+    """
+    options = output_options or {}
+    if options.get('shard_by'):
+        return write_sharded(project_structure, path, options['shard_by'],
+                             options.get('shard_size') or DEFAULT_SHARD_SIZE,
+                             '.' + options.get('shard_format', 'json'))
+    write_analysis(project_structure, path)
+    return path
+
+def is_sharded_path(path):
+    """샤드 출력 디렉토리(또는 그 manifest.json)인지 판단합니다."""
+    return os.path.isdir(path) or os.path.basename(path) == MANIFEST_NAME
+
+def _manifest_path(path):
+    return os.path.join(path, MANIFEST_NAME) if os.path.isdir(path) else path
+
+def _shard_name(index, package):
+    """샤드 파일 이름 (패키지 이름은 파일 시스템에서 안전한 문자만 사용)."""
+    label = ''.join(char if char.isalnum() or char in '._-' else '_' for char in package) if package else 'default'
+    return f"{index:05d}-{label}"
+
+def make_shards(project_structure, shard_by='package', shard_size=DEFAULT_SHARD_SIZE):
+    """파일 목록을 샤드별 [(파일 경로, 파일 정보)] 목록으로 나눕니다 (패키지별 또는 shard_size개씩)."""
+    items = list(project_structure['files'].items())
+    if shard_by == 'files':
+        return [items[start:start + shard_size] for start in range(0, len(items), shard_size)]
+    if shard_by != 'package':
+        raise ValueError(f"알 수 없는 샤드 기준입니다: {shard_by}")
+
+    shards = {}
+    for file_path, file_info in items:
+        shards.setdefault(file_info.get('package') or '', []).append((file_path, file_info))
+    return [shards[package] for package in sorted(shards)]
+
+def _write_hashed(project_data, directory, name, extension):
+    """샤드 하나를 저장하고 매니페스트 항목(경로, 해시, 크기)을 반환합니다."""
+    relative_path = f"shards/{name}{extension}"
+    path = os.path.join(directory, relative_path)
+    write_analysis(project_data, path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    return {'path': relative_path, 'hash': content_hash(data), 'bytes': len(data)}
+
+def write_sharded(project_structure, output_dir, shard_by='package', shard_size=DEFAULT_SHARD_SIZE, extension='.json'):
+    """분석 결과를 샤드 파일들과 매니페스트로 저장하고 매니페스트 경로를 반환합니다.
+
+    샤드는 관계 분석 결과를 포함한 작은 project_structure이며, 프로젝트 수준 결과 중 큰 것
+    (impact_index, dependency_cycles 등)은 별도 project 파일에, git_revision 같은 값은 매니페스트에 둡니다.
+    """
+    os.makedirs(os.path.join(output_dir, 'shards'), exist_ok=True)
+    project_path = project_structure['project_path']
+    extras = {key: value for key, value in project_structure.items() if key not in ('project_path', 'files')}
+
+    manifest = {
+        'format': SHARD_FORMAT,
+        'version': SHARD_VERSION,
+        'project_path': project_path,
+        'shard_by': shard_by,
+        'file_count': len(project_structure['files']),
+        'git_revision': extras.pop('git_revision', None),
+        'shards': []
+    }
+
+    for index, items in enumerate(make_shards(project_structure, shard_by, shard_size)):
+        packages = sorted({file_info.get('package') or '' for _, file_info in items})
+        entry = _write_hashed({'project_path': project_path, 'files': dict(items)}, output_dir,
+                              _shard_name(index, packages[0]) if shard_by == 'package' else f"{index:05d}", extension)
+        entry.update({'file_count': len(items), 'packages': packages})
+        manifest['shards'].append(entry)
+
+    if extras:
+        manifest['project_data'] = _write_hashed(dict({'project_path': project_path, 'files': {}}, **extras),
+                                                 output_dir, 'project', extension)
+
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest_path
+
+def read_manifest(path):
+    """샤드 매니페스트를 읽습니다 (디렉토리 또는 manifest.json 경로)."""
+    with open(_manifest_path(path), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format') != SHARD_FORMAT or manifest.get('version') != SHARD_VERSION:
+        raise ValueError(f"샤드 매니페스트 형식이 아닙니다: {path}")
+    return manifest
+
+def select_shards(manifest, packages=None):
+    """주어진 패키지(또는 그 하위 패키지)를 포함하는 샤드 항목만 고릅니다 (None이면 전체)."""
+    if packages is None:
+        return list(manifest['shards'])
+    prefixes = tuple(packages)
+    return [shard for shard in manifest['shards']
+            if any(package == prefix or package.startswith(prefix + '.')
+                   for package in shard['packages'] for prefix in prefixes)]
+
+def load_shard(base_dir, entry, verify=True):
+    """샤드 하나를 읽습니다 (verify면 매니페스트의 해시와 비교)."""
+    path = os.path.join(base_dir, entry['path'])
+    if verify:
+        with open(path, 'rb') as f:
+            if content_hash(f.read()) != entry['hash']:
+                raise ValueError(f"샤드 해시가 매니페스트와 다릅니다: {entry['path']}")
+    return load_analysis(path)
+
+def read_sharded(path, packages=None, max_workers=4, verify=True):
+    """샤드 출력을 읽어 project_structure로 조립합니다 (샤드는 스레드로 병렬 읽기, packages로 일부만 선택)."""
+    manifest = read_manifest(path)
+    base_dir = os.path.dirname(_manifest_path(path))
+    shards = select_shards(manifest, packages)
+
+    project_path = manifest['project_path']
+    files = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for shard in executor.map(lambda entry: load_shard(base_dir, entry, verify), shards):
+            files.update(shard['files'])
+
+    # 분석기와 같은 순서(절대 경로 정렬)로 복원
+    project_structure = {
+        'project_path': project_path,
+        'files': {file_path: files[file_path] for file_path in sorted(files, key=lambda p: os.path.join(project_path, p))}
+    }
+    if manifest.get('git_revision'):
+        project_structure['git_revision'] = manifest['git_revision']
+    if 'project_data' in manifest and packages is None:
+        extras = load_shard(base_dir, manifest['project_data'], verify)
+        project_structure.update((key, value) for key, value in extras.items() if key not in ('project_path', 'files'))
+    return project_structure
+
+# JSON 분석 결과를 레코드 단위로 읽을 때 한 번에 읽는 문자 수 (값이 더 크면 두 배씩 늘려 다시 읽음)
+JSON_READ_SIZE = 1 << 20
+
+class JsonStreamReader:
+    """텍스트 파일을 청크 단위로 읽으며 JSON 객체의 키와 값을 하나씩 디코딩하는 커서.
+
+    버퍼에는 아직 소비하지 않은 부분만 남기므로 메모리는 가장 큰 값 하나 정도로 제한됩니다.
+    """
+
+    def __init__(self, file, read_size=JSON_READ_SIZE):
+        self.file = file
+        self.read_size = read_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size):
+        """소비한 앞부분을 버리고 size 문자를 더 읽습니다 (파일 끝이면 False)."""
+        chunk = self.file.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """공백을 건너뛰고 다음 문자를 반환합니다 (파일 끝이면 빈 문자열)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\n\r':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(self.read_size):
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self):
+        """다음 JSON 값 하나를 디코딩합니다 (값이 버퍼 끝에서 잘렸으면 더 읽고 다시 시도)."""
+        self.peek()
+        size = self.read_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof or not self._fill(size):
+                    raise
+                size *= 2
+                continue
+            # 버퍼 끝에서 잘린 숫자(예: '-1.' -> -1)는 뒤에 소수부/지수부가 더 있을 수 있음
+            if (isinstance(value, (int, float)) and self.buffer[end:end + 1] in ('', '.', 'e', 'E')
+                    and not self.eof and self._fill(size)):
+                continue
+            self.pos = end
+            return value
+
+    def keys(self):
+        """현재 위치의 객체를 열고 키를 하나씩 반환합니다 (호출하는 쪽이 키마다 value()로 값을 소비해야 함)."""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", self.buffer, self.pos - 1)
+
+def iter_json_files(path):
+    """분석 JSON의 'files' 객체에서 (파일 경로, 파일 정보)를 하나씩 읽습니다 (문서 전체를 올리지 않음)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = JsonStreamReader(f)
+        for key in stream.keys():
+            if key != 'files':
+                stream.value()
+                continue
+            for file_path in stream.keys():
+                yield file_path, stream.value()
+            return
+
+def read_json_header(path):
+    """분석 JSON에서 'files'를 제외한 최상위 값을 읽습니다.
+
+    project_path가 files보다 앞에 있으면 files에 닿는 즉시 멈추고, 아니면 files를 레코드 단위로 건너뜁니다.
+    """
+    header = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = JsonStreamReader(f)
+        for key in stream.keys():
+            if key != 'files':
+                header[key] = stream.value()
+                continue
+            if 'project_path' in header:
+                break
+            for _ in stream.keys():
+                stream.value()
+    return header
+
+def load_analysis(path):
+    """확장자에 따라 JSON, NDJSON, 바이너리 또는 샤드 출력 분석 결과를 읽습니다."""
+    if is_sharded_path(path):
+        return read_sharded(path)
+    if is_ndjson_path(path):
+        return read_ndjson(path)
+    if is_binary_path(path):
+        return read_binary(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+class AnalysisReader:
+    """그래프 로더용 분석 결과 읽기 도구.
+
+    files()는 노드 생성용 (파일 경로, AST 정보), relationships()는 관계 생성용 (파일 경로, 관계 결과)를 반환합니다.
+    - NDJSON: 두 번 모두 파일을 한 줄씩 다시 읽으므로 문서 전체를 메모리에 올리지 않음
+    - 샤드 출력: 선택한 패키지의 샤드만 하나씩 읽음 (shards/load_shard로 샤드 단위 병렬 처리 가능)
+    - JSON: 'files' 객체를 파일 레코드 단위로 스트림 디코딩 (메모리는 가장 큰 파일 레코드 하나 정도)
+    - 바이너리: 한 번에 로드
+    """
+
+    def __init__(self, path, packages=None):
+        self.path = path
+        self.ndjson = is_ndjson_path(path)
+        self.sharded = is_sharded_path(path)
+        self.shards = []
+        self._project = None
+
+        if self.sharded:
+            self.manifest = read_manifest(path)
+            self.base_dir = os.path.dirname(_manifest_path(path))
+            self.shards = select_shards(self.manifest, packages)
+            self.project_path = self.manifest['project_path']
+        elif self.ndjson:
+            with open(path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or '{}')
+            if header.get('type') != 'header' or header.get('format') != NDJSON_FORMAT:
+                raise ValueError(f"분석 결과 스트림 형식이 아닙니다: {path}")
+            self.project_path = header['project_path']
+        elif is_binary_path(path):
+            self._project = read_binary(path)
+            self.project_path = self._project['project_path']
+        else:
+            self.project_path = read_json_header(path)['project_path']
+
+    def packages(self):
+        """샤드 매니페스트에 기록된 (선택된) 패키지 목록을 반환합니다 (샤드 출력이 아니면 None)."""
+        if not self.sharded:
+            return None
+        return sorted({package for shard in self.shards for package in shard['packages'] if package})
+
+    def load_shard(self, entry):
+        """샤드 하나의 project_structure를 읽습니다."""
+        return load_shard(self.base_dir, entry)
+
+    def files(self):
+        """(파일 경로, FileInfo)를 순서대로 반환합니다."""
+        for file_path, file_info in self._raw_files():
+            yield file_path, as_file_info(file_info)
+
+    def _raw_files(self):
+        if self.sharded:
+            for entry in self.shards:
+                yield from self.load_shard(entry)['files'].items()
+            return
+        if self._project is not None:
+            yield from self._project['files'].items()
+            return
+        if not self.ndjson:
+            yield from iter_json_files(self.path)
+            return
+        for record in iter_ndjson_records(self.path):
+            if record['type'] == 'file':
+                yield record['path'], record['info']
+
+    def relationships(self):
+        if self.sharded or not self.ndjson:
+            for file_path, file_info in self._raw_files():
+                yield file_path, {key: file_info[key] for key in RELATIONSHIP_KEYS if key in file_info}
+            return
+        for record in iter_ndjson_records(self.path):
+            if record['type'] == 'relationships':
+                yield record['path'], record
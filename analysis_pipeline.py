@@ -0,0 +1,207 @@
+import gc
+import json
+import sys
+import queue
+import marshal
+import tempfile
+import threading
+from array import array
+
+from code_model import FileInfo, TypeInfo, MethodSymbol, FieldInfo, as_file_info
+from call_graph import method_arity
+from analysis_io import MARSHAL_VERSION, RELATIONSHIP_KEYS, CALL_SITE_KEY
+
+# 메모리 예산 모드(analyze_java_project(memory_budget=MB))의 단계 구성 요소
+# - 탐색 -> 파싱(진행 중인 소스 크기 합 제한) -> 직렬화(유한 큐 + 기록 스레드) -> 관계 분석/출력
+# - 파일별 전체 레코드는 디스크(임시 파일 또는 .ndjson 출력 자체)에 내려 두고,
+#   전역 관계 분석에 필요한 심볼 항목(패키지/임포트/타입 이름/상위 타입/메서드 이름)만 메모리에 유지
+#
+# 예산이 제한하는 것은 동시에 파싱 중인 소스와 기록 대기 큐뿐입니다.
+# 다음 구조는 예산과 관계없이 파일/타입 수에 비례해 분석 끝까지 메모리에 남습니다 (resident_sizes로 측정).
+# - 탐색 결과: 파일 경로/상대 경로/크기 목록
+# - 심볼 항목: 파일별 FileInfo (--impact-index/--cycles면 해석된 관계 결과도 옮겨 둠)
+# - ProjectSymbolTable: declarations/simple_names/packages/exports와 이름 색인(SymbolIndex)
+# - 메서드 인덱스: 메서드 이름 -> 파라미터 수 집합
+# - 저장소 오프셋: 파일당 8바이트 (호출 지점을 따로 내려 두면 8바이트 더)
+
+# 파싱 결과(AST 정보)는 소스의 10배 이상이고 끝난 결과도 소비 전까지 남으므로 예산의 이 비율만큼만 소스를 동시에 파싱
+PARSE_MEMORY_FACTOR = 32
+# 파싱과 디스크 기록 사이 큐에 쌓아 둘 수 있는 파일 레코드 수
+SPILL_QUEUE_SIZE = 64
+
+def parse_budget_bytes(memory_budget):
+    """메모리 예산(MB)에서 동시에 파싱할 소스 크기 합(바이트)을 구합니다."""
+    return max(1, int(memory_budget * 1024 * 1024) // PARSE_MEMORY_FACTOR)
+
+def _intern(value):
+    """이름 문자열(또는 이름 목록)을 intern해 파일마다 반복되는 패키지/임포트/메서드 이름을 공유합니다."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern(item) for item in value]
+    return value
+
+def symbol_entry(file_info):
+    """관계 분석(심볼 테이블, 메서드 인덱스)에 필요한 정보만 남긴 파일 항목을 만듭니다.
+
+    타입은 이름/수정자/상위 타입과 메서드/필드 이름만 남깁니다 (정적 임포트 멤버 해석용).
+    메서드는 오버로드를 구분하는 데 필요한 파라미터 수만 남깁니다 (MethodSymbol).
+    """
+    if 'error' in file_info:
+        return FileInfo(path=file_info.get('path'), error=file_info['error'])
+    entry = FileInfo(package=_intern(file_info.get('package')), imports=_intern(file_info.get('imports', [])))
+    for key in ('classes', 'interfaces'):
+        if key not in file_info:
+            continue
+        entry[key] = [TypeInfo(**{name: _intern(type_info[name])
+                                  for name in ('name', 'modifiers', 'extends', 'implements') if name in type_info},
+                               methods=[MethodSymbol(name=sys.intern(method_info['name']),
+                                                     arity=method_arity(method_info))
+                                        for method_info in type_info.get('methods', [])],
+                               fields=[FieldInfo(name=sys.intern(field_info['name']))
+                                       for field_info in type_info.get('fields', [])])
+                      for type_info in file_info[key]]
+    return entry
+
+def keep_relationships(entry, file_info):
+    """전이적 인덱스/순환 분석을 위해 해석이 끝난 관계 결과를 심볼 항목에 옮깁니다."""
+    for key in RELATIONSHIP_KEYS:
+        if key in file_info:
+            entry[key] = file_info[key]
+
+class RecordSpill:
+    """파일 레코드를 marshal로 임시 파일에 내려 두고 인덱스로 다시 읽는 저장소."""
+
+    def __init__(self, file_count, directory=None):
+        self.file = tempfile.TemporaryFile(dir=directory)
+        self.offsets = array('q', [-1]) * file_count
+
+    def write(self, index, file_path, file_info):
+        self.offsets[index] = self.file.tell()
+        marshal.dump(file_info.to_dict(), self.file, MARSHAL_VERSION)
+
+    def read(self, index):
+        self.file.seek(self.offsets[index])
+        return as_file_info(marshal.load(self.file))
+
+    def resident_bytes(self):
+        """메모리에 남는 오프셋 배열 크기(바이트)."""
+        return self.offsets.itemsize * len(self.offsets)
+
+    def close(self):
+        self.file.close()
+
+class NdjsonSpill:
+    """.ndjson 출력의 file 레코드를 그대로 내려 둔 레코드로 쓰는 저장소.
+
+    작성기가 호출 지점(calls)을 기록하지 않으면 호출 해석에 필요한 calls만 marshal 임시 파일에 따로 내려 둡니다.
+    """
+
+    def __init__(self, writer, file_count):
+        self.writer = writer
+        self.offsets = array('q', [-1]) * file_count
+        self.reader = None
+        self.calls = None
+        if CALL_SITE_KEY in writer.excluded_keys:
+            self.calls = tempfile.TemporaryFile()
+            self.call_offsets = array('q', [-1]) * file_count
+
+    def write(self, index, file_path, file_info):
+        # 작성기가 바이너리 스트림에 쓴 바이트 수로 구한 레코드 시작 위치 (텍스트 모드 tell()은 바이트 위치가 아님)
+        self.offsets[index] = self.writer.write_file(file_path, file_info)
+        if self.calls is not None and CALL_SITE_KEY in file_info:
+            self.call_offsets[index] = self.calls.tell()
+            marshal.dump(file_info[CALL_SITE_KEY], self.calls, MARSHAL_VERSION)
+
+    def read(self, index):
+        if self.reader is None:
+            self.writer.file.flush()
+            self.reader = open(self.writer.path, 'rb')
+        self.reader.seek(self.offsets[index])
+        file_info = as_file_info(json.loads(self.reader.readline())['info'])
+        if self.calls is not None and self.call_offsets[index] >= 0:
+            self.calls.seek(self.call_offsets[index])
+            file_info[CALL_SITE_KEY] = marshal.load(self.calls)
+        return file_info
+
+    def resident_bytes(self):
+        """메모리에 남는 오프셋 배열 크기(바이트)."""
+        size = self.offsets.itemsize * len(self.offsets)
+        if self.calls is not None:
+            size += self.call_offsets.itemsize * len(self.call_offsets)
+        return size
+
+    def close(self):
+        if self.reader is not None:
+            self.reader.close()
+        if self.calls is not None:
+            self.calls.close()
+
+def deep_size(value, seen=None):
+    """값과 그 값이 참조하는 dict/list/tuple/set/레코드/객체 속성의 크기 합(바이트, 공유 객체는 한 번)을 구합니다."""
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, type):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, int, float, array)) and current is not None:
+            stack.extend(gc.get_referents(current))
+    return total
+
+def resident_sizes(project_structure, symbol_table, method_index, spill, discovered=()):
+    """예산과 관계없이 분석 끝까지 메모리에 남는 구조별 크기(바이트)를 구합니다 (이미 센 객체는 다시 세지 않음)."""
+    seen = set()
+    return {
+        'discovery': deep_size(discovered, seen),
+        'symbol_entries': deep_size(project_structure['files'], seen),
+        'symbol_table': deep_size([symbol_table.declarations, symbol_table.simple_names, symbol_table.packages,
+                                   symbol_table.exports], seen),
+        'symbol_index': deep_size(symbol_table.index, seen),
+        'method_index': deep_size(method_index, seen),
+        'spill_offsets': spill.resident_bytes()
+    }
+
+class SpillStage:
+    """파싱 결과를 유한 큐로 받아 별도 스레드에서 저장소에 기록하는 직렬화 단계.
+
+    큐가 가득 차면 put이 기다리므로 기록이 파싱을 따라가지 못해도 결과가 메모리에 쌓이지 않습니다.
+    """
+
+    def __init__(self, spill, queue_size=SPILL_QUEUE_SIZE):
+        self.spill = spill
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.error is not None:
+                # 실패한 뒤에도 큐를 비워 파싱 단계가 멈추지 않게 함
+                continue
+            try:
+                self.spill.write(*item)
+            except Exception as e:
+                self.error = e
+
+    def put(self, index, file_path, file_info):
+        self.queue.put((index, file_path, file_info))
+
+    def finish(self):
+        """남은 레코드 기록을 기다리고, 기록 중 생긴 오류가 있으면 다시 발생시킵니다."""
+        self.queue.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
@@ -0,0 +1,1136 @@
+import os
+import re
+import sys
+import json
+import mmap
+import time
+import argparse
+import tempfile
+
+import java_ast_analyzer
+import java_file_discovery
+import synthetic_corpus
+from code_model import model_default
+
+def write_corpus_from_analysis(json_file_path, output_dir):
+    """분석 JSON(a.json, tmp*.json)으로부터 Java 소스 프로젝트를 복원합니다."""
+    with open(json_file_path, 'r', encoding='utf-8') as f:
+        project_data = json.load(f)
+
+    for file_path, file_info in project_data['files'].items():
+        if 'error' in file_info:
+            continue
+
+        lines = []
+        if file_info.get('package'):
+            lines.append(f"package {file_info['package']};")
+            lines.append("")
+        for import_path in file_info.get('imports', []):
+            lines.append(f"import {import_path};")
+        lines.append("")
+
+        for class_info in file_info.get('classes', []):
+            header = f"public class {class_info['name']}"
+            if class_info.get('extends'):
+                header += f" extends {class_info['extends']}"
+            if class_info.get('implements'):
+                header += f" implements {', '.join(class_info['implements'])}"
+            lines.append(header + " {")
+            for field_info in class_info.get('fields', []):
+                lines.append(f"    private {field_info.get('type') or 'Object'} {field_info['name']};")
+            for method_info in class_info.get('methods', []):
+                lines.append(f"    public {_method_signature(method_info)} {{")
+                lines.append(f"        {method_info.get('body') or ''}")
+                lines.append("    }")
+            lines.append("}")
+
+        for interface_info in file_info.get('interfaces', []):
+            header = f"public interface {interface_info['name']}"
+            if interface_info.get('extends'):
+                header += f" extends {', '.join(interface_info['extends'])}"
+            lines.append(header + " {")
+            for method_info in interface_info.get('methods', []):
+                lines.append(f"    {_method_signature(method_info)};")
+            lines.append("}")
+
+        # 윈도우 경로로 저장된 샘플도 복원할 수 있도록 구분자 정규화
+        target_path = os.path.join(output_dir, *file_path.replace('\\', '/').split('/'))
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        with open(target_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+
+    return output_dir
+
+def _method_signature(method_info):
+    """메서드 정보로 Java 시그니처 문자열을 만듭니다."""
+    parameters = []
+    for param in method_info.get('parameters', []):
+        if isinstance(param, dict):
+            parameters.append(f"{param.get('type') or 'Object'} {param['name']}")
+        else:
+            parameters.append(f"Object {param}")
+    return f"{method_info.get('return_type') or 'void'} {method_info['name']}({', '.join(parameters)})"
+
+def resolve_corpus(args):
+    """명령행 인자에서 벤치마크 대상 프로젝트 경로를 결정합니다."""
+    if args.from_json:
+        output_dir = tempfile.mkdtemp(prefix="java_corpus_")
+        print(f"{args.from_json}에서 Java 소스를 복원합니다: {output_dir}")
+        return write_corpus_from_analysis(args.from_json, output_dir)
+    if not args.project_path:
+        print("project_path 또는 --from-json 중 하나가 필요합니다.")
+        sys.exit(1)
+    return args.project_path
+
+def parse_with_callback(java_parser, source_code):
+    """기존 방식: 한 번에 1바이트씩 반환하는 콜백으로 파싱합니다."""
+    def read_callable_byte_offset(byte_offset, point):
+        return source_code[byte_offset : byte_offset + 1]
+    return java_parser.parse(read_callable_byte_offset, encoding="utf8")
+
+def run_input_benchmark(project_path, repeat=5):
+    """콜백 / bytes / mmap 입력 방식별 파싱 시간을 비교합니다."""
+    java_files = sorted(java_file_discovery.find_java_files(project_path))
+    total_bytes = sum(os.path.getsize(file_path) for file_path in java_files)
+    java_parser = java_ast_analyzer.create_parser()
+    print(f"총 {len(java_files)}개 파일, {total_bytes / 1024:.1f}KB, {repeat}회 반복")
+
+    def parse_callback(file_path):
+        with open(file_path, 'rb') as file:
+            return parse_with_callback(java_parser, file.read())
+
+    def parse_bytes(file_path):
+        with open(file_path, 'rb') as file:
+            return java_parser.parse(file.read())
+
+    def parse_mmap(file_path):
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return java_parser.parse(b"")
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source_code:
+                return java_parser.parse(source_code)
+
+    results = {}
+    for mode, parse_file in (("callback", parse_callback), ("bytes", parse_bytes), ("mmap", parse_mmap)):
+        trees = [str(parse_file(file_path).root_node) for file_path in java_files]
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            for file_path in java_files:
+                parse_file(file_path)
+        elapsed = time.perf_counter() - start_time
+        results[mode] = {'seconds': elapsed, 'trees': trees}
+        mb_per_sec = total_bytes * repeat / elapsed / (1024 * 1024) if elapsed else 0.0
+        print(f"{mode:>8}: {elapsed:.3f}초 ({mb_per_sec:.2f}MB/초)")
+
+    # 세 방식 모두 같은 트리를 만들어야 함
+    same = results['callback']['trees'] == results['bytes']['trees'] == results['mmap']['trees']
+    print(f"트리 일치 여부: {'일치' if same else '불일치'}")
+    if results['bytes']['seconds']:
+        print(f"bytes 대비 callback 속도 비율: {results['callback']['seconds'] / results['bytes']['seconds']:.1f}배")
+    return same
+
+def make_wide_class_source(method_count, fields_per_method=1):
+    """메서드가 수백 개인 단일 Java 클래스 소스를 생성합니다."""
+    lines = ["package bench.wide;", "", "import java.util.List;", "import java.util.Map;", ""]
+    lines.append("public class WideService extends BaseService implements Runnable {")
+    for i in range(method_count * fields_per_method):
+        lines.append(f"    private Helper{i % 17} helper{i};")
+    for i in range(method_count):
+        lines.append(f"    public String method{i}(String name, int count, Request{i % 13} request) {{")
+        lines.append(f"        Result{i % 7} result = new Result{i % 7}(name);")
+        lines.append(f"        Validator.check(request, count);")
+        lines.append(f"        return helper{i}.format(result, \"value-{i}\");")
+        lines.append("    }")
+    lines.append("}")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+def run_extract_benchmark(project_path=None, method_counts=(100, 300, 1000), repeat=5):
+    """walk(노드별 탐색) 대비 cursor / query 추출 엔진의 속도와 결과 일치 여부를 비교합니다."""
+    java_parser = java_ast_analyzer.create_parser()
+    extractors = [(name, java_ast_analyzer.get_extractor(name)) for name in java_ast_analyzer.EXTRACTORS]
+
+    sources = [(f"메서드 {count}개 클래스", make_wide_class_source(count)) for count in method_counts]
+    if project_path:
+        for file_path in sorted(java_file_discovery.find_java_files(project_path)):
+            with open(file_path, 'rb') as file:
+                sources.append((os.path.relpath(file_path, project_path), file.read()))
+
+    all_same = True
+    for label, source_code in sources:
+        tree = java_parser.parse(source_code)
+        expected = json.dumps(extractors[0][1](tree, source_code), default=model_default)
+
+        parts = []
+        for name, extract in extractors:
+            same = json.dumps(extract(tree, source_code), default=model_default) == expected
+            all_same = all_same and same
+
+            start_time = time.perf_counter()
+            for _ in range(repeat):
+                extract(tree, source_code)
+            elapsed = (time.perf_counter() - start_time) / repeat
+            parts.append(f"{name} {elapsed * 1000:.2f}ms{'' if same else ' (불일치)'}")
+
+        print(f"{label}: {', '.join(parts)}")
+
+    return all_same
+
+def run_incremental_benchmark(project_path=None, method_count=1000, repeat=20):
+    """저장 한 번(메서드 본문 한 곳 수정)에 대한 전체 재파싱과 증분 갱신 시간을 비교합니다."""
+    from java_ast_incremental import IncrementalJavaAnalyzer
+
+    java_parser = java_ast_analyzer.create_parser()
+    sources = [(f"메서드 {method_count}개 클래스", make_wide_class_source(method_count))]
+    if project_path:
+        for file_path in sorted(java_file_discovery.find_java_files(project_path)):
+            with open(file_path, 'rb') as file:
+                sources.append((os.path.relpath(file_path, project_path), file.read()))
+
+    all_same = True
+    for label, source_code in sources:
+        analyzer = IncrementalJavaAnalyzer()
+        analyzer.analyze_file(label, source_code)
+
+        # 가운데 문자열 리터럴(없으면 파일 가운데)을 번갈아 수정하는 저장을 흉내냄
+        position = source_code.find(b'"', len(source_code) // 2) + 1 or len(source_code) // 2
+        versions = [source_code[:position] + marker + source_code[position:] for marker in (b"a", b"bb")]
+
+        full_elapsed = 0.0
+        incremental_elapsed = 0.0
+        same = True
+        for i in range(repeat):
+            new_source = versions[i % 2]
+
+            start_time = time.perf_counter()
+            expected = java_ast_analyzer.extract_file_info(java_parser.parse(new_source), new_source)
+            full_elapsed += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            actual = analyzer.update_file(label, new_source)
+            incremental_elapsed += time.perf_counter() - start_time
+
+            expected['path'] = label
+            same = same and json.dumps(actual, default=model_default) == json.dumps(expected, default=model_default)
+
+        all_same = all_same and same
+        stats = analyzer.last_stats
+        print(f"{label}: 전체 {full_elapsed / repeat * 1000:.2f}ms, 증분 {incremental_elapsed / repeat * 1000:.2f}ms "
+              f"(재사용 {stats['reused']}개, 재추출 {stats['extracted']}개){'' if same else ' (불일치)'}")
+
+    return all_same
+
+def find_java_files_with_walk(project_path):
+    """기존 방식: 가지치기 없이 os.walk로 모든 Java 파일을 찾습니다."""
+    java_files = []
+    for root, dirs, files in os.walk(project_path):
+        for file in files:
+            if file.endswith('.java'):
+                java_files.append(os.path.join(root, file))
+    return java_files
+
+def run_discovery_benchmark(project_path, worker_counts=(1, 8, 32), repeat=3):
+    """os.walk 대비 scandir 기반 탐색(가지치기, 스레드 분산)의 속도를 비교합니다."""
+    def measure(find):
+        start_time = time.perf_counter()
+        for _ in range(repeat):
+            found = find()
+        return (time.perf_counter() - start_time) / repeat, found
+
+    elapsed, found = measure(lambda: find_java_files_with_walk(project_path))
+    print(f"os.walk: {elapsed * 1000:.1f}ms, {len(found)}개 파일 (가지치기 없음)")
+
+    results = []
+    for worker_count in worker_counts:
+        elapsed, found = measure(lambda: java_file_discovery.discover_java_files(project_path, max_workers=worker_count))
+        results.append([file_path for file_path, _ in found])
+        print(f"scandir (스레드 {worker_count:>2}개): {elapsed * 1000:.1f}ms, {len(found)}개 파일, "
+              f"{sum(size for _, size in found) / 1024:.1f}KB")
+
+    # 스레드 수와 관계없이 같은 목록(경로순)이어야 함
+    return all(result == results[0] for result in results)
+
+def make_synthetic_project(file_count, imports_per_file=20):
+    """패키지 여러 개에 클래스가 흩어진 가상의 project_structure를 생성합니다."""
+    files = {}
+    for i in range(file_count):
+        package = f"com.example.module{i % 50}.layer{i % 7}"
+        imports = [f"com.example.module{(i + k) % 50}.layer{(i + k) % 7}.Type{(i * 31 + k) % file_count}"
+                   for k in range(imports_per_file // 2)]
+        imports += [f"org.external.lib{k % 9}.Helper{k}" for k in range(imports_per_file - len(imports))]
+        files[f"src/Type{i}.java"] = {
+            'package': package,
+            'imports': imports,
+            'classes': [{
+                'name': f"Type{i}",
+                'extends': f"Type{(i + 1) % file_count}",
+                'implements': [],
+                'fields': [],
+                'methods': []
+            }],
+            'interfaces': [],
+            'object_references': []
+        }
+    return {'project_path': 'synthetic', 'files': files}
+
+def legacy_import_dependencies(project_structure):
+    """기존 방식: 임포트마다 클래스 맵 전체를 endswith/split으로 검사합니다."""
+    class_map = {}
+    for file_path, file_info in project_structure['files'].items():
+        package = file_info.get('package', '')
+        for class_info in file_info.get('classes', []) + file_info.get('interfaces', []):
+            class_map[f"{package}.{class_info['name']}" if package else class_info['name']] = file_path
+            class_map[class_info['name']] = file_path
+    result = {}
+    for file_path, file_info in project_structure['files'].items():
+        dependencies = []
+        for import_path in file_info.get('imports', []):
+            is_internal = False
+            for class_name in class_map.keys():
+                if import_path.endswith(class_name) or class_name in import_path.split('.'):
+                    is_internal = True
+                    break
+            if is_internal or import_path in class_map:
+                dependency = {'type': 'import', 'target': import_path}
+                if import_path in class_map:
+                    dependency['file'] = class_map[import_path]
+                dependencies.append(dependency)
+        result[file_path] = dependencies
+    return result
+
+def run_relationship_benchmark(file_counts=(200, 500, 1000), imports_per_file=20):
+    """기존 선형 탐색 대비 심볼 인덱스 기반 임포트 해석 시간과 결과 일치 여부를 비교합니다."""
+    all_same = True
+    for file_count in file_counts:
+        project_structure = make_synthetic_project(file_count, imports_per_file)
+
+        start_time = time.perf_counter()
+        expected = legacy_import_dependencies(project_structure)
+        legacy_elapsed = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        java_ast_analyzer.analyze_relationships(project_structure)
+        indexed_elapsed = time.perf_counter() - start_time
+
+        actual = {file_path: [dependency for dependency in file_info['dependencies'] if dependency['type'] == 'import']
+                  for file_path, file_info in project_structure['files'].items()}
+        same = actual == expected
+        all_same = all_same and same
+        print(f"파일 {file_count}개: 기존 {legacy_elapsed:.3f}초, 인덱스 {indexed_elapsed:.3f}초"
+              f"{'' if same else ' (불일치)'}")
+
+    return all_same
+
+# SCC 단계(find_components) 시간 한도: 노드 100000개까지 이 값(초), 더 큰 그래프는 노드 수에 비례
+SCC_TIME_LIMIT = 1.0
+SCC_TIME_LIMIT_NODES = 100000
+SCC_REPEAT = 3
+
+def scc_time_limit(node_count):
+    """노드 수에 대한 SCC 단계 시간 한도(초)."""
+    return SCC_TIME_LIMIT * max(node_count, SCC_TIME_LIMIT_NODES) / SCC_TIME_LIMIT_NODES
+
+def make_dependency_project(file_count, edges_per_file=4, seed=0):
+    """무작위 임포트 의존 관계(순환 포함)를 가진 분석 결과 형태의 가상 프로젝트를 만듭니다."""
+    import random
+    rng = random.Random(seed)
+    paths = [f"src/pkg{i % 50}/Type{i}.java" for i in range(file_count)]
+    files = {}
+    for i, path in enumerate(paths):
+        # 대부분은 앞쪽 파일을 참조하고 일부만 뒤쪽을 참조해 크고 작은 순환이 섞이도록 함
+        targets = [rng.randrange(max(i, 1)) if rng.random() < 0.9 else rng.randrange(file_count)
+                   for _ in range(edges_per_file)]
+        files[path] = {'dependencies': [{'type': 'import', 'target': paths[t], 'file': paths[t]} for t in targets]}
+    return {'project_path': 'synthetic', 'files': files}
+
+def bfs_impacted(reverse_edges, start):
+    """기존 방식: 질의마다 역방향 간선을 BFS로 따라갑니다."""
+    from collections import deque
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        for parent in reverse_edges.get(queue.popleft(), ()):
+            if parent not in seen:
+                seen.add(parent)
+                queue.append(parent)
+    seen.discard(start)
+    return seen
+
+def run_impact_benchmark(file_counts=(1000, 10000), queries=200):
+    """질의별 BFS 대비 영향 인덱스(축약 DAG 탐색, 선택적 도달 비트셋)의 구축/질의 시간, 저장 크기와 결과 일치 여부를 비교합니다."""
+    import random
+    import dependency_closure
+
+    all_same = True
+    for file_count in file_counts:
+        project_structure = make_dependency_project(file_count)
+        nodes = list(project_structure['files'])
+        reverse_edges = {}
+        for source, target in dependency_closure.file_dependency_edges(project_structure):
+            reverse_edges.setdefault(nodes[target], set()).add(nodes[source])
+        targets = random.Random(1).sample(nodes, min(queries, file_count))
+
+        start_time = time.perf_counter()
+        expected = [bfs_impacted(reverse_edges, target) for target in targets]
+        bfs_elapsed = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        impact_index = dependency_closure.ImpactIndex.from_edges(
+            nodes, dependency_closure.file_dependency_edges(project_structure))
+        build_elapsed = time.perf_counter() - start_time
+        stored_size = len(json.dumps(impact_index.to_dict()))
+
+        start_time = time.perf_counter()
+        counts = [impact_index.impact_count(target) for target in targets]
+        count_elapsed = time.perf_counter() - start_time
+        actual = [set(impact_index.impacted(target)) for target in targets]
+
+        # 선택적 도달 비트셋 파일로 불러온 인덱스도 같은 결과를 내야 함
+        with tempfile.TemporaryDirectory() as temp_dir:
+            closure_path = os.path.join(temp_dir, 'closure.bin')
+            start_time = time.perf_counter()
+            dependency_closure.write_closure({'files': impact_index}, closure_path)
+            closure_elapsed = time.perf_counter() - start_time
+            closure_size = os.path.getsize(closure_path)
+            loaded = dependency_closure.ImpactIndex.from_dict(impact_index.to_dict())
+            dependency_closure.load_closure({'files': loaded}, closure_path)
+        start_time = time.perf_counter()
+        closure_counts = [loaded.impact_count(target) for target in targets]
+        closure_count_elapsed = time.perf_counter() - start_time
+
+        same = (actual == expected and counts == [len(names) for names in expected] and closure_counts == counts
+                and [set(loaded.impacted(target)) for target in targets] == expected)
+        all_same = all_same and same
+        print(f"파일 {file_count}개, 질의 {len(targets)}개: BFS {bfs_elapsed * 1000:.1f}ms, "
+              f"인덱스 구축 {build_elapsed * 1000:.1f}ms (저장 {stored_size / 1024:.0f}KB), "
+              f"질의당 {count_elapsed / len(targets) * 1e6:.1f}us, "
+              f"도달 비트셋 파일 {closure_elapsed * 1000:.1f}ms/{closure_size / 1024:.0f}KB "
+              f"질의당 {closure_count_elapsed / len(targets) * 1e6:.1f}us{'' if same else ' (불일치)'}")
+
+    return all_same
+
+def run_scc_benchmark(node_counts=(10000, 100000)):
+    """SCC 단계의 CSR 구축/순환 탐지 시간을 재고, 도달 인덱스 및 긴 체인(재귀 깊이)으로 결과를 검증합니다.
+
+    노드 100000개까지는 간선 생성 이후 전체(find_components)가 SCC_TIME_LIMIT초 안에 끝나야 하며
+    (더 큰 그래프는 노드 수에 비례한 한도, SCC_REPEAT회 중 최소 시간), 한도를 넘으면 실패로 처리합니다.
+    """
+    import dependency_closure
+    import dependency_scc
+
+    all_ok = True
+    for node_count in node_counts:
+        project_structure = make_dependency_project(node_count)
+        nodes = list(project_structure['files'])
+        start_time = time.perf_counter()
+        edges = list(dependency_closure.file_dependency_edges(project_structure, include_calls=False))
+        edge_elapsed = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        offsets, targets = dependency_closure.build_csr(len(nodes), edges)
+        csr_elapsed = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        component, count = dependency_closure.strongly_connected_components(offsets, targets)
+        component_offsets, component_targets = dependency_closure.condense(offsets, targets, component, count)
+        levels = dependency_scc.topological_levels(component_offsets, component_targets)
+        scc_elapsed = time.perf_counter() - start_time
+
+        # 한도 비교는 다른 작업의 간섭을 줄이도록 SCC_REPEAT회 중 가장 빠른 시간으로 함
+        total_elapsed = float('inf')
+        for _ in range(SCC_REPEAT):
+            start_time = time.perf_counter()
+            result = dependency_scc.find_components(nodes, edges)
+            total_elapsed = min(total_elapsed, time.perf_counter() - start_time)
+
+        # 축약 DAG의 모든 간선은 레벨이 낮은 요소를 향해야 함
+        ok = all(levels[current] > levels[target] for current in range(count)
+                 for target in component_targets[component_offsets[current]:component_offsets[current + 1]])
+        limit = scc_time_limit(node_count)
+        fast = total_elapsed <= limit
+        print(f"노드 {node_count}개, 간선 {len(targets)}개: 간선 번호 변환 {edge_elapsed:.3f}초, CSR {csr_elapsed:.3f}초, "
+              f"SCC+축약+레벨 {scc_elapsed:.3f}초, 전체 {total_elapsed:.3f}초 ({SCC_REPEAT}회 중 최소, 한도 {limit:.1f}초, 요소 {count}개, "
+              f"순환 {len(result['cycles'])}개, 레벨 {result['levels']}개){'' if ok else ' (레벨 불일치)'}"
+              f"{'' if fast else ' (시간 초과)'}")
+        all_ok = all_ok and ok and fast
+
+    # 같은 요소 <=> 서로 도달 가능 (작은 그래프에서 영향 인덱스와 비교)
+    project_structure = make_dependency_project(2000, edges_per_file=2, seed=3)
+    nodes = list(project_structure['files'])
+    impact_index = dependency_closure.ImpactIndex.from_edges(
+        nodes, dependency_closure.file_dependency_edges(project_structure, include_calls=False))
+    result = dependency_scc.find_components(nodes, dependency_closure.file_dependency_edges(project_structure,
+                                                                                           include_calls=False))
+    for group in dependency_scc.cycle_members(result):
+        if not all(impact_index.depends_on(group[0], name) and impact_index.depends_on(name, group[0])
+                   for name in group[1:]):
+            all_ok = False
+    singles = [c['members'][0] for c in result['components'] if len(c['members']) == 1]
+    if any(impact_index.depends_on(name, other) and impact_index.depends_on(other, name)
+           for name, other in zip(singles, singles[1:])):
+        all_ok = False
+
+    # 재귀 한도보다 훨씬 긴 체인과 하나의 거대한 순환 (각각 노드 수에 비례한 한도 안에서 끝나야 함)
+    chain = [str(i) for i in range(200000)]
+    chain_edges = list(zip(range(len(chain) - 1), range(1, len(chain))))
+    limit = scc_time_limit(len(chain))
+    chain_elapsed = ring_elapsed = float('inf')
+    for _ in range(SCC_REPEAT):
+        start_time = time.perf_counter()
+        chain_result = dependency_scc.find_components(chain, chain_edges)
+        chain_elapsed = min(chain_elapsed, time.perf_counter() - start_time)
+        start_time = time.perf_counter()
+        ring_result = dependency_scc.find_components(chain, chain_edges + [(len(chain) - 1, 0)])
+        ring_elapsed = min(ring_elapsed, time.perf_counter() - start_time)
+    chain_ok = chain_result['levels'] == len(chain) and len(ring_result['cycles']) == 1
+    chain_fast = chain_elapsed <= limit and ring_elapsed <= limit
+    print(f"체인/순환 노드 {len(chain)}개: 체인 {chain_elapsed:.3f}초, 순환 {ring_elapsed:.3f}초 (각 한도 {limit:.1f}초)"
+          f"{'' if chain_ok else ' (불일치)'}{'' if chain_fast else ' (시간 초과)'}")
+
+    return all_ok and chain_ok and chain_fast
+
+def run_format_benchmark(json_paths, repeat=3):
+    """분석 JSON을 NDJSON/바이너리로 변환해 크기, 읽기 시간, 왕복 일치 여부를 비교합니다."""
+    import analysis_io
+
+    all_same = True
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for json_path in json_paths:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                project_structure = json.load(f)
+            print(f"{json_path} ({len(project_structure['files'])}개 파일)")
+
+            for label, extension in (("json", ".json"), ("ndjson", ".ndjson"), ("binary", ".jab")):
+                path = os.path.join(temp_dir, "analysis" + extension)
+                start_time = time.perf_counter()
+                analysis_io.write_analysis(project_structure, path)
+                write_elapsed = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                for _ in range(repeat):
+                    loaded = analysis_io.load_analysis(path)
+                read_elapsed = (time.perf_counter() - start_time) / repeat
+
+                same = loaded == project_structure
+                all_same = all_same and same
+                print(f"  {label:<7} {os.path.getsize(path) / 1024:>10.1f}KB  쓰기 {write_elapsed * 1000:>8.1f}ms  "
+                      f"읽기 {read_elapsed * 1000:>8.1f}ms{'' if same else '  (왕복 불일치)'}")
+
+    return all_same
+
+def measure_retained(build):
+    """build()가 반환한 객체가 붙잡고 있는 메모리(tracemalloc 기준)와 함께 결과를 반환합니다."""
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+def count_methods(files):
+    """파일 정보들의 클래스/인터페이스 메서드 수를 셉니다."""
+    return sum(len(type_info.get('methods', []))
+               for file_info in files.values()
+               for key in ('classes', 'interfaces')
+               for type_info in file_info.get(key, []))
+
+def run_model_benchmark(json_paths):
+    """분석 JSON을 dict 그대로 보관할 때와 슬롯 모델(FileInfo 등)로 보관할 때의 메모리를 비교합니다."""
+    from code_model import as_file_info
+
+    all_same = True
+    for json_path in json_paths:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+        dict_files, dict_size = measure_retained(lambda: json.loads(text)['files'])
+        start_time = time.perf_counter()
+        model_files, model_size = measure_retained(
+            lambda: {path: as_file_info(info) for path, info in json.loads(text)['files'].items()})
+        convert_elapsed = time.perf_counter() - start_time
+
+        same = model_files == dict_files
+        all_same = all_same and same
+        per_10k = 10000 / max(count_methods(dict_files), 1)
+        print(f"{json_path} ({len(dict_files)}개 파일, 메서드 {count_methods(dict_files)}개)")
+        print(f"  dict   {dict_size / 1024 / 1024:>8.2f}MB  (메서드 1만 개당 {dict_size * per_10k / 1024 / 1024:>7.2f}MB)")
+        print(f"  model  {model_size / 1024 / 1024:>8.2f}MB  (메서드 1만 개당 {model_size * per_10k / 1024 / 1024:>7.2f}MB)  "
+              f"로드+변환 {convert_elapsed * 1000:.1f}ms{'' if same else '  (변환 불일치)'}")
+        del dict_files, model_files
+
+    return all_same
+
+def iter_method_bodies(project_structure, reader=None):
+    """(파일 경로, 메서드 위치, 본문)을 순서대로 반환합니다 (reader가 있으면 범위에서 읽음)."""
+    for file_path, file_info in project_structure['files'].items():
+        for key in ('classes', 'interfaces'):
+            for type_index, type_info in enumerate(file_info.get(key, [])):
+                for method_index, method_info in enumerate(type_info.get('methods', [])):
+                    body = reader.body(file_path, file_info, method_info) if reader else method_info.get('body')
+                    yield file_path, (key, type_index, method_index), body
+
+def run_body_benchmark(project_path):
+    """메서드 본문 텍스트 저장과 범위(body_range) 저장의 결과 크기/메모리를 비교하고 지연 조회 결과를 검증합니다."""
+    from analysis_io import load_analysis
+    from code_model import as_file_info
+    from source_store import SourceStore, MethodBodyReader
+
+    def load_files(path):
+        return {file_path: as_file_info(file_info) for file_path, file_info in load_analysis(path)['files'].items()}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store_dir = os.path.join(temp_dir, "sources")
+        sizes = {}
+        projects = {}
+        for label, body_options in (("text", {}), ("range", {'body_ranges': True, 'source_store': store_dir})):
+            path = os.path.join(temp_dir, label + ".json")
+            java_ast_analyzer.analyze_java_project(project_path, path, max_workers=1, body_options=body_options)
+            files, retained = measure_retained(lambda: load_files(path))
+            sizes[label] = (os.path.getsize(path), retained)
+            projects[label] = {'project_path': project_path, 'files': files}
+
+        expected = list(iter_method_bodies(projects['text']))
+        all_same = True
+        # 프로젝트 소스(mmap)에서, 그리고 소스가 없을 때 저장소에서 읽은 본문이 텍스트 저장 결과와 같은지 확인
+        for label, source_path in (("project", project_path), ("store", os.path.join(temp_dir, "missing"))):
+            start_time = time.perf_counter()
+            with MethodBodyReader(source_path, SourceStore(store_dir)) as reader:
+                actual = list(iter_method_bodies(projects['range'], reader))
+            elapsed = time.perf_counter() - start_time
+            same = actual == expected
+            all_same = all_same and same
+            print(f"지연 조회 ({label}): 메서드 {len(actual)}개 {elapsed * 1000:.1f}ms ({'일치' if same else '불일치'})")
+
+    # 전체 결과 크기/메모리를 먼저 비교하고, 본문이 차지하던 부분과 범위 결과의 키별 크기를 따로 보여 줌
+    for label, (output_size, retained) in sizes.items():
+        print(f"{label:<6} 전체 결과 {output_size / 1024:>10.1f}KB  메모리 {retained / 1024 / 1024:>8.2f}MB")
+    print(f"범위 저장: 전체 결과 {sizes['text'][0] / max(sizes['range'][0], 1):.1f}배, "
+          f"메모리 {sizes['text'][1] / max(sizes['range'][1], 1):.1f}배 감소")
+
+    body_bytes = sum(len(json.dumps(body, ensure_ascii=False)) for _, _, body in expected)
+    range_bytes = sum(len(json.dumps(method_info.get('body_range')))
+                      for file_info in projects['range']['files'].values()
+                      for key in ('classes', 'interfaces')
+                      for type_info in file_info.get(key, [])
+                      for method_info in type_info.get('methods', []))
+    range_bytes += sum(len(json.dumps(file_info.get('source_hash'))) for file_info in projects['range']['files'].values())
+    # 범위 저장은 본문 부분만 줄이므로 전체 결과의 감소율은 텍스트 결과에서 본문이 차지하는 비중에 묶임
+    print(f"본문 부분: 텍스트 {body_bytes / 1024:.1f}KB (텍스트 결과의 {body_bytes * 100 / max(sizes['text'][0], 1):.1f}%) "
+          f"-> 범위 {range_bytes / 1024:.1f}KB ({body_bytes / max(range_bytes, 1):.1f}배)")
+
+    key_bytes = {}
+    for file_info in projects['range']['files'].values():
+        for key, value in file_info.items():
+            key_bytes[key] = key_bytes.get(key, 0) + len(json.dumps(value, ensure_ascii=False, default=model_default))
+    total_bytes = max(sum(key_bytes.values()), 1)
+    print("범위 결과 키별 크기 (공백 제외):")
+    for key, size in sorted(key_bytes.items(), key=lambda item: -item[1]):
+        print(f"  {key:<20} {size / 1024:>10.1f}KB  {size * 100 / total_bytes:>5.1f}%")
+    return all_same
+
+def measure_peak(run):
+    """run() 실행 중 최대 메모리(tracemalloc 기준)와 함께 결과를 반환합니다."""
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    result = run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+def run_stream_benchmark(json_paths):
+    """로더 방식 비교: json.load 후 순회 대비 AnalysisReader 스트림 순회의 최대 메모리/시간과 결과 일치 여부."""
+    from analysis_io import AnalysisReader
+
+    def load_whole(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            project_data = json.load(f)
+        return [len(file_path) for file_path in project_data['files']]
+
+    def load_streaming(path):
+        reader = AnalysisReader(path)
+        return [len(file_path) for file_path, _ in reader.files()]
+
+    all_same = True
+    for json_path in json_paths:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            project_data = json.load(f)
+        reader = AnalysisReader(json_path)
+        same = (reader.project_path == project_data['project_path'] and
+                [(file_path, file_info) for file_path, file_info in reader.files()] == list(project_data['files'].items()))
+        largest = max((len(json.dumps(file_info, ensure_ascii=False)) for file_info in project_data['files'].values()),
+                      default=0)
+        del project_data
+        all_same = all_same and same
+
+        print(f"{json_path} ({os.path.getsize(json_path) / 1024 / 1024:.1f}MB, 가장 큰 파일 레코드 {largest / 1024:.1f}KB)")
+        for label, run in (("json.load", load_whole), ("stream", load_streaming)):
+            start_time = time.perf_counter()
+            _, peak = measure_peak(lambda: run(json_path))
+            elapsed = time.perf_counter() - start_time
+            print(f"  {label:<10} 최대 메모리 {peak / 1024 / 1024:>8.2f}MB  {elapsed * 1000:>8.1f}ms")
+        if not same:
+            print("  (스트림 결과 불일치)")
+
+    return all_same
+
+# 자식 프로세스에서 분석을 실행하고 최대 RSS(KB)를 마지막 줄에 출력
+# (ru_maxrss는 exec 이전 부모 프로세스의 RSS까지 포함할 수 있어 리눅스에서는 VmHWM을 우선 사용)
+PIPELINE_CHILD = """
+import sys, resource
+import java_ast_analyzer
+java_ast_analyzer.analyze_java_project(sys.argv[1], sys.argv[2], max_workers=1,
+                                       memory_budget=float(sys.argv[3]) if len(sys.argv) > 3 else None)
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+try:
+    with open("/proc/self/status") as f:
+        max_rss = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    pass
+print("MAXRSS", max_rss)
+"""
+
+# 메모리 예산 분석의 최대 RSS 한도 = 빈 프로젝트 RSS + 예산 + 이 고정 여유(MB)
+# (상주 구조와 할당기/GC 여유를 합쳐 허용하는 값, 상주 구조 크기에 비례해 늘리지 않음)
+PIPELINE_RSS_ALLOWANCE = 32
+# 메모리 예산 분석이 출력하는 상주 구조 합계 (analysis_pipeline.resident_sizes)
+RESIDENT_PATTERN = re.compile(r"상주하는 구조 합계 ([0-9.]+)MB")
+
+def run_pipeline_benchmark(file_counts=(1000, 4000, 16000), memory_budget=64, methods_per_class=20):
+    """저장소 크기별로 일반 분석과 메모리 예산 분석의 최대 RSS/시간을 비교하고 출력이 같은지 확인합니다.
+
+    예산 분석의 최대 RSS가 빈 프로젝트 분석의 RSS + 예산 + PIPELINE_RSS_ALLOWANCE를 넘으면 실패로 봅니다.
+    한도는 파일 수와 상관없이 고정이므로, 상주 구조(심볼 항목/심볼 테이블/색인/메서드 인덱스/오프셋)가
+    파일 수에 따라 커지면 드러납니다 (상주 구조 열은 원인 확인용으로만 출력).
+    """
+    import filecmp
+    import subprocess
+
+    def run_child(project_path, output_path, *budget):
+        start_time = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", PIPELINE_CHILD, project_path, output_path, *budget],
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True,
+                                stdout=subprocess.PIPE, text=True)
+        max_rss = int(result.stdout.rsplit("MAXRSS", 1)[1])
+        match = RESIDENT_PATTERN.search(result.stdout)
+        resident = float(match.group(1)) if match else 0.0
+        return max_rss / 1024, time.perf_counter() - start_time, resident
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_path = os.path.join(temp_dir, "empty")
+        os.makedirs(project_path)
+        base_rss, _, _ = run_child(project_path, os.path.join(temp_dir, "empty.json"), str(memory_budget))
+    print(f"빈 프로젝트 RSS {base_rss:.1f}MB, 예산 {memory_budget}MB")
+
+    all_ok = True
+    print(f"{'파일 수':>8} {'소스 MB':>8} {'일반 RSS':>10} {'예산 RSS':>10} {'상주 구조':>10} {'한도':>10} "
+          f"{'일반 시간':>9} {'예산 시간':>9}")
+    for file_count in file_counts:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = os.path.join(temp_dir, "project")
+            source_bytes = synthetic_corpus.generate_project(project_path, file_count,
+                                                             methods_per_class=methods_per_class)
+            normal_path = os.path.join(temp_dir, "normal.json")
+            bounded_path = os.path.join(temp_dir, "bounded.json")
+            normal_rss, normal_time, _ = run_child(project_path, normal_path)
+            bounded_rss, bounded_time, resident = run_child(project_path, bounded_path, str(memory_budget))
+            same = filecmp.cmp(normal_path, bounded_path, shallow=False)
+        limit = base_rss + memory_budget + PIPELINE_RSS_ALLOWANCE
+        within = bounded_rss <= limit
+        all_ok = all_ok and same and within
+        print(f"{file_count:>8} {source_bytes / 1024 / 1024:>8.1f} {normal_rss:>8.1f}MB {bounded_rss:>8.1f}MB "
+              f"{resident:>8.1f}MB {limit:>8.1f}MB {normal_time:>8.1f}s {bounded_time:>8.1f}s" +
+              ("" if same else "  (출력 불일치)") + ("" if within else "  (한도 초과)"))
+
+    return all_ok
+
+def summarize_file_info(file_info):
+    """백엔드 간 비교용 파일 요약 (패키지, 임포트, 타입/상위 타입, 메서드 이름과 파라미터 수, 해석된 의존)."""
+    if 'error' in file_info:
+        return None
+
+    def methods(type_info):
+        return sorted((method_info['name'], len(method_info.get('parameters') or []))
+                      for method_info in type_info.get('methods', []))
+
+    return {
+        'package': file_info.get('package'),
+        'imports': list(file_info.get('imports', [])),
+        'classes': sorted((class_info['name'], class_info.get('extends'), tuple(class_info.get('implements', [])),
+                           tuple(methods(class_info))) for class_info in file_info.get('classes', [])),
+        'interfaces': sorted((interface_info['name'], tuple(interface_info.get('extends') or []),
+                              tuple(methods(interface_info))) for interface_info in file_info.get('interfaces', [])),
+        'dependencies': [(dependency['type'], dependency['target'], dependency.get('file'))
+                         for dependency in file_info.get('dependencies', [])]
+    }
+
+def run_backend_benchmark(project_path, backend_names=("tree-sitter", "javalang"), reference="tree-sitter",
+                          max_workers=1):
+    """같은 코퍼스를 백엔드별로 파싱해 처리량(파일/초, MB/초), 실패 수, 기준 백엔드 대비 결과 차이를 비교합니다."""
+    import io
+    import contextlib
+    import parser_backends
+    from relationship_analysis import analyze_relationships
+
+    source_bytes = sum(size for _, size in java_file_discovery.discover_java_files(project_path))
+    summaries = {}
+    results = []
+    for name in backend_names:
+        try:
+            backend = parser_backends.get_backend(name, engine='thread') if name == "tree-sitter" else \
+                parser_backends.get_backend(name)
+        except ImportError as e:
+            print(f"{name}: 백엔드를 불러오지 못했습니다 ({e})")
+            continue
+
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            project_structure = parser_backends.parse_project(project_path, backend, max_workers)
+        elapsed = time.perf_counter() - start_time
+        # 의존 해석 차이까지 보도록 공통 관계 분석 중 임포트/상속 의존만 적용 (시간에는 포함하지 않음)
+        analyze_relationships(project_structure)
+
+        files = project_structure['files']
+        failures = sum(1 for file_info in files.values() if 'error' in file_info)
+        summaries[name] = {file_path: summarize_file_info(file_info) for file_path, file_info in files.items()}
+        results.append((name, len(files), elapsed, failures))
+
+    if reference not in summaries:
+        reference = results[0][0] if results else None
+
+    print(f"{'백엔드':<14} {'파일/초':>9} {'MB/초':>8} {'실패':>5} {'차이':>5}  (기준: {reference})")
+    candidates = []
+    for name, file_count, elapsed, failures in results:
+        expected = summaries[reference]
+        diffs = [file_path for file_path, summary in summaries[name].items() if summary != expected.get(file_path)]
+        print(f"{name:<14} {file_count / max(elapsed, 1e-9):>9.1f} {source_bytes / 1024 / 1024 / max(elapsed, 1e-9):>8.2f} "
+              f"{failures:>5} {len(diffs):>5}")
+        for file_path in diffs[:5]:
+            summary = summaries[name][file_path]
+            expected_summary = expected.get(file_path)
+            if summary is None or expected_summary is None:
+                print(f"    {file_path}: 한쪽 파싱 실패")
+                continue
+            keys = [key for key in summary if summary[key] != expected_summary[key]]
+            print(f"    {file_path}: {', '.join(keys)} 다름")
+        if not failures and not diffs:
+            candidates.append((elapsed, name))
+
+    if candidates:
+        print(f"기준과 결과가 같은 가장 빠른 백엔드: {min(candidates)[1]}")
+    return bool(results)
+
+class LocalGraphDriver:
+    """graph load 단계 측정용 Neo4j 드라이버 대역 (쿼리를 실행하지 않고 쿼리 수와 UNWIND 행 수만 셈)."""
+
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+
+    def session(self, database=None):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def run(self, query, parameters=None):
+        self.queries += 1
+        self.rows += sum(len(value) for value in (parameters or {}).values() if isinstance(value, list))
+        return []
+
+    def close(self):
+        pass
+
+BENCHMARK_STAGES = ("discovery", "parse", "extract", "relationships", "serialize", "graph_load")
+
+def run_stage_benchmark(file_counts=(1000, 10000), corpus_options=None, extractor="walk", output_path=None):
+    """가상 프로젝트 크기별로 단계(탐색/파싱/추출/관계 분석/직렬화/그래프 적재)별 시간을 측정합니다.
+
+    output_path가 주어지면 크기별 결과를 한 줄에 하나씩 JSON으로 덧붙입니다 ("-"면 표준 출력).
+    """
+    import io
+    import datetime
+    import platform
+    import contextlib
+    from git_diff import get_head_revision
+    from analysis_io import write_output
+    from graph_upsert_v2 import CodeAnalyzerGraphLoader
+    from relationship_analysis import analyze_parsed_project
+
+    corpus_options = dict(corpus_options or {})
+    revision = get_head_revision(os.path.dirname(os.path.abspath(__file__)))
+    records = []
+
+    print(f"{'파일 수':>8} {'소스 MB':>8} " + " ".join(f"{stage:>13}" for stage in BENCHMARK_STAGES) + f" {'파일/초':>9}")
+    for file_count in file_counts:
+        stages = {}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = os.path.join(temp_dir, "project")
+            source_bytes = synthetic_corpus.generate_project(project_path, file_count, **corpus_options)
+
+            start_time = time.perf_counter()
+            discovered = java_file_discovery.discover_java_files(project_path)
+            stages["discovery"] = time.perf_counter() - start_time
+
+            # 파싱(파일 읽기 포함)과 추출은 파일마다 번갈아 실행하며 따로 합산 (트리는 바로 버림)
+            java_parser = java_ast_analyzer.create_parser()
+            files = {}
+            stages["parse"] = stages["extract"] = 0.0
+            for file_path, _ in discovered:
+                start_time = time.perf_counter()
+                with open(file_path, 'rb') as f:
+                    source_code = f.read()
+                tree = java_parser.parse(source_code)
+                parsed_time = time.perf_counter()
+                file_info = java_ast_analyzer.extract_file_info(tree, source_code, extractor)
+                file_info['path'] = file_path
+                stages["parse"] += parsed_time - start_time
+                stages["extract"] += time.perf_counter() - parsed_time
+                files[os.path.relpath(file_path, project_path)] = file_info
+            del tree
+            project_structure = {'project_path': project_path, 'files': files}
+
+            json_path = os.path.join(temp_dir, "analysis.json")
+            driver = LocalGraphDriver()
+            with contextlib.redirect_stdout(io.StringIO()):
+                start_time = time.perf_counter()
+                analyze_parsed_project(project_structure)
+                stages["relationships"] = time.perf_counter() - start_time
+
+                start_time = time.perf_counter()
+                write_output(project_structure, json_path)
+                stages["serialize"] = time.perf_counter() - start_time
+                del project_structure, files
+
+                start_time = time.perf_counter()
+                CodeAnalyzerGraphLoader(None, None, None, driver=driver).load_project(json_path)
+                stages["graph_load"] = time.perf_counter() - start_time
+            output_bytes = os.path.getsize(json_path)
+
+        total = sum(stages.values())
+        record = {
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'git_revision': revision,
+            'python': platform.python_version(),
+            'files': file_count,
+            'source_bytes': source_bytes,
+            'output_bytes': output_bytes,
+            'corpus': corpus_options,
+            'extractor': extractor,
+            'stages': {stage: round(stages[stage], 6) for stage in BENCHMARK_STAGES},
+            'total_seconds': round(total, 6),
+            'files_per_second': round(file_count / total, 2) if total else None,
+            'graph_queries': driver.queries,
+            'graph_rows': driver.rows
+        }
+        records.append(record)
+        print(f"{file_count:>8} {source_bytes / 1024 / 1024:>8.1f} " +
+              " ".join(f"{stages[stage]:>12.2f}s" for stage in BENCHMARK_STAGES) + f" {record['files_per_second']:>9.1f}")
+
+    if output_path == "-":
+        for record in records:
+            print(json.dumps(record, ensure_ascii=False))
+    elif output_path:
+        with open(output_path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        print(f"결과 {len(records)}건을 {output_path}에 추가했습니다.")
+    return records
+
+def run_thread_stress(project_path, thread_counts=(1, 4, 16), rounds=3):
+    """같은 코퍼스를 여러 스레드 수로 파싱하고 결과가 완전히 같은지 확인합니다."""
+    java_files = sorted(java_file_discovery.find_java_files(project_path))
+    print(f"총 {len(java_files)}개의 Java 파일로 스트레스 테스트를 실행합니다.")
+
+    # 기준 결과는 스레드 없이 순차 파싱
+    expected = json.dumps([java_ast_analyzer.process_java_file(file_path) for file_path in java_files],
+                          sort_keys=True, ensure_ascii=False, default=model_default)
+
+    mismatches = 0
+    for thread_count in thread_counts:
+        for round_index in range(rounds):
+            start_time = time.perf_counter()
+            results = java_ast_analyzer.parse_files_in_threads(java_files * 4, thread_count)
+            elapsed = time.perf_counter() - start_time
+
+            actual_runs = [results[i:i + len(java_files)] for i in range(0, len(results), len(java_files))]
+            ok = all(json.dumps(run, sort_keys=True, ensure_ascii=False, default=model_default) == expected
+                     for run in actual_runs)
+            if not ok:
+                mismatches += 1
+            print(f"스레드 {thread_count:>2}개, 라운드 {round_index+1}: {elapsed:.3f}초 ({'일치' if ok else '불일치'})")
+
+    return mismatches == 0
+
+def add_corpus_arguments(subparser):
+    """코퍼스 지정 인자(경로 또는 분석 JSON)를 추가합니다."""
+    subparser.add_argument("project_path", nargs="?", default=None, help="Java 프로젝트 경로")
+    subparser.add_argument("--from-json", default=None,
+                           help="프로젝트 대신 분석 JSON(a.json, tmp*.json)에서 소스를 복원해 사용")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Java 분석기 벤치마크 및 스트레스 테스트")
+    subparsers = arg_parser.add_subparsers(dest="command", required=True)
+
+    threads_parser = subparsers.add_parser("threads", help="스레드별 Parser 풀 스트레스 테스트 (1/4/16 스레드)")
+    add_corpus_arguments(threads_parser)
+    threads_parser.add_argument("--rounds", type=int, default=3, help="스레드 수별 반복 횟수")
+
+    input_parser = subparsers.add_parser("input", help="callback / bytes / mmap 파싱 입력 방식 비교")
+    add_corpus_arguments(input_parser)
+    input_parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+
+    extract_parser = subparsers.add_parser("extract", help="walk / cursor / query 추출 엔진 비교 (메서드 수백 개 클래스 포함)")
+    add_corpus_arguments(extract_parser)
+    extract_parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+
+    incremental_parser = subparsers.add_parser("incremental", help="전체 재파싱 대비 증분 갱신(tree.edit) 비교")
+    add_corpus_arguments(incremental_parser)
+    incremental_parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    incremental_parser.add_argument("--methods", type=int, default=1000, help="생성할 클래스의 메서드 수")
+
+    discover_parser = subparsers.add_parser("discover", help="os.walk 대비 scandir 파일 탐색 비교")
+    add_corpus_arguments(discover_parser)
+    discover_parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+
+    relationships_parser = subparsers.add_parser("relationships", help="임포트 해석: 선형 탐색 대비 심볼 인덱스 비교")
+    relationships_parser.add_argument("--files", type=int, nargs="+", default=[200, 500, 1000],
+                                      help="가상 프로젝트 파일 수 목록")
+
+    impact_parser = subparsers.add_parser("impact", help="영향 범위 질의: BFS 대비 축약 DAG 인덱스 비교")
+    impact_parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000],
+                               help="가상 프로젝트 파일 수 목록")
+    impact_parser.add_argument("--queries", type=int, default=200, help="질의 수")
+
+    scc_parser = subparsers.add_parser("scc", help="의존 순환(SCC) 탐지/축약 DAG 시간 측정 및 검증")
+    scc_parser.add_argument("--nodes", type=int, nargs="+", default=[10000, 100000], help="가상 그래프 노드 수 목록")
+
+    format_parser = subparsers.add_parser("format", help="분석 결과 형식(JSON/NDJSON/바이너리) 크기/읽기 시간 및 왕복 검증")
+    format_parser.add_argument("json_paths", nargs="*", default=["a.json", "tmp.json", "tmp5.json"],
+                               help="비교할 분석 JSON 파일 목록")
+    format_parser.add_argument("--repeat", type=int, default=3, help="읽기 반복 횟수")
+
+    bodies_parser = subparsers.add_parser("bodies", help="메서드 본문 텍스트 대비 범위(body_range) 저장 크기/메모리 비교 및 지연 조회 검증")
+    add_corpus_arguments(bodies_parser)
+
+    stream_parser = subparsers.add_parser("stream", help="로더 입력: json.load 대비 스트림 읽기 최대 메모리 비교 및 검증")
+    stream_parser.add_argument("json_paths", nargs="*", default=["a.json", "tmp.json", "tmp5.json"],
+                               help="비교할 분석 JSON 파일 목록")
+
+    model_parser = subparsers.add_parser("model", help="dict 대비 슬롯 모델(code_model) 메모리 비교 및 왕복 검증")
+    model_parser.add_argument("json_paths", nargs="*", default=["a.json", "tmp.json", "tmp5.json"],
+                              help="비교할 분석 JSON 파일 목록")
+
+    backends_parser = subparsers.add_parser("backends", help="파서 백엔드별 처리량(파일/초, MB/초)/실패 수/결과 차이 비교")
+    add_corpus_arguments(backends_parser)
+    backends_parser.add_argument("--backends", nargs="+", default=["tree-sitter", "javalang"],
+                                 help="비교할 백엔드 (tree-sitter, javalang, javalang-llm)")
+    backends_parser.add_argument("--reference", default="tree-sitter", help="결과 차이의 기준 백엔드")
+    backends_parser.add_argument("-j", "--jobs", type=int, default=1, help="백엔드별 파싱 워커 수")
+
+    stages_parser = subparsers.add_parser("stages", help="가상 프로젝트 크기별 단계(탐색/파싱/추출/관계/직렬화/그래프 적재) 시간 측정")
+    stages_parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000],
+                               help="생성할 Java 파일 수 목록 (예: 1000 10000 100000, 10만 개는 수 GB 메모리 필요)")
+    stages_parser.add_argument("--classes-per-file", type=int, default=1, help="파일당 클래스 수")
+    stages_parser.add_argument("--methods-per-class", type=int, default=10, help="클래스당 메서드 수")
+    stages_parser.add_argument("--body-size", type=int, default=5, help="메서드 본문 문장 수")
+    stages_parser.add_argument("--import-fanout", type=int, default=5, help="파일당 프로젝트 내부 임포트 수")
+    stages_parser.add_argument("--package-depth", type=int, default=3, help="패키지 깊이")
+    stages_parser.add_argument("--seed", type=int, default=0, help="코퍼스 생성 seed")
+    stages_parser.add_argument("--extractor", choices=java_ast_analyzer.EXTRACTORS, default="walk", help="추출 엔진")
+    stages_parser.add_argument("--output", default=None, metavar="RESULTS_JSONL",
+                               help="결과를 JSON 한 줄씩 덧붙일 파일 (-면 표준 출력)")
+
+    pipeline_parser = subparsers.add_parser("pipeline", help="저장소 크기별 일반 분석 대비 메모리 예산 분석의 최대 RSS 비교 및 출력 검증")
+    pipeline_parser.add_argument("--files", type=int, nargs="+", default=[1000, 4000, 16000],
+                                 help="생성할 Java 파일 수 목록")
+    pipeline_parser.add_argument("--methods", type=int, default=20, help="클래스당 메서드 수")
+    pipeline_parser.add_argument("--memory-budget", type=float, default=64, help="메모리 예산(MB)")
+
+    args = arg_parser.parse_args()
+    if args.command == "relationships":
+        if not run_relationship_benchmark(tuple(args.files)):
+            print("심볼 인덱스 결과가 기존 방식과 다릅니다.")
+            sys.exit(1)
+        sys.exit(0)
+    if args.command == "format":
+        if not run_format_benchmark(args.json_paths, args.repeat):
+            print("형식 변환 왕복 결과가 원본 JSON과 다릅니다.")
+            sys.exit(1)
+        sys.exit(0)
+    if args.command == "stream":
+        if not run_stream_benchmark(args.json_paths):
+            print("스트림으로 읽은 결과가 json.load 결과와 다릅니다.")
+            sys.exit(1)
+        sys.exit(0)
+    if args.command == "model":
+        if not run_model_benchmark(args.json_paths):
+            print("모델 변환 결과가 원본 JSON과 다릅니다.")
+            sys.exit(1)
+        sys.exit(0)
+    if args.command == "stages":
+        run_stage_benchmark(tuple(args.files), {
+            'classes_per_file': args.classes_per_file,
+            'methods_per_class': args.methods_per_class,
+            'body_size': args.body_size,
+            'import_fanout': args.import_fanout,
+            'package_depth': args.package_depth,
+            'seed': args.seed
+        }, args.extractor, args.output)
+        sys.exit(0)
+    if args.command == "pipeline":
+        if not run_pipeline_benchmark(tuple(args.files), args.memory_budget, args.methods):
+            print("메모리 예산 분석 결과가 일반 분석 결과와 다르거나 RSS가 한도를 넘었습니다.")
+            sys.exit(1)
+        sys.exit(0)
+    if args.command == "scc":
+        if not run_scc_benchmark(tuple(args.nodes)):
+            print("SCC 결과 검증에 실패했습니다.")
+            sys.exit(1)
+        sys.exit(0)
+    if args.command == "impact":
+        if not run_impact_benchmark(tuple(args.files), args.queries):
+            print("영향 인덱스 결과가 BFS와 다릅니다.")
+            sys.exit(1)
+        sys.exit(0)
+    if args.command in ("extract", "incremental") and not (args.project_path or args.from_json):
+        project_path = None
+    else:
+        project_path = resolve_corpus(args)
+
+    if args.command == "threads":
+        if not run_thread_stress(project_path, rounds=args.rounds):
+            print("스레드 수에 따라 파싱 결과가 달라졌습니다.")
+            sys.exit(1)
+        print("모든 스레드 구성에서 파싱 결과가 일치합니다.")
+    elif args.command == "input":
+        if not run_input_benchmark(project_path, repeat=args.repeat):
+            sys.exit(1)
+    elif args.command == "extract":
+        if not run_extract_benchmark(project_path, repeat=args.repeat):
+            print("추출 엔진 간 결과가 다릅니다.")
+            sys.exit(1)
+    elif args.command == "discover":
+        if not run_discovery_benchmark(project_path, repeat=args.repeat):
+            print("스레드 수에 따라 탐색 결과가 다릅니다.")
+            sys.exit(1)
+    elif args.command == "backends":
+        if not run_backend_benchmark(project_path, tuple(args.backends), args.reference, args.jobs):
+            print("사용할 수 있는 백엔드가 없습니다.")
+            sys.exit(1)
+    elif args.command == "bodies":
+        if not run_body_benchmark(project_path):
+            print("범위에서 읽은 메서드 본문이 텍스트 저장 결과와 다릅니다.")
+            sys.exit(1)
+    elif args.command == "incremental":
+        if not run_incremental_benchmark(project_path, method_count=args.methods, repeat=args.repeat):
+            print("증분 갱신 결과가 전체 파싱 결과와 다릅니다.")
+            sys.exit(1)
@@ -0,0 +1,441 @@
+from java_ast_analyzer import get_node_text, get_type_name, get_static_receiver_name
+
+# 메서드 단위 호출 그래프 (CALLS)
+# - 파일 단위: 파싱 워커에서 호출 지점과 수신자 타입을 추출 (file_info['calls'])
+# - 전역 단위: 모든 파일 분석 후 심볼 테이블로 호출 대상 메서드를 해석 (file_info['method_calls'])
+# - 호출 지점은 해석용 중간 결과라 해석 후 제거 (keep_call_sites=True일 때만 출력에 남김)
+# - 같은 이름의 오버로드는 인자 수(arity)로 구분
+
+# 수신자 타입 추론에 쓰는 지역 선언 노드
+LOCAL_DECLARATION_NODES = ('local_variable_declaration', 'enhanced_for_statement', 'resource')
+
+# 호출 지점을 찾는 타입 선언 노드 (중첩 타입 포함)
+TYPE_DECLARATION_NODES = ('class_declaration', 'interface_declaration', 'enum_declaration', 'record_declaration')
+
+# 필드처럼 수신자 타입을 제공하는 멤버 선언 (인터페이스 상수 포함)
+FIELD_DECLARATION_NODES = ('field_declaration', 'constant_declaration')
+
+# 상위 타입을 따라 올라가며 메서드를 찾을 최대 깊이
+MAX_SUPERTYPE_DEPTH = 16
+
+def _declared_type(type_node, value_node, source_code):
+    """선언 타입 이름을 반환합니다 (var 선언은 new 초기화식의 타입으로 추론)."""
+    type_name = get_type_name(type_node, source_code)
+    if type_name is None and value_node is not None and value_node.type == 'object_creation_expression':
+        type_name = get_type_name(value_node.child_by_field_name('type'), source_code)
+    return type_name
+
+def _add_declarations(node, source_code, variables):
+    """선언 노드 하나의 (변수 이름 -> 타입 이름)을 추가합니다."""
+    type_node = node.child_by_field_name('type')
+    if node.type == 'local_variable_declaration' or node.type in FIELD_DECLARATION_NODES:
+        for declarator in node.children_by_field_name('declarator'):
+            name_node = declarator.child_by_field_name('name')
+            type_name = _declared_type(type_node, declarator.child_by_field_name('value'), source_code)
+            if name_node is not None and type_name:
+                variables[get_node_text(name_node, source_code)] = type_name
+    else:
+        # enhanced_for_statement, resource, formal_parameter: type/name 필드를 직접 가짐
+        name_node = node.child_by_field_name('name')
+        type_name = _declared_type(type_node, node.child_by_field_name('value'), source_code)
+        if name_node is not None and type_name:
+            variables[get_node_text(name_node, source_code)] = type_name
+
+def iter_type_members(type_node):
+    """타입 선언 본문의 멤버 노드를 차례로 반환합니다 (enum은 상수 뒤 선언부의 멤버)."""
+    body = type_node.child_by_field_name('body')
+    if body is None:
+        return
+    for child in body.named_children:
+        if child.type == 'enum_body_declarations':
+            yield from child.named_children
+        else:
+            yield child
+
+def collect_field_types(class_node, source_code):
+    """클래스 필드의 (이름 -> 타입 이름)을 수집합니다."""
+    fields = {}
+    for child in iter_type_members(class_node):
+        if child.type in FIELD_DECLARATION_NODES:
+            _add_declarations(child, source_code, fields)
+    return fields
+
+def parameter_count(method_node):
+    """메서드/생성자 선언의 파라미터 수 (메서드 정보의 parameters와 같이 가변 인자는 제외)."""
+    parameters_node = method_node.child_by_field_name('parameters')
+    if parameters_node is None:
+        return 0
+    return sum(1 for child in parameters_node.named_children if child.type == 'formal_parameter')
+
+def argument_count(invocation_node):
+    """메서드 호출식의 인자 수."""
+    arguments_node = invocation_node.child_by_field_name('arguments')
+    return arguments_node.named_child_count if arguments_node is not None else 0
+
+def collect_parameter_types(method_node, source_code):
+    """메서드 파라미터의 (이름 -> 타입 이름)을 수집합니다."""
+    parameters = {}
+    parameters_node = method_node.child_by_field_name('parameters')
+    if parameters_node is None:
+        return parameters
+    for child in parameters_node.named_children:
+        if child.type == 'formal_parameter':
+            _add_declarations(child, source_code, parameters)
+    return parameters
+
+def _receiver(object_node, variables, fields, source_code):
+    """호출 수신자 식에서 (수신자 종류, 타입 이름)을 추론합니다 (추론할 수 없으면 None).
+
+    수신자가 없는 호출은 'implicit' (자기 타입/바깥 타입/정적 임포트 순으로 해석), this.m()은 'this'.
+    수신자가 없는 호출 중 파일 안의 둘러싼 타입이 직접 선언한 메서드는 추출 단계에서 'enclosing'으로 바꿉니다.
+    """
+    if object_node is None:
+        return 'implicit', None
+    if object_node.type == 'this':
+        return 'this', None
+    if object_node.type == 'super':
+        return 'super', None
+
+    if object_node.type == 'identifier':
+        name = get_node_text(object_node, source_code)
+        if name in variables:
+            return 'type', variables[name]
+        # 대문자로 시작하는 수신자는 정적 호출 (Util.run())
+        if name[:1].isupper():
+            return 'type', name
+        return None
+
+    if object_node.type == 'field_access':
+        owner = object_node.child_by_field_name('object')
+        field = object_node.child_by_field_name('field')
+        if owner is not None and owner.type == 'this' and field is not None:
+            type_name = fields.get(get_node_text(field, source_code))
+            return ('type', type_name) if type_name else None
+        type_name = get_static_receiver_name(object_node, source_code)
+        return ('type', type_name) if type_name else None
+
+    if object_node.type in ('object_creation_expression', 'cast_expression'):
+        type_name = get_type_name(object_node.child_by_field_name('type'), source_code)
+        return ('type', type_name) if type_name else None
+
+    if object_node.type == 'parenthesized_expression' and object_node.named_child_count == 1:
+        return _receiver(object_node.named_child(0), variables, fields, source_code)
+
+    return None
+
+def collect_method_calls(body_node, source_code, variables, fields):
+    """메서드 본문을 문서 순서대로 한 번 순회하며 (호출 메서드 이름, 인자 수, 수신자 종류, 수신자 타입)을 수집합니다.
+
+    variables는 지금까지 본 파라미터/지역 변수 선언으로 순회 중에 갱신됩니다.
+    """
+    calls = {}
+    if body_node is None:
+        return []
+
+    stack = [body_node]
+    while stack:
+        node = stack.pop()
+        node_type = node.type
+        if node_type in LOCAL_DECLARATION_NODES:
+            _add_declarations(node, source_code, variables)
+        elif node_type == 'method_invocation':
+            name_node = node.child_by_field_name('name')
+            receiver = _receiver(node.child_by_field_name('object'), variables, fields, source_code)
+            if name_node is not None and receiver is not None:
+                calls.setdefault((get_node_text(name_node, source_code), argument_count(node)) + receiver, None)
+
+        # 문서 순서 유지를 위해 자식을 역순으로 스택에 넣음
+        stack.extend(reversed(node.named_children))
+
+    return list(calls)
+
+def collect_declared_methods(class_node, source_code):
+    """타입이 직접 선언한 메서드의 (이름 -> 파라미터 수 집합)을 수집합니다."""
+    declared = {}
+    for child in iter_type_members(class_node):
+        if child.type == 'method_declaration':
+            name_node = child.child_by_field_name('name')
+            if name_node is not None:
+                declared.setdefault(get_node_text(name_node, source_code), set()).add(parameter_count(child))
+    return declared
+
+def select_arity(arities, arguments):
+    """선언된 파라미터 수 중 호출 인자 수에 맞는 것 (없으면 오버로드가 하나일 때만 그 수, 아니면 None)."""
+    if arguments in arities:
+        return arguments
+    return next(iter(arities)) if len(arities) == 1 else None
+
+def _enclosing_target(callee, arguments, enclosing):
+    """수신자 없는 호출을 안쪽부터 둘러싼 타입 중 메서드를 직접 선언한 타입으로 해석합니다 (없으면 None).
+
+    중첩 타입은 심볼 테이블에 없으므로 파일 안에서만 찾고, 중첩 타입의 상위 타입은 따라가지 않습니다.
+    """
+    for type_name, declared in enclosing:
+        if callee in declared:
+            return type_name, select_arity(declared[callee], arguments)
+    return None
+
+def extract_class_calls(class_node, source_code, outer_name=None, outer_fields=None, outer_types=()):
+    """타입 하나(중첩 타입 포함)의 메서드/생성자별 호출 지점 목록을 추출합니다.
+
+    중첩 타입의 class는 '바깥.안쪽' 이름이고, 바깥 타입의 필드도 수신자 타입 추론에 사용합니다.
+    중첩 타입 안의 수신자 없는 호출은 둘러싼 중첩 타입이 선언한 메서드면 'enclosing' 호출로 기록합니다
+    (receiver_type은 선언 타입의 '바깥.안쪽' 이름, target_arity는 선언 파라미터 수).
+    """
+    name_node = class_node.child_by_field_name('name')
+    if name_node is None or class_node.child_by_field_name('body') is None:
+        return []
+
+    simple_name = get_node_text(name_node, source_code)
+    class_name = f"{outer_name}.{simple_name}" if outer_name else simple_name
+    fields = dict(outer_fields or {})
+    fields.update(collect_field_types(class_node, source_code))
+    # 최상위 타입은 상위 타입까지 전역 인덱스로 해석하므로 중첩 타입만 파일 안에서 찾음
+    enclosing = (((class_name, collect_declared_methods(class_node, source_code)),) if outer_name else ()) + outer_types
+    calls = []
+
+    for member_node in iter_type_members(class_node):
+        if member_node.type in TYPE_DECLARATION_NODES:
+            calls.extend(extract_class_calls(member_node, source_code, class_name, fields, enclosing))
+            continue
+        if member_node.type == 'method_declaration':
+            method_name_node = member_node.child_by_field_name('name')
+            if method_name_node is None:
+                continue
+            method_name = get_node_text(method_name_node, source_code)
+        elif member_node.type == 'constructor_declaration':
+            method_name = simple_name
+        else:
+            continue
+
+        # 필드 < 파라미터 < 지역 변수 순으로 가려짐
+        variables = dict(fields)
+        variables.update(collect_parameter_types(member_node, source_code))
+        body_node = member_node.child_by_field_name('body')
+        for callee, arguments, receiver, receiver_type in collect_method_calls(body_node, source_code,
+                                                                               variables, fields):
+            call = {
+                'class': class_name,
+                'method': method_name,
+                'arity': parameter_count(member_node),
+                'callee': callee,
+                'arguments': arguments,
+                'receiver': receiver,
+                'receiver_type': receiver_type
+            }
+            if receiver == 'implicit':
+                target = _enclosing_target(callee, arguments, enclosing)
+            elif receiver == 'this' and outer_name:
+                target = _enclosing_target(callee, arguments, enclosing[:1])
+            else:
+                target = None
+            if target is not None:
+                call['receiver'] = 'enclosing'
+                call['receiver_type'], call['target_arity'] = target
+            calls.append(call)
+
+    return calls
+
+def extract_method_calls(tree, source_code):
+    """파일의 타입 선언(클래스/인터페이스/enum/record와 그 중첩 타입)에서 호출 지점 목록을 추출합니다 (파싱 워커에서 실행)."""
+    calls = []
+    for node in tree.root_node.children:
+        if node.type in TYPE_DECLARATION_NODES:
+            calls.extend(extract_class_calls(node, source_code))
+    return calls
+
+def method_arity(method_info):
+    """메서드 정보의 파라미터 수 (MethodSymbol은 arity, 그 외에는 parameters 길이)."""
+    arity = method_info.get('arity')
+    return len(method_info.get('parameters') or ()) if arity is None else arity
+
+def build_method_index(project_structure, symbol_table):
+    """타입 FQN별 선언 메서드 (이름 -> 파라미터 수 튜플)과 해석된 상위 타입 목록을 만듭니다.
+
+    대부분 이름마다 오버로드가 하나이므로 파라미터 수는 집합 대신 작은 튜플로 보관합니다.
+    """
+    methods = {}
+    supertypes = {}
+
+    for file_path, file_info in project_structure['files'].items():
+        if 'error' in file_info:
+            continue
+        scope = symbol_table.file_scope(file_info)
+        package = file_info.get('package') or ''
+
+        for key in ('classes', 'interfaces'):
+            for type_info in file_info.get(key, []):
+                fqn = f"{package}.{type_info['name']}" if package else type_info['name']
+                declared = methods[fqn] = {}
+                for method_info in type_info.get('methods', []):
+                    arities = declared.get(method_info['name'], ())
+                    arity = method_arity(method_info)
+                    if arity not in arities:
+                        declared[method_info['name']] = arities + (arity,)
+
+                if key == 'classes':
+                    parents = ([type_info['extends']] if type_info.get('extends') else []) + type_info.get('implements', [])
+                else:
+                    parents = type_info.get('extends', [])
+                resolved = (symbol_table.resolve(parent, scope) for parent in parents)
+                supertypes[fqn] = [declaration['fqn'] for declaration in resolved if declaration is not None]
+
+    return methods, supertypes
+
+def declaration_signature(file_info):
+    """호출 해석 결과에 영향을 주는 파일 선언 정보 (패키지, 타입 이름/수정자/상위 타입, 메서드 이름과 파라미터 수, 필드 이름).
+
+    증분 분석에서 이 값이 바뀌지 않았으면 호출 지점이 없는 이전 결과의 method_calls를 그대로 쓸 수 있습니다.
+    """
+    if 'error' in file_info:
+        return None
+    types = []
+    for key in ('classes', 'interfaces'):
+        for type_info in file_info.get(key, []):
+            extends = type_info.get('extends')
+            types.append((key, type_info['name'], tuple(type_info.get('modifiers') or ()),
+                          tuple(extends) if isinstance(extends, list) else extends,
+                          tuple(type_info.get('implements', [])),
+                          tuple((method_info['name'], method_arity(method_info))
+                                for method_info in type_info.get('methods', [])),
+                          tuple(field_info['name'] for field_info in type_info.get('fields', []))))
+    return file_info.get('package') or '', tuple(types)
+
+def _declared_members(file_info):
+    """파일의 타입 FQN -> ((종류, 수정자, 상위 타입), 메서드 (이름, 파라미터 수) 집합, 필드 이름 집합)."""
+    signature = declaration_signature(file_info) if file_info is not None else None
+    if signature is None:
+        return {}
+    package, types = signature
+    return {(f"{package}.{name}" if package else name): ((key, modifiers, extends, implements), set(methods), set(fields))
+            for key, name, modifiers, extends, implements, methods, fields in types}
+
+def changed_call_members(old_files, new_files, file_paths):
+    """파일들의 선언 변경이 호출 해석에 주는 영향을 (바뀐 멤버 이름 집합, 구조 변경 여부)로 반환합니다.
+
+    메서드/필드만 추가/삭제/파라미터 수 변경된 경우 호출 이름이 바뀐 멤버 이름인 호출만 해석이 달라질 수 있습니다.
+    타입 추가/삭제, 수정자/상위 타입 변경은 구조 변경으로 보고 모든 호출을 다시 해석해야 합니다.
+    """
+    names = set()
+    structural = False
+    for file_path in file_paths:
+        old_types = _declared_members(old_files.get(file_path))
+        new_types = _declared_members(new_files.get(file_path))
+        if old_types.keys() != new_types.keys():
+            structural = True
+        for fqn in old_types.keys() & new_types.keys():
+            old_header, old_methods, old_fields = old_types[fqn]
+            new_header, new_methods, new_fields = new_types[fqn]
+            if old_header != new_header:
+                structural = True
+            names.update(name for name, _ in old_methods ^ new_methods)
+            names.update(old_fields ^ new_fields)
+    return names, structural
+
+def calls_use_names(calls, names):
+    """호출 지점 중 호출 이름이 names에 있는 것이 있는지 확인합니다."""
+    return any(call['callee'] in names for call in calls)
+
+def find_declaring_type(type_fqn, method_name, methods, supertypes, arity=None):
+    """타입과 그 상위 타입을 너비 우선으로 따라가며 메서드를 선언한 타입 FQN을 찾습니다.
+
+    arity가 주어지면 파라미터 수가 같은 오버로드를 선언한 타입만 찾습니다.
+    """
+    queue = [type_fqn]
+    seen = {type_fqn}
+    for _ in range(MAX_SUPERTYPE_DEPTH):
+        next_queue = []
+        for fqn in queue:
+            arities = methods.get(fqn, {}).get(method_name)
+            if arities and (arity is None or arity in arities):
+                return fqn
+            for parent in supertypes.get(fqn, []):
+                if parent not in seen:
+                    seen.add(parent)
+                    next_queue.append(parent)
+        if not next_queue:
+            return None
+        queue = next_queue
+    return None
+
+def resolve_call_target(start_types, method_name, arity, methods, supertypes):
+    """시작 타입들에서 호출 대상의 (선언 타입 FQN, 파라미터 수)를 찾습니다 (없으면 None).
+
+    인자 수가 같은 오버로드를 먼저 찾고, 없으면(가변 인자 등) 이름만으로 찾습니다.
+    이름만으로 찾은 경우 선언된 오버로드가 하나일 때만 파라미터 수를 기록합니다.
+    """
+    for start_type in start_types:
+        target_fqn = find_declaring_type(start_type, method_name, methods, supertypes, arity)
+        if target_fqn is not None:
+            return target_fqn, arity
+    for start_type in start_types:
+        target_fqn = find_declaring_type(start_type, method_name, methods, supertypes)
+        if target_fqn is not None:
+            return target_fqn, select_arity(methods[target_fqn][method_name], arity)
+    return None
+
+def _enclosing_types(caller_fqn, package):
+    """호출자 타입과 그 바깥 타입 FQN 목록 (중첩 타입은 안쪽부터)."""
+    prefix = f"{package}." if package else ''
+    names = caller_fqn[len(prefix):].split('.')
+    return [prefix + '.'.join(names[:depth]) for depth in range(len(names), 0, -1)]
+
+def analyze_method_calls(project_structure, symbol_table, method_index=None, keep_call_sites=False):
+    """모든 파일의 호출 지점을 호출자 메서드 -> 피호출 메서드 간선(method_calls)으로 해석합니다."""
+    method_index = method_index or build_method_index(project_structure, symbol_table)
+
+    for file_path, file_info in project_structure['files'].items():
+        if 'error' in file_info or 'calls' not in file_info:
+            continue
+        analyze_file_method_calls(file_info, symbol_table, method_index, keep_call_sites)
+
+def analyze_file_method_calls(file_info, symbol_table, method_index, keep_call_sites=False):
+    """파일 하나의 호출 지점을 build_method_index 결과로 해석해 method_calls를 채웁니다.
+
+    keep_call_sites가 아니면 해석이 끝난 호출 지점(calls)은 파일 정보에서 제거합니다.
+    """
+    methods, supertypes = method_index
+    scope = symbol_table.file_scope(file_info)
+    package = file_info.get('package') or ''
+    method_calls = {}
+
+    for call in file_info['calls']:
+        caller_fqn = f"{package}.{call['class']}" if package else call['class']
+        callee = call['callee']
+
+        if call['receiver'] == 'enclosing':
+            # 추출 단계에서 파일 안의 중첩 타입으로 해석된 호출
+            target = (f"{package}.{call['receiver_type']}" if package else call['receiver_type'], call['target_arity'])
+        elif call['receiver'] == 'implicit':
+            # 자기 타입(상위 타입 포함) -> 바깥 타입 -> 정적 임포트한 메서드 순
+            start_types = _enclosing_types(caller_fqn, package)
+            target = resolve_call_target(start_types, callee, call['arguments'], methods, supertypes)
+            if target is None:
+                owner = symbol_table.resolve_static_member(callee, scope)
+                if owner is not None:
+                    target = resolve_call_target([owner['fqn']], callee, call['arguments'], methods, supertypes)
+        else:
+            if call['receiver'] == 'this':
+                start_types = [caller_fqn]
+            elif call['receiver'] == 'super':
+                start_types = supertypes.get(caller_fqn, [])
+            else:
+                declaration = symbol_table.resolve(call['receiver_type'], scope)
+                start_types = [declaration['fqn']] if declaration is not None else []
+            target = resolve_call_target(start_types, callee, call['arguments'], methods, supertypes)
+
+        if target is not None:
+            target_fqn, target_arity = target
+            method_calls.setdefault((caller_fqn, call['method'], call['arity'], target_fqn, callee, target_arity), None)
+
+    file_info['method_calls'] = [{
+        'from_class': from_class,
+        'from_method': from_method,
+        'from_arity': from_arity,
+        'to_class': to_class,
+        'to_method': to_method,
+        'to_arity': to_arity,
+        'to_file': symbol_table.resolve_import(to_class)['file']
+    } for from_class, from_method, from_arity, to_class, to_method, to_arity in method_calls]
+    if not keep_call_sites:
+        file_info.pop('calls', None)
@@ -0,0 +1,152 @@
+# 분석기/로더가 공유하는 파일/타입/메서드/필드/파라미터/의존 관계 모델
+# - 키마다 dict를 두지 않도록 __slots__ 클래스로 저장 (없는 키는 슬롯을 비워 둠)
+# - 기존 dict 기반 코드가 그대로 동작하도록 get/[]/in/items()를 지원
+# - to_dict()/from_dict()로 기존 JSON 형식과 키 순서를 그대로 유지
+
+_MISSING = object()
+
+class Record:
+    """슬롯 기반 레코드의 공통 부분 (KEYS 순서가 JSON 키 순서, NESTED는 하위 레코드 목록 키)."""
+
+    __slots__ = ('extra',)
+    KEYS = ()
+    NESTED = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._key_set = frozenset(cls.KEYS)
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """dict(또는 같은 종류의 레코드)에서 레코드를 만듭니다."""
+        if isinstance(data, cls):
+            return data
+        record = cls.__new__(cls)
+        for key, value in data.items():
+            record[key] = value
+        return record
+
+    def to_dict(self):
+        """기존 JSON 형식과 같은 키 순서의 dict로 변환합니다."""
+        data = {}
+        for key in self.KEYS:
+            value = getattr(self, key, _MISSING)
+            if value is _MISSING:
+                continue
+            if key in self.NESTED and value is not None:
+                value = [item.to_dict() if isinstance(item, Record) else item for item in value]
+            data[key] = value
+        extra = getattr(self, 'extra', None)
+        if extra:
+            data.update(extra)
+        return data
+
+    def get(self, key, default=None):
+        if key in self._key_set:
+            return getattr(self, key, default)
+        extra = getattr(self, 'extra', None)
+        return default if extra is None else extra.get(key, default)
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        nested = self.NESTED.get(key)
+        if nested is not None and value is not None:
+            value = [nested.from_dict(item) if isinstance(item, dict) else item for item in value]
+        if key in self._key_set:
+            setattr(self, key, value)
+            return
+        extra = getattr(self, 'extra', None)
+        if extra is None:
+            extra = self.extra = {}
+        extra[key] = value
+
+    def pop(self, key, default=None):
+        """키를 제거하고 값을 반환합니다 (없으면 default)."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        if key in self._key_set:
+            delattr(self, key)
+        else:
+            del self.extra[key]
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self):
+        keys = [key for key in self.KEYS if hasattr(self, key)]
+        keys.extend(getattr(self, 'extra', None) or ())
+        return keys
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+class ParamInfo(Record):
+    """메서드 파라미터."""
+    KEYS = ('name', 'type')
+    __slots__ = KEYS
+
+class FieldInfo(Record):
+    """클래스 필드."""
+    KEYS = ('name', 'type')
+    __slots__ = KEYS
+
+class MethodInfo(Record):
+    """메서드 (documentation/description은 javalang 분석기 결과에만, body_range는 본문 대신 범위만 기록할 때만 있음)."""
+    KEYS = ('name', 'return_type', 'parameters', 'documentation', 'description', 'body', 'body_range',
+            'referenced_objects', 'references')
+    __slots__ = KEYS
+    NESTED = {'parameters': ParamInfo}
+
+class MethodSymbol(Record):
+    """관계 분석용 메서드 요약 (메모리 예산 분석의 심볼 항목에서 파라미터 목록 대신 이름과 파라미터 수만 보관)."""
+    KEYS = ('name', 'arity')
+    __slots__ = KEYS
+
+class TypeInfo(Record):
+    """클래스/인터페이스 (인터페이스의 extends는 목록, implements/fields 없음, modifiers는 애너테이션 제외 수정자)."""
+    KEYS = ('name', 'modifiers', 'extends', 'implements', 'fields', 'methods')
+    __slots__ = KEYS
+    NESTED = {'fields': FieldInfo, 'methods': MethodInfo}
+
+class Dependency(Record):
+    """파일 간 임포트/상속/구현 의존 (file은 프로젝트 내부 대상일 때만 있음)."""
+    KEYS = ('type', 'target', 'file')
+    __slots__ = KEYS
+
+class FileInfo(Record):
+    """파일 하나의 분석 결과 (파싱 실패 파일은 path와 error만 있음)."""
+    KEYS = ('package', 'imports', 'classes', 'interfaces', 'object_references', 'calls', 'source_hash', 'path',
+            'error', 'dependencies', 'method_calls')
+    __slots__ = KEYS
+    NESTED = {'classes': TypeInfo, 'interfaces': TypeInfo, 'dependencies': Dependency}
+
+def as_file_info(file_info):
+    """dict 파일 정보를 FileInfo로 바꿉니다 (이미 FileInfo면 그대로)."""
+    return FileInfo.from_dict(file_info)
+
+def model_default(value):
+    """json.dump(s)의 default 훅: 레코드를 기존 형식의 dict로 변환합니다."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
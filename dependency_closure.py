@@ -0,0 +1,453 @@
+import json
+import struct
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, chain, groupby, islice, repeat
+from operator import add, mul, sub
+
+from symbol_table import ProjectSymbolTable
+
+# 분석 결과의 직접 의존 관계(파일/클래스)로 전이적 의존/영향 범위를 미리 계산하는 단계
+# - 노드는 목록 위치(정수 번호)로 다루고, 그래프는 번호 쌍으로 만든 CSR 배열(offsets, targets)로 저장
+# - 결과에는 강결합 요소(SCC)로 축약한 DAG의 CSR만 저장하고 도달 집합은 질의할 때 축약 DAG를 따라가며 구함
+# - 요소별 도달 비트셋(요소 수의 제곱 크기)은 선택적으로 별도 바이너리 파일에만 저장
+
+# 도달 비트셋 파일 매직 바이트
+CLOSURE_MAGIC = b'JICL\x01'
+
+def build_csr(node_count, edges):
+    """노드 수와 (출발, 도착) 노드 번호 쌍으로 CSR 인접 배열 (offsets, targets)를 만듭니다 (중복/자기 간선 제외).
+
+    간선을 출발 * 노드 수 + 도착 정수 키로 한 번 정렬하므로 노드별 후속 노드는 번호순이고,
+    간선이 출발 노드별로 모여 있으면 정렬은 거의 선형입니다.
+    """
+    keys = [source * node_count + target for source, target in edges if source != target]
+    keys.sort()
+    return _csr_from_keys(node_count, [key for key, _ in groupby(keys)])
+
+def _csr_from_keys(node_count, keys):
+    """정렬/중복 제거된 간선 키(출발 * 노드 수 + 도착)로 CSR을 만듭니다 (노드별 시작 위치는 이분 탐색)."""
+    if not node_count:
+        return array('l', [0]), array('l')
+    targets = array('l', [key % node_count for key in keys])
+    offsets = array('l', map(bisect_left, repeat(keys, node_count + 1),
+                             range(0, (node_count + 1) * node_count, node_count)))
+    return offsets, targets
+
+def strongly_connected_components(offsets, targets):
+    """반복형 Tarjan 알고리즘으로 (노드별 요소 번호, 요소 수)를 반환합니다 (재귀 없음).
+
+    요소 번호는 역위상 순서입니다: 간선 a -> b가 서로 다른 요소를 잇는다면 component[a] > component[b].
+    요소가 정해진 노드의 방문 순서는 노드 수(어떤 low보다 큰 값)로 바꿔 스택 소속 여부를 따로 두지 않습니다.
+    """
+    node_count = len(offsets) - 1
+    # 인덱스 접근이 잦은 작업 배열은 list로 변환 (array보다 원소 읽기/쓰기가 빠름)
+    offsets = offsets.tolist()
+    targets = targets.tolist()
+    order = [-1] * node_count
+    low = [0] * node_count
+    component = [-1] * node_count
+    # 노드별로 다음에 볼 간선 위치와 스택 위치 (작업 스택에는 노드 번호만 쌓음)
+    next_edge = offsets[:-1]
+    position = [0] * node_count
+    stack = []
+    count = 0
+    counter = 0
+
+    for root in range(node_count):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        work = [root]
+
+        while work:
+            node = work[-1]
+            edge = next_edge[node]
+            end = offsets[node + 1]
+            node_low = low[node]
+            while edge < end:
+                successor = targets[edge]
+                edge += 1
+                successor_order = order[successor]
+                if successor_order == -1:
+                    next_edge[node] = edge
+                    low[node] = node_low
+                    order[successor] = low[successor] = counter
+                    counter += 1
+                    position[successor] = len(stack)
+                    stack.append(successor)
+                    work.append(successor)
+                    break
+                if successor_order < node_low:
+                    node_low = successor_order
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1]
+                    if node_low < low[parent]:
+                        low[parent] = node_low
+                if node_low == order[node]:
+                    start = position[node]
+                    for member in stack[start:]:
+                        component[member] = count
+                        order[member] = node_count
+                    del stack[start:]
+                    count += 1
+                else:
+                    low[node] = node_low
+
+    return array('l', component), count
+
+def condense(offsets, targets, component, count):
+    """요소 간 간선(중복 제거)을 요소 간 CSR (offsets, targets)로 반환합니다 (후속 요소는 번호순)."""
+    # 간선마다 (출발 요소, 도착 요소) 키를 C 수준 map/set으로 만들어 중복을 먼저 없애고 (정렬할 키가 요소 간 간선 수로 줄어듦),
+    # 같은 요소 안의 간선(키가 count + 1의 배수)은 제외
+    source_components = chain.from_iterable(map(repeat, component, map(sub, islice(offsets, 1, None), offsets)))
+    keys = sorted(set(map(add, map(mul, source_components, repeat(count)), map(component.__getitem__, targets))))
+    return _csr_from_keys(count, [key for key in keys if key % (count + 1)])
+
+def condensed_csr(offsets, targets):
+    """노드 CSR을 SCC로 축약해 (노드별 요소 번호, 요소 간 CSR offsets, targets)를 반환합니다."""
+    component, count = strongly_connected_components(offsets, targets)
+    return (component,) + condense(offsets, targets, component, count)
+
+def reverse_csr(offsets, targets):
+    """CSR 간선의 방향을 뒤집은 CSR (offsets, targets)를 만듭니다."""
+    node_count = len(offsets) - 1
+    counts = array('l', [0]) * (node_count + 1)
+    for target in targets:
+        counts[target + 1] += 1
+    reverse_offsets = array('l', accumulate(counts))
+    position = array('l', reverse_offsets)
+    reverse_targets = array('l', [0]) * len(targets)
+    for source in range(node_count):
+        for target in targets[offsets[source]:offsets[source + 1]]:
+            reverse_targets[position[target]] = source
+            position[target] += 1
+    return reverse_offsets, reverse_targets
+
+def compute_closure(offsets, targets):
+    """축약 DAG(요소 간 CSR)의 요소별 정방향(의존)/역방향(영향) 도달 비트셋을 계산합니다.
+
+    비트 위치는 노드가 아닌 요소 번호이고 요소 자신도 포함합니다. 크기가 요소 수의 제곱에 비례하므로
+    질의에는 쓰지 않고 write_closure로 별도 바이너리 파일에 저장할 때만 계산합니다.
+    """
+    count = len(offsets) - 1
+    # 역위상 번호이므로 번호가 작은 요소(후속)부터 정방향 도달 집합이 확정됨
+    forward = [0] * count
+    for current in range(count):
+        bits = 1 << current
+        for successor in targets[offsets[current]:offsets[current + 1]]:
+            bits |= forward[successor]
+        forward[current] = bits
+
+    # 역방향은 번호가 큰 요소(선행)부터 전파
+    reverse = [1 << current for current in range(count)]
+    for current in range(count - 1, -1, -1):
+        bits = reverse[current]
+        for successor in targets[offsets[current]:offsets[current + 1]]:
+            reverse[successor] |= bits
+
+    return forward, reverse
+
+def bit_indexes(bits):
+    """비트셋에서 켜진 비트 위치 목록을 반환합니다."""
+    digits = bin(bits)[:1:-1]
+    indexes = []
+    position = digits.find('1')
+    while position != -1:
+        indexes.append(position)
+        position = digits.find('1', position + 1)
+    return indexes
+
+class ImpactIndex:
+    """노드 이름 -> 전이적 의존 대상 / 영향 받는 노드를 축약 DAG 탐색으로 답하는 인덱스.
+
+    저장하는 것은 SCC 축약 DAG의 CSR(요소 간 offsets/targets)과 노드별 요소 번호뿐이며(노드 + 간선 수에 비례),
+    도달 집합은 질의할 때 축약 DAG를 따라가며 구합니다. write_closure로 저장한 도달 비트셋을
+    load_closure로 불러오면 탐색 대신 비트셋을 사용합니다.
+    """
+
+    def __init__(self, nodes, component, offsets, targets):
+        self.nodes = list(nodes)
+        self.index = {name: i for i, name in enumerate(self.nodes)}
+        self.component = component
+        self.offsets = offsets
+        self.targets = targets
+        self._reverse = None
+        self._members = None
+        self._closure = None
+
+    @classmethod
+    def from_edges(cls, nodes, edges):
+        """노드 목록과 (출발, 도착) 노드 번호(목록 위치) 쌍으로 인덱스를 만듭니다."""
+        offsets, targets = build_csr(len(nodes), edges)
+        return cls(nodes, *condensed_csr(offsets, targets))
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict()로 저장한 인덱스를 불러옵니다 (노드 CSR만 있는 이전 형식은 다시 축약)."""
+        if 'component_offsets' not in data:
+            return cls(data['nodes'], *condensed_csr(array('l', data['offsets']), array('l', data['targets'])))
+        return cls(data['nodes'], array('l', data['components']),
+                   array('l', data['component_offsets']), array('l', data['component_targets']))
+
+    def to_dict(self):
+        """JSON으로 저장할 수 있는 dict로 변환합니다 (노드별 요소 번호와 축약 DAG CSR)."""
+        return {
+            'nodes': self.nodes,
+            'components': list(self.component),
+            'component_offsets': list(self.offsets),
+            'component_targets': list(self.targets)
+        }
+
+    def members(self):
+        """요소별 멤버 노드를 (offsets, 노드 번호 배열) CSR로 반환합니다 (처음 사용할 때 한 번 생성)."""
+        if self._members is None:
+            count = len(self.offsets) - 1
+            counts = array('l', [0]) * (count + 1)
+            for current in self.component:
+                counts[current + 1] += 1
+            member_offsets = array('l', accumulate(counts))
+            position = array('l', member_offsets)
+            member_nodes = array('l', [0]) * len(self.component)
+            for node, current in enumerate(self.component):
+                member_nodes[position[current]] = node
+                position[current] += 1
+            self._members = (member_offsets, member_nodes)
+        return self._members
+
+    def closure(self):
+        """요소별 (forward, reverse) 도달 비트셋을 반환합니다 (불러오지 않았으면 계산)."""
+        if self._closure is None:
+            self._closure = compute_closure(self.offsets, self.targets)
+        return self._closure
+
+    def _reached(self, node, direction):
+        """노드의 요소에서 정방향/역방향으로 도달하는 요소 번호 목록 (자기 요소 포함)."""
+        start = self.component[node]
+        if self._closure is not None:
+            forward, reverse = self._closure
+            return bit_indexes((forward if direction == 'forward' else reverse)[start])
+
+        if direction == 'forward':
+            offsets, targets = self.offsets, self.targets
+        else:
+            if self._reverse is None:
+                self._reverse = reverse_csr(self.offsets, self.targets)
+            offsets, targets = self._reverse
+        seen = {start}
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            for successor in targets[offsets[current]:offsets[current + 1]]:
+                if successor not in seen:
+                    seen.add(successor)
+                    stack.append(successor)
+        return seen
+
+    def _reached_nodes(self, name, direction):
+        """도달하는 노드 번호 목록 (자기 자신은 순환에 속하더라도 제외, 없는 이름이면 None)."""
+        node = self.index.get(name)
+        if node is None:
+            return None
+        member_offsets, member_nodes = self.members()
+        nodes = []
+        for current in self._reached(node, direction):
+            nodes.extend(member_nodes[member_offsets[current]:member_offsets[current + 1]])
+        nodes.remove(node)
+        return nodes
+
+    def depends_on(self, name, target):
+        """name이 target에 전이적으로 의존하는지 확인합니다."""
+        node = self.index.get(name)
+        target_node = self.index.get(target)
+        if node is None or target_node is None or node == target_node:
+            return False
+        if self._closure is not None:
+            return bool(self._closure[0][self.component[node]] >> self.component[target_node] & 1)
+        return self.component[target_node] in self._reached(node, 'forward')
+
+    def dependencies(self, name):
+        """name이 전이적으로 의존하는 노드 이름 목록을 반환합니다."""
+        return [self.nodes[i] for i in sorted(self._reached_nodes(name, 'forward') or ())]
+
+    def impacted(self, name):
+        """name이 바뀌면 전이적으로 영향을 받는 (name에 의존하는) 노드 이름 목록을 반환합니다."""
+        return [self.nodes[i] for i in sorted(self._reached_nodes(name, 'reverse') or ())]
+
+    def impact_count(self, name):
+        """영향을 받는 노드 수를 반환합니다."""
+        node = self.index.get(name)
+        if node is None:
+            return 0
+        member_offsets, _ = self.members()
+        return sum(member_offsets[current + 1] - member_offsets[current]
+                   for current in self._reached(node, 'reverse')) - 1
+
+def write_closure(indexes, path):
+    """수준별 요소 도달 비트셋을 바이너리 파일로 저장합니다 (분석 결과 JSON에는 넣지 않음).
+
+    형식: CLOSURE_MAGIC, 수준 수(u32), 수준마다
+    [이름 길이(u32) + UTF-8 이름, 요소 수(u32), 요소마다 forward/reverse 비트셋(바이트 길이 u32 + 리틀 엔디언 바이트)]
+    """
+    with open(path, 'wb') as f:
+        f.write(CLOSURE_MAGIC)
+        f.write(struct.pack('<I', len(indexes)))
+        for level, impact_index in indexes.items():
+            name = level.encode('utf-8')
+            forward, reverse = impact_index.closure()
+            f.write(struct.pack('<I', len(name)))
+            f.write(name)
+            f.write(struct.pack('<I', len(forward)))
+            for bits in (value for pair in zip(forward, reverse) for value in pair):
+                data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+                f.write(struct.pack('<I', len(data)))
+                f.write(data)
+
+def load_closure(indexes, path):
+    """write_closure로 저장한 도달 비트셋을 인덱스들에 불러옵니다 (요소 수가 다르면 ValueError)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:len(CLOSURE_MAGIC)] != CLOSURE_MAGIC:
+        raise ValueError("도달 비트셋 파일 형식이 아닙니다.")
+    offset = len(CLOSURE_MAGIC)
+
+    def read_bytes():
+        nonlocal offset
+        (length,) = struct.unpack_from('<I', data, offset)
+        offset += 4 + length
+        return data[offset - length:offset]
+
+    (level_count,) = struct.unpack_from('<I', data, offset)
+    offset += 4
+    for _ in range(level_count):
+        level = read_bytes().decode('utf-8')
+        (count,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        bitsets = [int.from_bytes(read_bytes(), 'little') for _ in range(2 * count)]
+        impact_index = indexes.get(level)
+        if impact_index is None:
+            continue
+        if count != len(impact_index.offsets) - 1:
+            raise ValueError(f"{level} 인덱스와 도달 비트셋의 요소 수가 다릅니다.")
+        impact_index._closure = (bitsets[0::2], bitsets[1::2])
+    return indexes
+
+def file_dependency_edges(project_structure, include_calls=True):
+    """파일 간 직접 의존 간선 (임포트/상속/구현, 객체 참조, 메서드 호출)을 파일 번호 쌍으로 반환합니다.
+
+    파일 번호는 project_structure['files']의 순서이며, 경로 -> 번호 변환은 도착 파일에만 한 번씩 합니다.
+    """
+    file_ids = {file_path: i for i, file_path in enumerate(project_structure['files'])}
+    for source, file_info in enumerate(project_structure['files'].values()):
+        for dependency in file_info.get('dependencies', []):
+            target = file_ids.get(dependency.get('file'))
+            if target is not None:
+                yield source, target
+        for ref in file_info.get('object_references', []):
+            target = file_ids.get(ref.get('to_file'))
+            if target is not None:
+                yield source, target
+        if include_calls:
+            for call in file_info.get('method_calls', []):
+                target = file_ids.get(call['to_file'])
+                if target is not None:
+                    yield source, target
+
+def class_dependency_edges(project_structure, symbol_table):
+    """타입 간 직접 의존 간선 (상속/구현, 객체 참조, 메서드 호출)을 타입 번호(symbol_table.declarations 순서) 쌍으로 반환합니다."""
+    class_ids = {fqn: i for i, fqn in enumerate(symbol_table.declarations)}
+    for file_path, file_info in project_structure['files'].items():
+        if 'error' in file_info:
+            continue
+        scope = symbol_table.file_scope(file_info)
+        package = file_info.get('package') or ''
+
+        def class_id(name):
+            return class_ids.get(f"{package}.{name}" if package else name)
+
+        for class_info in file_info.get('classes', []):
+            parents = ([class_info['extends']] if class_info.get('extends') else []) + class_info.get('implements', [])
+            for parent in parents:
+                declaration = symbol_table.resolve(parent, scope)
+                if declaration is not None:
+                    yield class_id(class_info['name']), class_ids[declaration['fqn']]
+        for interface_info in file_info.get('interfaces', []):
+            for parent in interface_info.get('extends', []):
+                declaration = symbol_table.resolve(parent, scope)
+                if declaration is not None:
+                    yield class_id(interface_info['name']), class_ids[declaration['fqn']]
+
+        for ref in file_info.get('object_references', []):
+            if not ref.get('to_file'):
+                continue
+            source = class_id(ref['from_class'])
+            declaration = symbol_table.resolve(ref['to_class'], scope)
+            if source is not None and declaration is not None:
+                yield source, class_ids[declaration['fqn']]
+
+        # 중첩 타입의 호출은 바깥 최상위 타입 간선으로 합침
+        for call in file_info.get('method_calls', []):
+            caller = symbol_table.resolve_import(call['from_class'])
+            callee = symbol_table.resolve_import(call['to_class'])
+            if caller is not None and callee is not None:
+                yield class_ids[caller['fqn']], class_ids[callee['fqn']]
+
+def build_impact_indexes(project_structure, symbol_table=None):
+    """파일/클래스 수준 ImpactIndex를 만듭니다."""
+    if symbol_table is None:
+        symbol_table = ProjectSymbolTable(project_structure)
+    files = ImpactIndex.from_edges(list(project_structure['files']), file_dependency_edges(project_structure))
+    classes = ImpactIndex.from_edges(list(symbol_table.declarations),
+                                     class_dependency_edges(project_structure, symbol_table))
+    return {'files': files, 'classes': classes}
+
+def add_impact_index(project_structure, symbol_table=None, closure_path=None):
+    """전이적 의존/영향 인덱스(축약 DAG)를 계산해 project_structure['impact_index']에 기록합니다.
+
+    closure_path가 주어지면 미리 계산한 도달 비트셋을 그 경로에 바이너리로 따로 저장합니다.
+    """
+    indexes = build_impact_indexes(project_structure, symbol_table)
+    project_structure['impact_index'] = {level: impact_index.to_dict() for level, impact_index in indexes.items()}
+    if closure_path:
+        write_closure(indexes, closure_path)
+    return indexes
+
+def load_impact_indexes(project_structure, closure_path=None):
+    """분석 결과에 저장된 인덱스를 불러옵니다 (없으면 새로 계산, closure_path가 있으면 도달 비트셋도 불러옴)."""
+    stored = project_structure.get('impact_index')
+    if stored is None:
+        indexes = build_impact_indexes(project_structure)
+    else:
+        indexes = {level: ImpactIndex.from_dict(data) for level, data in stored.items()}
+    if closure_path:
+        load_closure(indexes, closure_path)
+    return indexes
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="분석 결과 기반 전이적 영향 범위 조회")
+    arg_parser.add_argument("analysis_json", help="java_ast_analyzer 분석 결과 JSON")
+    arg_parser.add_argument("targets", nargs="+", help="조회할 파일 경로(또는 --classes일 때 클래스 FQN)")
+    arg_parser.add_argument("--classes", action="store_true", help="파일 대신 클래스 수준으로 조회")
+    arg_parser.add_argument("--dependencies", action="store_true", help="영향 범위 대신 전이적 의존 대상을 조회")
+    arg_parser.add_argument("--closure", default=None, metavar="FILE",
+                            help="--impact-closure로 저장한 도달 비트셋 파일 (지정하면 탐색 대신 비트셋으로 조회)")
+    args = arg_parser.parse_args()
+
+    with open(args.analysis_json, 'r', encoding='utf-8') as f:
+        project_structure = json.load(f)
+    impact_index = load_impact_indexes(project_structure, args.closure)['classes' if args.classes else 'files']
+
+    for target in args.targets:
+        if target not in impact_index.index:
+            print(f"{target}: 분석 결과에 없습니다.")
+            continue
+        names = impact_index.dependencies(target) if args.dependencies else impact_index.impacted(target)
+        print(f"{target}: {len(names)}개")
+        for name in names:
+            print(f"  {name}")
@@ -0,0 +1,110 @@
+import json
+import time
+from array import array
+from itertools import islice
+
+from dependency_closure import build_csr, strongly_connected_components, condense, file_dependency_edges
+
+# 파일/패키지 수준 의존 순환(SCC) 탐지와 축약 DAG(위상 레벨 포함) 계산 단계
+
+def package_dependency_edges(project_structure, file_edges, packages):
+    """파일 번호 간선을 파일이 속한 패키지의 번호(packages 목록 위치) 간선으로 바꿉니다."""
+    package_ids = {package: i for i, package in enumerate(packages)}
+    package_of = array('l', [package_ids.get(file_info.get('package') or '', -1)
+                             for file_info in project_structure['files'].values()])
+    for source, target in file_edges:
+        source_package = package_of[source]
+        target_package = package_of[target]
+        if source_package >= 0 and target_package >= 0:
+            yield source_package, target_package
+
+def topological_levels(offsets, targets):
+    """축약 DAG(요소 간 CSR)의 요소별 위상 레벨을 계산합니다 (의존 대상이 없는 요소가 0).
+
+    요소 번호가 역위상 순서이므로 작은 번호부터 한 번 순회하면 됩니다.
+    """
+    count = len(offsets) - 1
+    levels = [0] * count
+    level_of = levels.__getitem__
+    for current in range(count):
+        start = offsets[current]
+        end = offsets[current + 1]
+        if start != end:
+            levels[current] = 1 + max(map(level_of, targets[start:end]))
+    return levels
+
+def find_components(nodes, edges):
+    """노드 목록과 (출발, 도착) 노드 번호 쌍에서 SCC를 찾아 요소 소속과 축약 DAG를 dict로 반환합니다.
+
+    - component_of: 노드 -> 요소 번호
+    - components: 요소별 {'id', 'members', 'level', 'depends_on'} (번호 = 목록 위치, 역위상 순서)
+    - cycles: 노드 둘 이상으로 이루어진 (순환) 요소 번호 목록
+    - levels: 최대 위상 레벨 + 1
+    """
+    offsets, targets = build_csr(len(nodes), edges)
+    component, count = strongly_connected_components(offsets, targets)
+    component_offsets, component_targets = condense(offsets, targets, component, count)
+    levels = topological_levels(component_offsets, component_targets)
+
+    members = [[] for _ in range(count)]
+    for node, name in enumerate(nodes):
+        members[component[node]].append(name)
+
+    bounds = component_offsets.tolist()
+    depends_on = map(component_targets.tolist().__getitem__, map(slice, bounds, islice(bounds, 1, None)))
+    return {
+        'component_of': dict(zip(nodes, component)),
+        'components': [{
+            'id': current,
+            'members': current_members,
+            'level': level,
+            'depends_on': targets_of
+        } for current, current_members, level, targets_of in zip(range(count), members, levels, depends_on)],
+        'cycles': [current for current in range(count) if len(members[current]) > 1],
+        'levels': max(levels) + 1 if levels else 0
+    }
+
+def analyze_dependency_cycles(project_structure):
+    """관계 분석 결과(임포트/상속/구현/객체 참조)로 파일/패키지 수준 순환을 계산해 기록합니다."""
+    file_edges = list(file_dependency_edges(project_structure, include_calls=False))
+    packages = sorted({file_info.get('package') or '' for file_info in project_structure['files'].values()
+                       if 'error' not in file_info})
+
+    project_structure['dependency_cycles'] = {
+        'files': find_components(list(project_structure['files']), file_edges),
+        'packages': find_components(packages, package_dependency_edges(project_structure, file_edges, packages))
+    }
+    return project_structure['dependency_cycles']
+
+def cycle_members(result):
+    """순환 요소의 멤버 목록들을 반환합니다."""
+    return [result['components'][current]['members'] for current in result['cycles']]
+
+if __name__ == "__main__":
+    import sys
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="분석 결과 기반 파일/패키지 의존 순환 검사")
+    arg_parser.add_argument("analysis_json", help="java_ast_analyzer 분석 결과 JSON")
+    arg_parser.add_argument("--level", choices=["files", "packages"], default="packages",
+                            help="순환을 검사할 수준 (기본값: packages)")
+    arg_parser.add_argument("--fail-on-cycles", action="store_true", help="순환이 있으면 종료 코드 1로 종료")
+    args = arg_parser.parse_args()
+
+    with open(args.analysis_json, 'r', encoding='utf-8') as f:
+        project_structure = json.load(f)
+
+    start_time = time.time()
+    cycles = project_structure.get('dependency_cycles') or analyze_dependency_cycles(project_structure)
+    result = cycles[args.level]
+    print(f"요소 {len(result['components'])}개, 위상 레벨 {result['levels']}개 ({time.time() - start_time:.2f}초)")
+
+    groups = cycle_members(result)
+    for index, group in enumerate(groups, 1):
+        print(f"순환 {index} ({len(group)}개):")
+        for name in group:
+            print(f"  {name or '(기본 패키지)'}")
+    if not groups:
+        print("순환이 없습니다.")
+    elif args.fail_on_cycles:
+        sys.exit(1)
@@ -0,0 +1,55 @@
+import os
+import subprocess
+
+# 로컬 git만으로 기준 리비전 이후 변경된 Java 파일을 찾는 도우미
+
+def run_git(project_path, *args):
+    """project_path에서 git 명령을 실행하고 표준 출력(bytes)을 반환합니다."""
+    result = subprocess.run(['git', '-C', project_path] + list(args), capture_output=True, check=True)
+    return result.stdout
+
+def get_head_revision(project_path):
+    """현재 HEAD 커밋 해시를 반환합니다 (git 저장소가 아니면 None)."""
+    try:
+        return run_git(project_path, 'rev-parse', 'HEAD').decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _split_z(output):
+    """-z 옵션 출력(NUL 구분)을 경로 문자열 목록으로 나눕니다."""
+    return [os.fsdecode(item) for item in output.split(b'\0') if item]
+
+def get_changed_java_files(project_path, base_revision):
+    """기준 리비전 이후 (작업 트리 기준) 변경/삭제된 Java 파일의 상대 경로를 반환합니다.
+
+    반환값은 (다시 파싱할 경로 집합, 삭제된 경로 집합)이며, 경로는 project_path 기준입니다.
+    """
+    changed = set()
+    deleted = set()
+
+    # 추적 중인 파일의 추가/수정/이름 변경/삭제 (--relative: project_path 기준 경로)
+    output = run_git(project_path, 'diff', '--name-status', '-M', '-z', '--relative', base_revision, '--', '*.java')
+    tokens = _split_z(output)
+    i = 0
+    while i < len(tokens):
+        status = tokens[i][0]
+        if status in ('R', 'C'):
+            old_path, new_path = tokens[i + 1], tokens[i + 2]
+            if status == 'R':
+                deleted.add(os.path.normpath(old_path))
+            changed.add(os.path.normpath(new_path))
+            i += 3
+            continue
+
+        path = os.path.normpath(tokens[i + 1])
+        if status == 'D':
+            deleted.add(path)
+        else:
+            changed.add(path)
+        i += 2
+
+    # 아직 커밋되지 않은 새 파일
+    output = run_git(project_path, 'ls-files', '--others', '--exclude-standard', '-z', '--', '*.java')
+    changed.update(os.path.normpath(path) for path in _split_z(output))
+
+    return changed, deleted - changed
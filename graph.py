@@ -1,56 +1,52 @@
-import json
-from neo4j import GraphDatabase
 import os
 
+from analysis_io import AnalysisReader
+
 class JavaProjectGraphLoader:
-    def __init__(self, uri, username, password, database="neo4j"):
-        """Neo4j 연결 설정"""
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+    def __init__(self, uri, username, password, database="neo4j", driver=None):
+        """Neo4j 연결 설정 (driver를 주면 연결하지 않고 그 드라이버를 사용)"""
+        if driver is None:
+            from neo4j import GraphDatabase
+            driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.driver = driver
         self.database = database
         
     def close(self):
         """연결 종료"""
         self.driver.close()
         
-    def load_project(self, json_file_path):
-        """JSON 파일에서 프로젝트 구조를 로드하고 GraphDB에 적재"""
-        # JSON 파일 로드
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
+    def load_project(self, json_file_path, packages=None):
+        """JSON 파일에서 프로젝트 구조를 로드하고 GraphDB에 적재 (.ndjson 스트림은 한 줄씩 읽음, 샤드 출력은 packages만 선택 가능)"""
+        # 분석 결과 열기 (JSON은 한 번 로드, NDJSON은 필요한 레코드만 순차로 읽음)
+        reader = AnalysisReader(json_file_path, packages)
         
         # 데이터베이스 초기화 (이전 데이터 삭제)
         self._clear_database()
         
         # 프로젝트 루트 노드 생성
-        project_path = project_data['project_path']
+        project_path = reader.project_path
         project_name = os.path.basename(project_path)
         self._create_project(project_name, project_path)
         
-        # 패키지 노드 생성 및 관계 설정
+        # 패키지, 파일, 클래스, 인터페이스 노드 생성 및 관계 설정 (파일 레코드를 한 번만 순회)
         packages = set()
-        for file_path, file_info in project_data['files'].items():
+        for file_path, file_info in reader.files():
             if 'error' in file_info:
                 continue
                 
             package = file_info.get('package')
-            if package:
+            if package and package not in packages:
                 packages.add(package)
                 self._create_package(package)
-        
-        # 패키지 계층 구조 생성
-        self._create_package_hierarchy(packages)
-        
-        # 파일, 클래스, 인터페이스 노드 생성 및 관계 설정
-        for file_path, file_info in project_data['files'].items():
-            if 'error' in file_info:
-                continue
-                
-            package = file_info.get('package')
             file_name = os.path.basename(file_path)
             
             # 파일 노드 생성
             self._create_file(file_name, file_path, package)
             
+            # 임포트 관계 설정 (dependencies에는 프로젝트 내부 임포트만 남으므로 외부 임포트까지 있는 imports를 사용)
+            for import_path in file_info.get('imports', []):
+                self._create_import_relationship(file_path, import_path)
+            
             # 클래스 노드 생성
             for class_info in file_info.get('classes', []):
                 class_name = class_info['name']
@@ -93,18 +89,8 @@ class JavaProjectGraphLoader:
                 for ext in extends:
                     self._create_extends_relationship(full_interface_name, ext)
         
-        # 임포트 관계 설정
-        for file_path, file_info in project_data['files'].items():
-            if 'error' in file_info:
-                continue
-                
-            package = file_info.get('package')
-            file_name = os.path.basename(file_path)
-            
-            # 임포트 관계 설정
-            for dependency in file_info.get('dependencies', []):
-                if dependency['type'] == 'import':
-                    self._create_import_relationship(file_path, dependency['target'])
+        # 패키지 계층 구조 생성
+        self._create_package_hierarchy(packages)
     
     def _execute_query(self, query, parameters=None):
         """Cypher 쿼리 실행"""
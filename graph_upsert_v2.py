@@ -1,180 +1,229 @@
-import json
-from neo4j import GraphDatabase
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from analysis_io import AnalysisReader
+from source_store import SourceStore, MethodBodyReader, warn_missing_bodies
+
+# CALLS 관계를 한 번의 UNWIND 쿼리로 보내는 호출 수
+CALLS_BATCH_SIZE = 1000
+
+def method_node_id(parent_name, method_name, arity):
+    """메서드 노드 id (오버로드를 구분하도록 메서드 인덱스처럼 파라미터 개수를 포함, 예: a.b.C.run/2)"""
+    return f"{parent_name}.{method_name}/{arity}"
 
 class CodeAnalyzerGraphLoader:
-    def __init__(self, uri, username, password, database="neo4j"):
-        """Neo4j 연결 설정"""
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+    def __init__(self, uri, username, password, database="neo4j", driver=None):
+        """Neo4j 연결 설정 (driver를 주면 연결하지 않고 그 드라이버를 사용)"""
+        if driver is None:
+            from neo4j import GraphDatabase
+            driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.driver = driver
         self.database = database
         
     def close(self):
         """연결 종료"""
         self.driver.close()
         
-    def load_project(self, json_file_path):
-        """JSON 파일에서 AST 데이터를 로드하고 GraphDB에 적재"""
-        # JSON 파일 로드
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
+    def load_project(self, json_file_path, packages=None, max_workers=1, source_store=None):
+        """JSON 파일에서 AST 데이터를 로드하고 GraphDB에 적재 (.ndjson 스트림은 한 줄씩 읽음)
+        
+        샤드 출력(디렉토리 또는 manifest.json)은 packages로 필요한 패키지만 고르고, max_workers개 샤드를 병렬로 적재합니다.
+        --body-ranges 결과의 메서드 본문은 프로젝트 소스나 source_store(내용 주소 저장소)에서 읽습니다.
+        """
+        # 분석 결과 열기 (JSON은 한 번 로드, NDJSON은 필요한 레코드만 순차로 읽음)
+        reader = AnalysisReader(json_file_path, packages)
         
         # 데이터베이스 초기화 (이전 데이터 삭제)
         self._clear_database()
         
         # 프로젝트 루트 노드 생성
-        project_path = project_data['project_path']
+        project_path = reader.project_path
         project_name = os.path.basename(project_path)
         self._create_project(project_name, project_path)
         
-        # 패키지 노드 생성
-        packages = set()
-        for file_path, file_info in project_data['files'].items():
-            package = file_info.get('package')
-            if package:
-                packages.add(package)
-                self._create_package(package)
+        # 패키지/파일 노드 생성 (파일 레코드를 한 번만 순회)
+        # 범위(body_range)만 기록된 메서드 본문은 소스(또는 소스 저장소)에서 필요할 때 읽음
+        self._bodies = MethodBodyReader(project_path, SourceStore(source_store) if source_store else None)
+        try:
+            packages = set()
+            if reader.sharded and max_workers > 1:
+                # 매니페스트의 패키지 노드를 먼저 만든 뒤 샤드 단위로 병렬 적재
+                for package in reader.packages():
+                    packages.add(package)
+                    self._create_package(package)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(lambda shard: self._load_shard(reader, shard), reader.shards))
+            else:
+                for file_path, file_info in reader.files():
+                    package = file_info.get('package')
+                    if package and package not in packages:
+                        packages.add(package)
+                        self._create_package(package)
+                    self._load_file(file_path, file_info)
+        finally:
+            self._bodies.close()
+        warn_missing_bodies(self._bodies)
         
         # 패키지 계층 구조 생성
         self._create_package_hierarchy(packages)
         
+        # 의존성 관계 설정 (메서드 호출 관계는 배치 크기만큼 모일 때마다 UNWIND로 생성해 전체를 쌓아두지 않음)
+        calls = []
+        call_count = 0
+        for file_path, relationships in reader.relationships():
+            for dependency in relationships.get('dependencies', []):
+                if dependency.get('type') == 'import' and dependency.get('file'):
+                    self._create_file_depends_on_relationship(file_path, dependency['file'])
+            for call in relationships.get('method_calls', []):
+                calls.append({
+                    "from_id": method_node_id(call['from_class'], call['from_method'], call['from_arity']),
+                    "to_id": method_node_id(call['to_class'], call['to_method'], call['to_arity'])
+                })
+                if len(calls) >= CALLS_BATCH_SIZE:
+                    call_count += self._create_calls_relationships(calls)
+                    calls = []
+        call_count += self._create_calls_relationships(calls)
+        print(f"메서드 호출 관계를 설정했습니다: {call_count}개")
+        
+        print("모든 데이터가 Neo4j에 로드되었습니다.")
+    
+    def _load_file(self, file_path, file_info):
+        """파일 하나의 파일/임포트/클래스/인터페이스/메서드 노드 생성"""
+        package = file_info.get('package')
+        file_name = os.path.basename(file_path)
+        
         # 파일 노드 생성
-        for file_path, file_info in project_data['files'].items():
-            package = file_info.get('package')
-            file_name = os.path.basename(file_path)
+        self._create_file(file_name, file_path, package)
+        
+        # 임포트 노드 생성
+        for import_stmt in file_info.get('imports', []):
+            self._create_import(import_stmt)
+            self._create_file_imports_relationship(file_path, import_stmt)
+        
+        # 클래스 노드 생성
+        for class_info in file_info.get('classes', []):
+            class_name = class_info['name']
+            full_class_name = f"{package}.{class_name}" if package else class_name
+            extends = class_info.get('extends')
             
-            # 파일 노드 생성
-            self._create_file(file_name, file_path, package)
+            # 클래스 속성
+            properties = {
+                "name": class_name,
+                "fullName": full_class_name,
+                "extends": extends if extends else ""
+            }
             
-            # 임포트 노드 생성
-            for import_stmt in file_info.get('imports', []):
-                self._create_import(import_stmt)
-                self._create_file_imports_relationship(file_path, import_stmt)
+            self._create_class(properties, package, file_path)
             
-            # 클래스 노드 생성
-            for class_info in file_info.get('classes', []):
-                class_name = class_info['name']
-                full_class_name = f"{package}.{class_name}" if package else class_name
-                extends = class_info.get('extends')
+            # 필드 노드 생성
+            for field_info in class_info.get('fields', []):
+                field_name = field_info['name']
+                field_type = field_info.get('type', '')
                 
-                # 클래스 속성
-                properties = {
-                    "name": class_name,
-                    "fullName": full_class_name,
-                    "extends": extends if extends else ""
+                field_properties = {
+                    "name": field_name,
+                    "type": field_type,
+                    "class_name": full_class_name
                 }
                 
-                self._create_class(properties, package, file_path)
+                self._create_field(field_properties, full_class_name)
+            
+            # 메서드 노드 생성
+            for method_info in class_info.get('methods', []):
+                method_name = method_info['name']
+                return_type = method_info.get('return_type', 'void')
+                documentation = method_info.get('documentation', '')
+                description = method_info.get('description', '')
+                body = self._bodies.body(file_path, file_info, method_info)
                 
-                # 필드 노드 생성
-                for field_info in class_info.get('fields', []):
-                    field_name = field_info['name']
-                    field_type = field_info.get('type', '')
-                    
-                    field_properties = {
-                        "name": field_name,
-                        "type": field_type,
-                        "class_name": full_class_name
-                    }
-                    
-                    self._create_field(field_properties, full_class_name)
+                method_properties = {
+                    "name": method_name,
+                    "returnType": return_type if return_type else "void",
+                    "documentation": documentation if documentation else "",  # NULL 방지
+                    "description": description if description else "",       # NULL 방지
+                    "body": body if body else "",                           # NULL 방지
+                    "parent_name": full_class_name,
+                    "arity": len(method_info.get('parameters') or [])
+                }
                 
-                # 메서드 노드 생성
-                for method_info in class_info.get('methods', []):
-                    method_name = method_info['name']
-                    return_type = method_info.get('return_type', 'void')
-                    documentation = method_info.get('documentation', '')
-                    description = method_info.get('description', '')
-                    body = method_info.get('body', '')
+                method_id = self._create_method(method_properties)
+                
+                # 파라미터 노드 생성
+                for param_info in method_info.get('parameters', []):
+                    param_name = param_info['name']
+                    param_type = param_info.get('type', '')
                     
-                    method_properties = {
-                        "name": method_name,
-                        "returnType": return_type if return_type else "void",
-                        "documentation": documentation if documentation else "",  # NULL 방지
-                        "description": description if description else "",       # NULL 방지
-                        "body": body if body else "",                           # NULL 방지
-                        "parent_name": full_class_name
+                    param_properties = {
+                        "name": param_name,
+                        "type": param_type if param_type else "",
+                        "method_id": method_id
                     }
                     
-                    method_id = self._create_method(method_properties)
-                    
-                    # 파라미터 노드 생성
-                    for param_info in method_info.get('parameters', []):
-                        param_name = param_info['name']
-                        param_type = param_info.get('type', '')
-                        
-                        param_properties = {
-                            "name": param_name,
-                            "type": param_type if param_type else "",
-                            "method_id": method_id
-                        }
-                        
-                        self._create_parameter(param_properties, method_id)
-                
-                # 상속 관계 설정
-                if extends:
-                    self._create_extends_relationship(full_class_name, extends)
-                
-                # 구현 관계 설정
-                for interface in class_info.get('implements', []):
-                    self._create_implements_relationship(full_class_name, interface)
+                    self._create_parameter(param_properties, method_id)
+            
+            # 상속 관계 설정
+            if extends:
+                self._create_extends_relationship(full_class_name, extends)
+            
+            # 구현 관계 설정
+            for interface in class_info.get('implements', []):
+                self._create_implements_relationship(full_class_name, interface)
+        
+        # 인터페이스 노드 생성
+        for interface_info in file_info.get('interfaces', []):
+            interface_name = interface_info['name']
+            full_interface_name = f"{package}.{interface_name}" if package else interface_name
+            extends = interface_info.get('extends', [])
             
-            # 인터페이스 노드 생성
-            for interface_info in file_info.get('interfaces', []):
-                interface_name = interface_info['name']
-                full_interface_name = f"{package}.{interface_name}" if package else interface_name
-                extends = interface_info.get('extends', [])
+            # 인터페이스 속성
+            properties = {
+                "name": interface_name,
+                "fullName": full_interface_name
+            }
+            
+            self._create_interface(properties, package, file_path)
+            
+            # 메서드 노드 생성
+            for method_info in interface_info.get('methods', []):
+                method_name = method_info['name']
+                return_type = method_info.get('return_type', '')
+                description = method_info.get('description', '')
+                documentation = method_info.get('documentation', '')
+                body = self._bodies.body(file_path, file_info, method_info)
                 
-                # 인터페이스 속성
-                properties = {
-                    "name": interface_name,
-                    "fullName": full_interface_name
+                method_properties = {
+                    "name": method_name,
+                    "returnType": return_type if return_type else "void",
+                    "documentation": documentation if documentation else "",  # NULL 방지
+                    "description": description if description else "",        # NULL 방지
+                    "body": body if body else "",                            # NULL 방지
+                    "parent_name": full_interface_name,
+                    "arity": len(method_info.get('parameters') or [])
                 }
                 
-                self._create_interface(properties, package, file_path)
+                method_id = self._create_method(method_properties)
                 
-                # 메서드 노드 생성
-                for method_info in interface_info.get('methods', []):
-                    method_name = method_info['name']
-                    return_type = method_info.get('return_type', '')
-                    description = method_info.get('description', '')
-                    documentation = method_info.get('documentation', '')
-                    body = method_info.get('body', '')
+                # 파라미터 노드 생성
+                for param_info in method_info.get('parameters', []):
+                    param_name = param_info['name']
+                    param_type = param_info.get('type', '')
                     
-                    method_properties = {
-                        "name": method_name,
-                        "returnType": return_type if return_type else "void",
-                        "documentation": documentation if documentation else "",  # NULL 방지
-                        "description": description if description else "",        # NULL 방지
-                        "body": body if body else "",                            # NULL 방지
-                        "parent_name": full_interface_name
+                    param_properties = {
+                        "name": param_name,
+                        "type": param_type if param_type else "",
+                        "method_id": method_id
                     }
                     
-                    method_id = self._create_method(method_properties)
-                    
-                    # 파라미터 노드 생성
-                    for param_info in method_info.get('parameters', []):
-                        param_name = param_info['name']
-                        param_type = param_info.get('type', '')
-                        
-                        param_properties = {
-                            "name": param_name,
-                            "type": param_type if param_type else "",
-                            "method_id": method_id
-                        }
-                        
-                        self._create_parameter(param_properties, method_id)
-                
-                # 인터페이스 확장 관계 설정
-                for ext in extends:
-                    self._create_extends_relationship(full_interface_name, ext)
-        
-        # 의존성 관계 설정
-        for file_path, file_info in project_data['files'].items():
-            for dependency in file_info.get('dependencies', []):
-                if dependency.get('type') == 'import' and dependency.get('file'):
-                    self._create_file_depends_on_relationship(file_path, dependency['file'])
-        
-        print("모든 데이터가 Neo4j에 로드되었습니다.")
+                    self._create_parameter(param_properties, method_id)
+            
+            # 인터페이스 확장 관계 설정
+            for ext in extends:
+                self._create_extends_relationship(full_interface_name, ext)
+    
+    def _load_shard(self, reader, shard):
+        """샤드 하나의 파일들을 적재 (샤드 단위 병렬 적재용)"""
+        for file_path, file_info in reader.load_shard(shard)['files'].items():
+            self._load_file(file_path, file_info)
     
     def _execute_query(self, query, parameters=None):
         """Cypher 쿼리 실행"""
@@ -362,7 +411,7 @@ class CodeAnalyzerGraphLoader:
     
     def _create_method(self, properties):
         """메서드 노드 생성"""
-        method_id = f"{properties['parent_name']}.{properties['name']}"
+        method_id = method_node_id(properties['parent_name'], properties['name'], properties['arity'])
         
         query = """
         MERGE (m:Method {
@@ -451,6 +500,19 @@ class CodeAnalyzerGraphLoader:
         """
         self._execute_query(query, {"source_file": source_file, "target_file": target_file})
         print(f"파일 의존성 관계를 설정했습니다: {source_file} -> {target_file}")
+    
+    def _create_calls_relationships(self, calls):
+        """메서드 호출 관계 한 배치를 UNWIND로 설정하고 설정한 개수를 반환"""
+        if not calls:
+            return 0
+        query = """
+        UNWIND $calls AS call
+        MATCH (caller:Method {id: call.from_id})
+        MATCH (callee:Method {id: call.to_id})
+        MERGE (caller)-[:CALLS]->(callee)
+        """
+        self._execute_query(query, {"calls": calls})
+        return len(calls)
 
     def find_related_method_nodes(self, method_name):
         """특정 메서드와 연관된 노드 찾기"""
@@ -1,7 +1,25 @@
 import os
-import json
-import re
-from concurrent.futures import ThreadPoolExecutor
+import mmap
+import heapq
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+
+from parse_cache import ParseCache, make_namespace, content_hash
+from git_diff import get_changed_java_files, get_head_revision
+from symbol_table import SymbolIndex, ProjectSymbolTable
+from code_model import FileInfo, TypeInfo, MethodInfo, FieldInfo, ParamInfo, as_file_info
+from relationship_analysis import (
+    analyze_file_dependencies, analyze_file_object_references, analyze_object_references, analyze_parsed_project,
+    analyze_relationships
+)
+from analysis_io import (
+    DEFAULT_SHARD_SIZE, CallSiteWriter, JsonAnalysisWriter, NdjsonAnalysisWriter, call_sites_path, compact_file_info,
+    is_binary_path, is_ndjson_path, load_analysis, load_call_sites, write_call_sites, write_output
+)
+from java_file_discovery import (
+    DEFAULT_BUILD_DIRS, DEFAULT_IGNORED_DIRS, DEFAULT_DISCOVERY_WORKERS, discover_java_files, is_ignored_path
+)
 
 # tree-sitter 라이브러리 임포트
 try:
@@ -17,23 +35,36 @@ except ImportError:
 # Java 언어 로드 (aa.py 코드 방식 활용)
 try:
     # tree_sitter_java 모듈에서 language 함수 사용
+    # 파서는 공유하지 않고 create_parser()/get_thread_parser()로 스레드마다 만듦
     JAVA_LANGUAGE = Language(tsjava.language())
-    parser = Parser()
-    parser.set_language(JAVA_LANGUAGE)
 except Exception as e:
     print(f"Java 언어 로드 실패: {e}")
     print("tree-sitter-java가 올바르게 설치되어 있는지 확인하세요.")
     print("설치하려면: pip install tree-sitter-java")
     exit(1)
 
-def find_java_files(project_path):
-    """프로젝트 경로에서 모든 Java 파일을 찾습니다."""
-    java_files = []
-    for root, dirs, files in os.walk(project_path):
-        for file in files:
-            if file.endswith('.java'):
-                java_files.append(os.path.join(root, file))
-    return java_files
+# 파일별 추출 결과 형식이 바뀌면 올려서 기존 파스 캐시를 무효화
+ANALYZER_VERSION = "6"
+CACHE_NAMESPACE = make_namespace("java_ast_analyzer", ANALYZER_VERSION, "tree-sitter", "tree-sitter-java")
+# 본문 대신 범위를 기록하는 결과는 형식이 달라 네임스페이스를 분리 (메서드별 참조 목록도 남기지 않음)
+RANGE_CACHE_NAMESPACE = CACHE_NAMESPACE + ";bodies=range;method_references=none"
+# 본문에서 다시 만들 수 있는 메서드별 참조 목록 (파일 단위 object_references와 중복)
+METHOD_REFERENCE_KEYS = ('referenced_objects', 'references')
+
+# 스레드별 Parser 풀 (Parser 객체는 스레드 간에 공유하면 안 됨)
+_parser_pool = threading.local()
+
+def create_parser():
+    """JAVA_LANGUAGE에 바인딩된 새 Parser를 생성합니다."""
+    return Parser(JAVA_LANGUAGE)
+
+def get_thread_parser():
+    """현재 스레드 전용 Parser를 반환합니다 (없으면 새로 생성)."""
+    java_parser = getattr(_parser_pool, 'parser', None)
+    if java_parser is None:
+        java_parser = create_parser()
+        _parser_pool.parser = java_parser
+    return java_parser
 
 def get_node_text(node, source_code):
     """노드의 텍스트를 반환합니다."""
@@ -50,18 +81,34 @@ def extract_package_name(root_node, source_code):
                 return get_node_text(child, source_code)
     return None
 
+def extract_import_path(import_node, source_code):
+    """임포트 선언 노드에서 임포트 경로를 추출합니다 (와일드카드 임포트는 '.*'까지 포함)."""
+    import_path = None
+    wildcard = False
+    for child in import_node.children:
+        # 'import' (및 'static') 키워드 다음의 이름 부분 찾기
+        if import_path is None and child.type in ('scoped_identifier', 'identifier'):
+            import_path = get_node_text(child, source_code)
+        elif child.type == 'asterisk':
+            wildcard = True
+    if import_path and wildcard:
+        return import_path + '.*'
+    return import_path
+
 def extract_imports(root_node, source_code):
     """임포트 정보를 추출합니다."""
     imports = []
     for node in root_node.children:
         if node.type == 'import_declaration':
-            # 'import' 키워드 다음의 이름 부분 찾기
-            for child in node.children:
-                if child.type == 'scoped_identifier':
-                    imports.append(get_node_text(child, source_code))
-                    break
+            import_path = extract_import_path(node, source_code)
+            if import_path:
+                imports.append(import_path)
     return imports
 
+# 파라미터 타입으로 인정하는 노드 (기본형/제네릭/정규화 이름 포함, 오버로드의 파라미터 수가 맞도록)
+PARAMETER_TYPE_NODES = ('type_identifier', 'array_type', 'primitive_type', 'integral_type', 'floating_point_type',
+                        'boolean_type', 'generic_type', 'scoped_type_identifier')
+
 def extract_method_parameters(method_node, source_code):
     """메서드 파라미터 정보를 추출합니다."""
     parameters = []
@@ -74,8 +121,7 @@ def extract_method_parameters(method_node, source_code):
                 param_type = None
                 
                 # 타입 찾기
-                type_node = next((n for n in child.children if n.type in 
-                               ['type_identifier', 'array_type', 'primitive_type']), None)
+                type_node = next((n for n in child.children if n.type in PARAMETER_TYPE_NODES), None)
                 if type_node:
                     param_type = get_node_text(type_node, source_code)
                 
@@ -85,45 +131,186 @@ def extract_method_parameters(method_node, source_code):
                     param_name = get_node_text(name_node, source_code)
                 
                 if param_name and param_type:
-                    parameters.append({
-                        'name': param_name,
-                        'type': param_type
-                    })
+                    parameters.append(ParamInfo(
+                        name=param_name,
+                        type=param_type
+                    ))
     
     return parameters
 
+def find_method_body_node(method_node):
+    """메서드 본문(block) 노드를 찾습니다."""
+    return next((child for child in method_node.children 
+                 if child.type == 'block'), None)
+
+def get_node_range(node):
+    """노드의 (시작 바이트, 끝 바이트, 시작 줄, 끝 줄)을 반환합니다 (줄 번호는 1부터)."""
+    return [node.start_byte, node.end_byte, node.start_point[0] + 1, node.end_point[0] + 1]
+
+def set_method_body(method_info, body_node, source_code, body_ranges=False):
+    """메서드 본문 텍스트(body) 또는 소스 내 범위(body_range)를 기록합니다."""
+    if body_ranges:
+        method_info['body_range'] = get_node_range(body_node) if body_node else None
+    else:
+        method_info['body'] = get_node_text(body_node, source_code) if body_node else None
+
 def extract_method_body(method_node, source_code):
     """메서드 본문을 추출합니다."""
-    body_node = next((child for child in method_node.children 
-                     if child.type == 'block'), None)
+    body_node = find_method_body_node(method_node)
     if body_node:
         return get_node_text(body_node, source_code)
     return None
 
-def find_object_references(method_body):
-    """메서드 본문에서 객체 참조를 추출합니다."""
-    if not method_body:
+# 객체 참조를 만드는 노드 타입과 참조 종류
+REFERENCE_NODE_KINDS = {
+    'object_creation_expression': 'instantiation',
+    'method_invocation': 'static_call',
+    'local_variable_declaration': 'declaration',
+    'cast_expression': 'cast',
+    'class_literal': 'class_literal'
+}
+
+# 참조 대상에서 제외할 타입
+EXCLUDED_REFERENCE_TYPES = {'int', 'long', 'double', 'float', 'boolean', 'char', 'byte', 'short', 'void',
+                            'String', 'var'}
+
+def get_type_name(type_node, source_code):
+    """타입 노드에서 제네릭 인자와 배열 차원을 뺀 클래스 이름을 반환합니다."""
+    while type_node is not None and type_node.type in ('generic_type', 'array_type'):
+        if type_node.type == 'array_type':
+            type_node = type_node.child_by_field_name('element')
+        else:
+            type_node = type_node.named_child(0)
+    
+    if type_node is None or type_node.type not in ('type_identifier', 'scoped_type_identifier'):
+        return None
+    
+    type_name = ''.join(get_node_text(type_node, source_code).split())
+    return None if type_name in EXCLUDED_REFERENCE_TYPES else type_name
+
+def get_static_receiver_name(object_node, source_code):
+    """메서드 호출 수신자가 클래스 이름(대문자로 시작)이면 그 이름을 반환합니다."""
+    parts = []
+    while object_node is not None and object_node.type == 'field_access':
+        field = object_node.child_by_field_name('field')
+        if field is None or field.type != 'identifier':
+            return None
+        parts.append(get_node_text(field, source_code))
+        object_node = object_node.child_by_field_name('object')
+    
+    if object_node is None or object_node.type != 'identifier':
+        return None
+    parts.append(get_node_text(object_node, source_code))
+    parts.reverse()
+    
+    # 소문자로 시작하는 변수 수신자(a.b())는 클래스 참조가 아님
+    if not parts[-1][:1].isupper():
+        return None
+    type_name = '.'.join(parts)
+    return None if type_name in EXCLUDED_REFERENCE_TYPES else type_name
+
+def _reference_names(node, kind, source_code):
+    """참조 노드 하나에서 참조하는 타입 이름들을 반환합니다."""
+    if kind == 'static_call':
+        return [get_static_receiver_name(node.child_by_field_name('object'), source_code)]
+    if kind == 'class_literal':
+        return [get_type_name(node.named_child(0), source_code)]
+    # 교차 타입 캐스트 (A & B)는 type 필드가 여러 개
+    return [get_type_name(type_node, source_code) for type_node in node.children_by_field_name('type')]
+
+def collect_object_references(body_node, source_code):
+    """메서드 본문 트리를 한 번 순회하며 (타입 이름, 참조 종류) 목록을 수집합니다."""
+    references = {}
+    if body_node is None:
         return []
     
-    # 'new ClassName(' 패턴 찾기
-    new_objects = re.findall(r'new\s+([A-Za-z][A-Za-z0-9_]*)\s*\(', method_body)
+    cursor = body_node.walk()
+    while True:
+        node = cursor.node
+        kind = REFERENCE_NODE_KINDS.get(node.type)
+        if kind:
+            for type_name in _reference_names(node, kind, source_code):
+                if type_name:
+                    references.setdefault((type_name, kind), None)
+        
+        # 깊이 우선 순회 (재귀 없이 TreeCursor 이동)
+        if cursor.goto_first_child() or cursor.goto_next_sibling():
+            continue
+        while True:
+            if not cursor.goto_parent():
+                return list(references)
+            if cursor.goto_next_sibling():
+                break
+
+def build_method_references(body_node, source_code):
+    """메서드의 referenced_objects(이름 목록)와 references(종류 포함) 값을 만듭니다."""
+    references = collect_object_references(body_node, source_code)
+    referenced_objects = list(dict.fromkeys(type_name for type_name, _ in references))
+    return referenced_objects, [{'name': type_name, 'kind': kind} for type_name, kind in references]
+
+def add_object_references(info, class_info):
+    """클래스 메서드들의 참조를 파일 단위 object_references에 추가합니다."""
+    class_name = class_info['name']
+    for method_info in class_info['methods']:
+        kinds = {}
+        for reference in method_info.get('references', []):
+            kinds.setdefault(reference['name'], []).append(reference['kind'])
+        
+        for ref_obj in method_info.get('referenced_objects', []):
+            if ref_obj != class_name:  # 자기 자신 참조 제외
+                info['object_references'].append({
+                    'class': class_name,
+                    'method': method_info['name'],
+                    'referenced_object': ref_obj,
+                    'kinds': kinds.get(ref_obj, [])
+                })
+
+def drop_method_references(info):
+    """object_references를 만든 뒤 메서드별 참조 목록을 지웁니다 (본문 범위만 남기는 결과용)."""
+    for class_info in info.get('classes', []):
+        for method_info in class_info.get('methods', []):
+            for key in METHOD_REFERENCE_KEYS:
+                method_info.pop(key, None)
+
+def has_method_references(file_info):
+    """클래스 메서드마다 참조 목록이 남아 있는지 확인합니다 (없으면 다시 파싱해야 해석 전 참조를 복원 가능)."""
+    return all(METHOD_REFERENCE_KEYS[0] in method_info
+               for class_info in file_info.get('classes', [])
+               for method_info in class_info.get('methods', []))
+
+def extract_class_method_info(method_node, source_code, body_ranges=False):
+    """클래스 메서드 선언 노드 하나에서 메서드 정보를 추출합니다 (body_ranges면 본문 대신 범위만 기록)."""
+    # 반환 타입 찾기
+    return_type_node = next((n for n in method_node.children 
+                           if n.type in ['type_identifier', 'void_type', 'primitive_type']), None)
+    return_type = get_node_text(return_type_node, source_code) if return_type_node else None
     
-    # 'ClassName.method' 패턴 찾기
-    static_calls = re.findall(r'([A-Za-z][A-Za-z0-9_]*)\s*\.\s*[A-Za-z][A-Za-z0-9_]*\s*\(', method_body)
+    # 메서드 이름 찾기
+    name_node = next((n for n in method_node.children if n.type == 'identifier'), None)
+    if not name_node:
+        return None
+    method_name = get_node_text(name_node, source_code)
     
-    # 변수 선언 'ClassName variable' 패턴 찾기
-    var_declarations = re.findall(r'([A-Za-z][A-Za-z0-9_]*)\s+[a-z][A-Za-z0-9_]*\s*[=;]', method_body)
+    # 파라미터 추출
+    parameters = extract_method_parameters(method_node, source_code)
     
-    # 중복 제거 및 통합
-    ref_objects = set(new_objects + static_calls + var_declarations)
+    # 메서드 본문 노드
+    body_node = find_method_body_node(method_node)
     
-    # primitive 타입 제외
-    primitives = {'int', 'long', 'double', 'float', 'boolean', 'char', 'byte', 'short', 'void', 'String'}
-    ref_objects = [obj for obj in ref_objects if obj not in primitives]
+    # 객체 참조 찾기 (본문 트리에서 직접 수집)
+    referenced_objects, references = build_method_references(body_node, source_code)
     
-    return list(ref_objects)
+    method_info = MethodInfo(
+        name=method_name,
+        return_type=return_type,
+        parameters=parameters
+    )
+    set_method_body(method_info, body_node, source_code, body_ranges)
+    method_info['referenced_objects'] = referenced_objects
+    method_info['references'] = references
+    return method_info
 
-def extract_class_methods(class_node, source_code):
+def extract_class_methods(class_node, source_code, body_ranges=False):
     """클래스의 메서드 정보를 추출합니다."""
     methods = []
     
@@ -131,32 +318,9 @@ def extract_class_methods(class_node, source_code):
         if child.type == 'class_body':
             for body_child in child.children:
                 if body_child.type == 'method_declaration':
-                    # 반환 타입 찾기
-                    return_type_node = next((n for n in body_child.children 
-                                           if n.type in ['type_identifier', 'void_type', 'primitive_type']), None)
-                    return_type = get_node_text(return_type_node, source_code) if return_type_node else None
-                    
-                    # 메서드 이름 찾기
-                    name_node = next((n for n in body_child.children if n.type == 'identifier'), None)
-                    if name_node:
-                        method_name = get_node_text(name_node, source_code)
-                        
-                        # 파라미터 추출
-                        parameters = extract_method_parameters(body_child, source_code)
-                        
-                        # 메서드 본문 추출
-                        method_body = extract_method_body(body_child, source_code)
-                        
-                        # 객체 참조 찾기
-                        referenced_objects = find_object_references(method_body)
-                        
-                        methods.append({
-                            'name': method_name,
-                            'return_type': return_type,
-                            'parameters': parameters,
-                            'body': method_body,
-                            'referenced_objects': referenced_objects
-                        })
+                    method_info = extract_class_method_info(body_child, source_code, body_ranges)
+                    if method_info:
+                        methods.append(method_info)
     
     return methods
 
@@ -181,11 +345,11 @@ def extract_interface_methods(interface_node, source_code):
                         # 파라미터 추출
                         parameters = extract_method_parameters(body_child, source_code)
                         
-                        methods.append({
-                            'name': method_name,
-                            'return_type': return_type,
-                            'parameters': parameters
-                        })
+                        methods.append(MethodInfo(
+                            name=method_name,
+                            return_type=return_type,
+                            parameters=parameters
+                        ))
     
     return methods
 
@@ -208,129 +372,416 @@ def extract_class_fields(class_node, source_code):
                             name_node = next((c for c in n.children if c.type == 'identifier'), None)
                             if name_node:
                                 field_name = get_node_text(name_node, source_code)
-                                fields.append({
-                                    'name': field_name,
-                                    'type': field_type
-                                })
+                                fields.append(FieldInfo(
+                                    name=field_name,
+                                    type=field_type
+                                ))
     
     return fields
 
+# 수정자 목록에서 제외할 애너테이션 노드
+ANNOTATION_NODE_TYPES = ('marker_annotation', 'annotation')
+
+def modifier_keywords(modifiers_node, source_code):
+    """modifiers 노드에서 수정자 키워드(public, abstract 등)만 소스 순서대로 추출합니다."""
+    return [get_node_text(child, source_code) for child in modifiers_node.children
+            if child.type not in ANNOTATION_NODE_TYPES]
+
+def extract_modifiers(declaration_node, source_code):
+    """타입 선언의 수정자 목록을 추출합니다 (없으면 빈 목록)."""
+    modifiers_node = next((child for child in declaration_node.children if child.type == 'modifiers'), None)
+    return modifier_keywords(modifiers_node, source_code) if modifiers_node else []
+
+# 상위 타입 절에서 이름으로 쓰는 타입 노드 (제네릭 타입은 타입 인자를 뺀 기본 타입 이름을 사용)
+SUPERTYPE_NODES = ('type_identifier', 'scoped_type_identifier')
+
+def supertype_name(type_node, source_code):
+    """상위 타입 노드의 이름을 반환합니다 (Base<T> -> Base, a.b.Base -> a.b.Base, 그 외 노드는 None)."""
+    if type_node.type == 'generic_type':
+        type_node = next((n for n in type_node.children if n.type in SUPERTYPE_NODES), None)
+        if type_node is None:
+            return None
+    if type_node.type in SUPERTYPE_NODES:
+        return get_node_text(type_node, source_code)
+    return None
+
+def supertype_names(clause_node, source_code):
+    """implements/extends 절(super_interfaces, extends_interfaces)의 타입 이름 목록을 추출합니다.
+
+    tree-sitter-java는 절 아래에 type_list를 두고 그 안에 타입 노드를 나열합니다.
+    """
+    names = []
+    for child in clause_node.children:
+        if child.type == 'type_list':
+            names.extend(name for name in (supertype_name(n, source_code) for n in child.children) if name)
+    return names
+
 def extract_class_extends(class_node, source_code):
     """클래스의 확장(extends) 정보를 추출합니다."""
     extends_clause = next((child for child in class_node.children 
                           if child.type == 'superclass'), None)
     if extends_clause:
-        type_node = next((n for n in extends_clause.children 
-                         if n.type == 'type_identifier'), None)
-        if type_node:
-            return get_node_text(type_node, source_code)
+        return next((name for name in (supertype_name(n, source_code) for n in extends_clause.children) if name), None)
     return None
 
 def extract_class_implements(class_node, source_code):
     """클래스의 구현(implements) 정보를 추출합니다."""
-    implements = []
     implements_clause = next((child for child in class_node.children 
-                             if child.type == 'interfaces'), None)
+                             if child.type == 'super_interfaces'), None)
     if implements_clause:
-        for child in implements_clause.children:
-            if child.type == 'type_identifier':
-                implements.append(get_node_text(child, source_code))
-    return implements
+        return supertype_names(implements_clause, source_code)
+    return []
 
 def extract_interface_extends(interface_node, source_code):
     """인터페이스의 확장(extends) 정보를 추출합니다."""
-    extends = []
     extends_clause = next((child for child in interface_node.children 
                           if child.type == 'extends_interfaces'), None)
     if extends_clause:
-        for child in extends_clause.children:
-            if child.type == 'type_identifier':
-                extends.append(get_node_text(child, source_code))
-    return extends
+        return supertype_names(extends_clause, source_code)
+    return []
+
+def extract_class_info(class_node, source_code, methods=None, body_ranges=False):
+    """클래스 선언 노드에서 클래스 정보를 추출합니다 (methods가 주어지면 그대로 사용)."""
+    # 클래스 이름 추출
+    name_node = next((child for child in class_node.children if child.type == 'identifier'), None)
+    if not name_node:
+        return None
+    
+    return TypeInfo(
+        name=get_node_text(name_node, source_code),
+        modifiers=extract_modifiers(class_node, source_code),
+        extends=extract_class_extends(class_node, source_code),
+        implements=extract_class_implements(class_node, source_code),
+        fields=extract_class_fields(class_node, source_code),
+        methods=methods if methods is not None else extract_class_methods(class_node, source_code, body_ranges)
+    )
+
+def extract_interface_info(interface_node, source_code):
+    """인터페이스 선언 노드에서 인터페이스 정보를 추출합니다."""
+    # 인터페이스 이름 추출
+    name_node = next((child for child in interface_node.children if child.type == 'identifier'), None)
+    if not name_node:
+        return None
+    
+    return TypeInfo(
+        name=get_node_text(name_node, source_code),
+        modifiers=extract_modifiers(interface_node, source_code),
+        extends=extract_interface_extends(interface_node, source_code),
+        methods=extract_interface_methods(interface_node, source_code)
+    )
 
-def extract_ast_info(tree, source_code):
+def extract_ast_info(tree, source_code, body_ranges=False):
     """AST에서 필요한 정보만 추출합니다."""
     root_node = tree.root_node
     
-    info = {
-        'package': extract_package_name(root_node, source_code),
-        'imports': extract_imports(root_node, source_code),
-        'classes': [],
-        'interfaces': [],
-        'object_references': []
-    }
+    info = FileInfo(
+        package=extract_package_name(root_node, source_code),
+        imports=extract_imports(root_node, source_code),
+        classes=[],
+        interfaces=[],
+        object_references=[]
+    )
     
     # 클래스 및 인터페이스 정보
     for node in root_node.children:
         if node.type == 'class_declaration':
-            # 클래스 이름 추출
-            name_node = next((child for child in node.children if child.type == 'identifier'), None)
-            if name_node:
-                class_name = get_node_text(name_node, source_code)
-                
-                # 클래스 정보 구성
-                class_info = {
-                    'name': class_name,
-                    'extends': extract_class_extends(node, source_code),
-                    'implements': extract_class_implements(node, source_code),
-                    'fields': extract_class_fields(node, source_code),
-                    'methods': extract_class_methods(node, source_code)
-                }
-                
+            class_info = extract_class_info(node, source_code, body_ranges=body_ranges)
+            if class_info:
                 # 객체 참조 정보 추가
-                for method_info in class_info['methods']:
-                    for ref_obj in method_info.get('referenced_objects', []):
-                        if ref_obj != class_name:  # 자기 자신 참조 제외
-                            info['object_references'].append({
-                                'class': class_name,
-                                'method': method_info['name'],
-                                'referenced_object': ref_obj
-                            })
+                add_object_references(info, class_info)
                 
                 info['classes'].append(class_info)
                 
         elif node.type == 'interface_declaration':
-            # 인터페이스 이름 추출
-            name_node = next((child for child in node.children if child.type == 'identifier'), None)
-            if name_node:
-                interface_name = get_node_text(name_node, source_code)
-                
-                # 인터페이스 정보 구성
-                interface_info = {
-                    'name': interface_name,
-                    'extends': extract_interface_extends(node, source_code),
-                    'methods': extract_interface_methods(node, source_code)
-                }
-                
+            interface_info = extract_interface_info(node, source_code)
+            if interface_info:
                 info['interfaces'].append(interface_info)
     
     return info
 
-def process_java_file(file_path):
+# 이 크기 이상인 파일은 mmap으로 열어 추가 복사 없이 파싱
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
+# 사용 가능한 AST 정보 추출 엔진
+EXTRACTORS = ('walk', 'cursor', 'query')
+
+def get_extractor(name):
+    """이름에 해당하는 AST 정보 추출 함수를 반환합니다."""
+    if name == 'walk':
+        return extract_ast_info
+    if name == 'cursor':
+        from java_ast_cursor import extract_ast_info_cursor
+        return extract_ast_info_cursor
+    if name == 'query':
+        from java_ast_query import extract_ast_info_query
+        return extract_ast_info_query
+    raise ValueError(f"알 수 없는 추출 엔진입니다: {name}")
+
+def extract_file_info(tree, source_code, extractor='walk', body_ranges=False):
+    """파싱된 트리에서 AST 정보(FileInfo)와 메서드 호출 지점(calls), 파일 내용 해시(source_hash)를 추출합니다.
+    
+    source_hash는 호출 지점 사이드카의 키이자 --body-ranges 본문 조회의 검증 값입니다.
+    body_ranges면 메서드 본문 텍스트 대신 body_range만 기록하고,
+    본문에서 파생되는 메서드별 참조 목록은 object_references만 남기고 지웁니다.
+    """
+    from call_graph import extract_method_calls
+    info = as_file_info(get_extractor(extractor)(tree, source_code, body_ranges))
+    info['calls'] = extract_method_calls(tree, source_code)
+    info['source_hash'] = content_hash(source_code)
+    if body_ranges:
+        drop_method_references(info)
+    return info
+
+def parse_and_extract(source_code, java_parser, extractor='walk', body_ranges=False):
+    """소스 버퍼 전체를 한 번에 넘겨 파싱하고 AST 정보를 추출합니다."""
+    tree = java_parser.parse(source_code)
+    return extract_file_info(tree, source_code, extractor, body_ranges)
+
+def process_java_file(file_path, java_parser=None, mmap_threshold=MMAP_THRESHOLD, extractor='walk', body_ranges=False):
     """Java 파일을 처리하여 AST 정보를 추출합니다."""
+    if java_parser is None:
+        java_parser = get_thread_parser()
     try:
-        # 파일 읽기
         with open(file_path, 'rb') as file:
-            source_code = file.read()
-        
-        # aa.py 스타일의 파싱 방식 적용
-        def read_callable_byte_offset(byte_offset, point):
-            return source_code[byte_offset : byte_offset + 1]
+            file_size = os.fstat(file.fileno()).st_size
             
-        # 새로운 방식으로 파싱
-        tree = parser.parse(read_callable_byte_offset, encoding="utf8")
+            if mmap_threshold is not None and 0 < mmap_threshold <= file_size:
+                # 큰 파일은 mmap 버퍼를 그대로 파서에 전달
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source_code:
+                    ast_info = parse_and_extract(source_code, java_parser, extractor, body_ranges)
+            else:
+                ast_info = parse_and_extract(file.read(), java_parser, extractor, body_ranges)
         
-        # AST 정보 추출
-        ast_info = extract_ast_info(tree, source_code)
         ast_info['path'] = file_path
         return ast_info
     except Exception as e:
         print(f"파싱 에러 ({file_path}): {e}")
-        return {'path': file_path, 'error': str(e)}
+        return FileInfo(path=file_path, error=str(e))
+
+# 프로세스 워커마다 한 번만 생성되는 Parser
+_worker_parser = None
+
+def _init_parse_worker():
+    """프로세스 워커 초기화 시 Parser를 한 번만 생성합니다."""
+    global _worker_parser
+    _worker_parser = create_parser()
+
+def _parse_chunk(chunk, extractor='walk', body_ranges=False):
+    """워커 프로세스에서 (인덱스, 파일 경로) 묶음을 파싱합니다."""
+    return [(index, process_java_file(file_path, _worker_parser, extractor=extractor, body_ranges=body_ranges))
+            for index, file_path in chunk]
+
+def _file_size(java_files, index, file_sizes=None):
+    if file_sizes is not None:
+        # 파일 탐색 단계에서 구한 크기를 그대로 사용 (stat 재호출 없음)
+        return file_sizes[index]
+    try:
+        return os.path.getsize(java_files[index])
+    except OSError:
+        return 0
+
+def make_balanced_chunks(java_files, chunk_count, file_sizes=None):
+    """파일 크기 합이 비슷하도록 (인덱스, 파일 경로) 청크를 나눕니다."""
+    sized_files = [(_file_size(java_files, index, file_sizes), index, file_path)
+                   for index, file_path in enumerate(java_files)]
+    
+    # 큰 파일부터 현재 가장 가벼운 청크에 배정 (LPT 방식)
+    sized_files.sort(key=lambda item: (-item[0], item[1]))
+    chunk_count = max(1, min(chunk_count, len(sized_files)))
+    chunks = [[] for _ in range(chunk_count)]
+    heap = [(0, chunk_index) for chunk_index in range(chunk_count)]
+    
+    for size, index, file_path in sized_files:
+        total, chunk_index = heapq.heappop(heap)
+        chunks[chunk_index].append((index, file_path))
+        heapq.heappush(heap, (total + size, chunk_index))
+    
+    return [chunk for chunk in chunks if chunk]
+
+def _parse_indexed(index, file_path, extractor='walk', body_ranges=False):
+    """현재 스레드의 Parser로 파일을 파싱해 (인덱스, 결과)를 반환합니다."""
+    return index, process_java_file(file_path, extractor=extractor, body_ranges=body_ranges)
+
+def make_sequential_chunks(java_files, max_chunk_bytes, file_sizes=None):
+    """파일 순서대로 크기 합이 max_chunk_bytes를 넘지 않게 (크기 합, [(인덱스, 파일 경로)]) 청크를 만듭니다."""
+    chunk = []
+    chunk_bytes = 0
+    for index, file_path in enumerate(java_files):
+        size = _file_size(java_files, index, file_sizes)
+        if chunk and chunk_bytes + size > max_chunk_bytes:
+            yield chunk_bytes, chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append((index, file_path))
+        chunk_bytes += size
+    if chunk:
+        yield chunk_bytes, chunk
+
+def iter_bounded_jobs(executor, jobs, max_in_flight_bytes):
+    """(크기, 함수, 인자...) 작업을 진행 중인 크기 합이 한도 안에 있을 때만 제출하고 끝나는 순서대로 (작업, 결과)를 반환합니다.
+    
+    소비하는 쪽이 느리면 다음 작업을 제출하지 않으므로 끝난 결과가 메모리에 쌓이지 않습니다 (한도보다 큰 작업은 하나씩 실행).
+    """
+    jobs = iter(jobs)
+    job = next(jobs, None)
+    pending = {}
+    in_flight = 0
+    while job is not None or pending:
+        while job is not None and (not pending or in_flight + job[0] <= max_in_flight_bytes):
+            pending[executor.submit(*job[1:])] = job
+            in_flight += job[0]
+            job = next(jobs, None)
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        # 함께 끝난 작업은 제출 순서대로 반환
+        for future in [future for future in pending if future in done]:
+            finished = pending.pop(future)
+            in_flight -= finished[0]
+            yield finished, future.result()
+
+def iter_files_in_processes(java_files, max_workers, chunks_per_worker=4, extractor='walk', file_sizes=None,
+                            body_ranges=False, max_in_flight_bytes=None):
+    """ProcessPoolExecutor로 파일을 병렬 파싱하고 청크가 끝나는 순서대로 (인덱스, 결과)를 반환합니다.
+    
+    max_in_flight_bytes가 주어지면 파일 순서대로 나눈 작은 청크를 소스 크기 합이 한도 안에서만 제출합니다.
+    """
+    if max_in_flight_bytes:
+        chunks = make_sequential_chunks(java_files, max(1, max_in_flight_bytes // (max_workers * 2)), file_sizes)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_parse_worker) as executor:
+            jobs = ((chunk_bytes, _parse_chunk, chunk, extractor, body_ranges) for chunk_bytes, chunk in chunks)
+            for job, results in iter_bounded_jobs(executor, jobs, max_in_flight_bytes):
+                print(f"파싱 중: {job[2][-1][0] + 1}/{len(java_files)}번째 파일까지의 청크 완료")
+                yield from results
+        return
+    
+    chunks = make_balanced_chunks(java_files, max_workers * chunks_per_worker, file_sizes)
+    done = 0
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_parse_worker) as executor:
+        futures = {executor.submit(_parse_chunk, chunk, extractor, body_ranges) for chunk in chunks}
+        for future in as_completed(futures):
+            # 소비한 결과를 바로 놓아주기 위해 future 참조 제거
+            futures.discard(future)
+            done += 1
+            print(f"파싱 중: 청크 {done}/{len(chunks)} 완료")
+            yield from future.result()
+
+def parse_files_in_processes(java_files, max_workers, chunks_per_worker=4, extractor='walk', file_sizes=None):
+    """ProcessPoolExecutor로 파일을 병렬 파싱하고 입력 순서대로 결과를 반환합니다."""
+    results = [None] * len(java_files)
+    for index, ast_info in iter_files_in_processes(java_files, max_workers, chunks_per_worker, extractor, file_sizes):
+        results[index] = ast_info
+    return results
+
+def iter_files_in_threads(java_files, max_workers, extractor='walk', body_ranges=False, max_in_flight_bytes=None,
+                          file_sizes=None):
+    """ThreadPoolExecutor로 파일을 동시에 파싱하고 끝나는 순서대로 (인덱스, 결과)를 반환합니다.
+    
+    max_in_flight_bytes가 주어지면 소스 크기 합이 한도 안에 있는 파일만 동시에 제출합니다.
+    """
+    if max_in_flight_bytes:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            jobs = ((_file_size(java_files, i, file_sizes), _parse_indexed, i, file_path, extractor, body_ranges)
+                    for i, file_path in enumerate(java_files))
+            for done, (job, result) in enumerate(iter_bounded_jobs(executor, jobs, max_in_flight_bytes), 1):
+                print(f"파싱 중: {job[3]} ({done}/{len(java_files)})")
+                yield result
+        return
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(process_java_file, file_path, extractor=extractor, body_ranges=body_ranges): i
+                   for i, file_path in enumerate(java_files)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures.pop(future)
+            print(f"파싱 중: {java_files[i]} ({done}/{len(java_files)})")
+            yield i, future.result()
+
+def parse_files_in_threads(java_files, max_workers, extractor='walk'):
+    """ThreadPoolExecutor로 파일을 동시에 파싱하고 입력 순서대로 결과를 반환합니다."""
+    results = [None] * len(java_files)
+    for i, ast_info in iter_files_in_threads(java_files, max_workers, extractor):
+        results[i] = ast_info
+    return results
 
-def analyze_java_project(project_path, output_json=None, max_workers=4):
-    """Java 프로젝트를 분석합니다."""
-    java_files = find_java_files(project_path)
+def iter_parsed_files(java_files, max_workers=4, engine='process', extractor='walk', cache_path=None,
+                      file_sizes=None, body_ranges=False, max_in_flight_bytes=None):
+    """Java 파일들을 파싱해 끝나는 순서대로 (인덱스, 결과)를 반환합니다 (파스 캐시 적중 파일이 먼저 나옴).
+    
+    max_in_flight_bytes가 주어지면 동시에 파싱 중인 소스 크기 합을 한도 안으로 제한합니다.
+    """
+    namespace = RANGE_CACHE_NAMESPACE if body_ranges else CACHE_NAMESPACE
+    cache = ParseCache(cache_path, namespace) if cache_path else None
+    try:
+        # 파스 캐시 조회 (내용이 바뀌지 않은 파일은 파싱하지 않음)
+        cache_keys = {}
+        pending = []
+        for i, file_path in enumerate(java_files):
+            if cache:
+                cache_keys[i], ast_info = cache.lookup_file(file_path)
+                if ast_info is not None:
+                    yield i, as_file_info(ast_info)
+                    continue
+            pending.append(i)
+        
+        pending_files = [java_files[i] for i in pending]
+        pending_sizes = [file_sizes[i] for i in pending] if file_sizes is not None else None
+        
+        # 병렬 파싱
+        if engine == 'process' and max_workers > 1 and len(pending_files) > 1:
+            parsed = iter_files_in_processes(pending_files, max_workers, extractor=extractor, file_sizes=pending_sizes,
+                                             body_ranges=body_ranges, max_in_flight_bytes=max_in_flight_bytes)
+        else:
+            parsed = iter_files_in_threads(pending_files, max_workers, extractor=extractor, body_ranges=body_ranges,
+                                           max_in_flight_bytes=max_in_flight_bytes, file_sizes=pending_sizes)
+        
+        for j, ast_info in parsed:
+            i = pending[j]
+            if cache:
+                cache.put(cache_keys.pop(i), ast_info.to_dict())
+            yield i, ast_info
+        
+        if cache:
+            print(cache.summary())
+    finally:
+        if cache:
+            cache.close()
+
+def parse_java_files(java_files, max_workers=4, engine='process', extractor='walk', cache_path=None,
+                     file_sizes=None, body_ranges=False):
+    """Java 파일들을 파싱해 파일 순서대로 결과를 반환합니다 (파스 캐시 적중 파일은 건너뜀)."""
+    results = [None] * len(java_files)
+    for i, ast_info in iter_parsed_files(java_files, max_workers, engine, extractor, cache_path, file_sizes,
+                                         body_ranges):
+        results[i] = ast_info
+    return results
+
+def analyze_java_project(project_path, output_json=None, max_workers=4, engine='process', extractor='walk',
+                         cache_path=None, previous_json=None, base_revision=None, discovery_options=None,
+                         impact_index=False, dependency_cycles=False, output_options=None, body_options=None,
+                         memory_budget=None):
+    """Java 프로젝트를 분석합니다 (previous_json이 주어지면 git 변경 파일만 다시 분석).
+    
+    output_options에 shard_by가 있으면 output_json 디렉토리에 샤드와 manifest.json을 저장합니다.
+    body_options에 body_ranges가 있으면 메서드 본문 대신 범위와 소스 해시만 기록하고,
+    source_store가 있으면 해당 디렉토리(내용 주소 저장소)에 소스를 보관합니다.
+    memory_budget(MB)이 주어지면 analyze_java_project_bounded로 단계별 스트림 분석을 수행합니다.
+    """
+    if previous_json:
+        return analyze_java_project_incremental(project_path, previous_json, base_revision, output_json,
+                                                max_workers, engine, extractor, cache_path, discovery_options,
+                                                impact_index, dependency_cycles, output_options, body_options)
+    if memory_budget:
+        if (output_options or {}).get('shard_by') or (output_json and is_binary_path(output_json)):
+            print("샤드/바이너리 출력은 전체 결과가 필요해 메모리 예산 없이 분석합니다.")
+        else:
+            return analyze_java_project_bounded(project_path, output_json, max_workers, engine, extractor, cache_path,
+                                                discovery_options, impact_index, dependency_cycles, body_options,
+                                                memory_budget, output_options)
+    body_options = body_options or {}
+    
+    # scandir 기반 탐색 (무시 디렉토리/.gitignore 가지치기, 경로순 정렬, 파일 크기 포함)
+    discovered = discover_java_files(project_path, **(discovery_options or {}))
+    java_files = [file_path for file_path, _ in discovered]
+    file_sizes = [size for _, size in discovered]
     print(f"총 {len(java_files)}개의 Java 파일을 찾았습니다.")
     
     project_structure = {
@@ -338,153 +789,453 @@ def analyze_java_project(project_path, output_json=None, max_workers=4):
         'files': {}
     }
     
-    # 병렬 처리를 통한 성능 개선
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for i, file_path in enumerate(java_files):
-            relative_path = os.path.relpath(file_path, project_path)
-            print(f"파싱 중: {relative_path} ({i+1}/{len(java_files)})")
-            
-            project_structure['files'][relative_path] = executor.submit(process_java_file, file_path).result()
-    
-    # 관계 분석
-    analyze_relationships(project_structure)
+    # .ndjson 출력은 파일별 레코드를 파싱 즉시 기록하고, 관계 분석용 정보(메서드 본문 제외)만 메모리에 유지
+    keep_call_sites = (output_options or {}).get('call_sites', False)
+    # 결과에서 빼는 호출 지점은 다음 증분 분석을 위해 사이드카에 보관
+    call_sidecar = call_sites_path(output_json) if output_json and not keep_call_sites else None
+    streaming = output_json and is_ndjson_path(output_json) and not (output_options or {}).get('shard_by')
+    writer = NdjsonAnalysisWriter(output_json, project_path, keep_call_sites) if streaming else None
+    try:
+        project_structure['files'] = collect_parsed_files(project_path, java_files, max_workers, engine, extractor,
+                                                          cache_path, file_sizes, writer,
+                                                          body_options.get('body_ranges', False))
+        store_sources(project_structure, body_options.get('source_store'))
+        analyze_parsed_project(project_structure, impact_index, dependency_cycles, keep_call_sites or bool(call_sidecar),
+                               (output_options or {}).get('impact_closure'))
+        if call_sidecar:
+            write_call_sites(project_structure, call_sidecar)
+        
+        if writer:
+            writer.write_relationships(project_structure)
+            writer.write_trailer(project_structure)
+            print(f"프로젝트 구조가 {output_json}에 스트림으로 저장되었습니다.")
+    finally:
+        if writer:
+            writer.close()
     
-    # 객체 참조 관계 추가 분석
-    analyze_object_references(project_structure)
-    
-    # JSON으로 저장
-    if output_json:
-        with open(output_json, 'w', encoding='utf-8') as f:
-            json.dump(project_structure, f, indent=2, ensure_ascii=False)
-        print(f"프로젝트 구조가 {output_json}에 저장되었습니다.")
+    if output_json and not writer:
+        saved_path = write_output(project_structure, output_json, output_options)
+        print(f"프로젝트 구조가 {saved_path}에 저장되었습니다.")
     
     return project_structure
 
-def analyze_relationships(project_structure):
-    """파일 간의 관계를 분석합니다."""
-    # 클래스 맵 구성 (클래스 이름 -> 파일 경로)
-    class_map = {}
+def collect_parsed_files(project_path, java_files, max_workers=4, engine='process', extractor='walk', cache_path=None,
+                         file_sizes=None, writer=None, body_ranges=False):
+    """파일들을 파싱해 (상대 경로 -> 파일 정보)를 파일 순서대로 반환합니다 (writer가 있으면 파싱 즉시 기록)."""
+    relative_paths = [os.path.relpath(file_path, project_path) for file_path in java_files]
+    results = [None] * len(java_files)
+    for i, ast_info in iter_parsed_files(java_files, max_workers, engine, extractor, cache_path, file_sizes,
+                                         body_ranges):
+        if writer:
+            writer.write_file(relative_paths[i], ast_info)
+            ast_info = as_file_info(compact_file_info(ast_info))
+        results[i] = ast_info
+    return dict(zip(relative_paths, results))
+
+def store_sources(project_structure, source_store):
+    """범위만 기록한 파일들의 소스를 내용 주소 저장소에 보관합니다 (source_store가 없으면 건너뜀)."""
+    if not source_store:
+        return
+    from source_store import SourceStore, store_project_sources
+    stored = store_project_sources(project_structure, SourceStore(source_store))
+    print(f"소스 {stored}개를 {source_store}에 보관했습니다.")
+
+def analyze_java_project_bounded(project_path, output_json=None, max_workers=4, engine='process', extractor='walk',
+                                 cache_path=None, discovery_options=None, impact_index=False, dependency_cycles=False,
+                                 body_options=None, memory_budget=256, output_options=None):
+    """메모리 예산(MB) 안에서 탐색/파싱/직렬화/관계 분석 단계를 이어 프로젝트를 분석합니다.
     
-    for file_path, file_info in project_structure['files'].items():
-        if 'error' in file_info:
-            continue
-            
-        package = file_info.get('package', '')
-        
-        for class_info in file_info.get('classes', []):
-            full_class_name = f"{package}.{class_info['name']}" if package else class_info['name']
-            class_map[full_class_name] = file_path
-            # 짧은 클래스 이름도 맵에 추가 (패키지 없이)
-            class_map[class_info['name']] = file_path
-            
-        for interface_info in file_info.get('interfaces', []):
-            full_interface_name = f"{package}.{interface_info['name']}" if package else interface_info['name']
-            class_map[full_interface_name] = file_path
-            class_map[interface_info['name']] = file_path
+    파싱 결과는 유한 큐를 거쳐 디스크(.json 출력은 임시 파일, .ndjson 출력은 출력 파일 자체)에 기록하고,
+    관계 분석용 심볼 항목만 메모리에 유지한 뒤 파일 순서대로 레코드를 다시 읽어 관계를 해석하며 저장합니다.
+    출력은 일반 분석과 같은 내용이며, 반환하는 project_structure의 files에는 심볼 항목만 담깁니다.
+    """
+    from analysis_pipeline import (
+        NdjsonSpill, RecordSpill, SpillStage, keep_relationships, parse_budget_bytes, resident_sizes, symbol_entry
+    )
+    from call_graph import analyze_file_method_calls, build_method_index
+    body_options = body_options or {}
+    output_options = output_options or {}
+    keep_call_sites = output_options.get('call_sites', False)
     
-    # 의존성 분석
-    for file_path, file_info in project_structure['files'].items():
-        if 'error' in file_info:
-            continue
-            
-        dependencies = []
+    # 탐색 단계 (경로와 크기만 유지)
+    discovered = discover_java_files(project_path, **(discovery_options or {}))
+    java_files = [file_path for file_path, _ in discovered]
+    file_sizes = [size for _, size in discovered]
+    relative_paths = [os.path.relpath(file_path, project_path) for file_path in java_files]
+    del discovered
+    print(f"총 {len(java_files)}개의 Java 파일을 찾았습니다.")
+    
+    max_in_flight_bytes = parse_budget_bytes(memory_budget)
+    print(f"메모리 예산 {memory_budget}MB: 동시에 파싱하는 소스 최대 {max_in_flight_bytes // 1024}KB")
+    
+    streaming = output_json and is_ndjson_path(output_json)
+    if streaming:
+        writer = NdjsonAnalysisWriter(output_json, project_path, keep_call_sites)
+        spill = NdjsonSpill(writer, len(java_files))
+    else:
+        writer = JsonAnalysisWriter(output_json, project_path) if output_json else None
+        spill = RecordSpill(len(java_files))
+    call_sidecar = None
+    
+    try:
+        # 파싱 -> 직렬화 단계 (큐가 차면 파싱 결과 소비가 멈추고, 진행 중인 파싱도 한도 안에서만 제출)
+        entries = [None] * len(java_files)
+        stage = SpillStage(spill)
+        try:
+            for i, ast_info in iter_parsed_files(java_files, max_workers, engine, extractor, cache_path, file_sizes,
+                                                 body_options.get('body_ranges', False), max_in_flight_bytes):
+                entries[i] = symbol_entry(ast_info)
+                stage.put(i, relative_paths[i], ast_info)
+        finally:
+            stage.finish()
         
-        # 임포트 의존성 (내부 프로젝트 내 임포트만 포함)
-        for import_path in file_info.get('imports', []):
-            # 프로젝트 내부 임포트인지 확인
-            is_internal = False
-            
-            # 패키지의 일부만 있는 경우 체크
-            for class_name in class_map.keys():
-                if import_path.endswith(class_name) or class_name in import_path.split('.'):
-                    is_internal = True
-                    break
-            
-            if is_internal or import_path in class_map:
-                dependency = {'type': 'import', 'target': import_path}
-                
-                # 임포트된 클래스가 프로젝트 내에 있는지 확인
-                if import_path in class_map:
-                    dependency['file'] = class_map[import_path]
-                    
-                dependencies.append(dependency)
+        project_structure = {
+            'project_path': project_path,
+            'files': dict(zip(relative_paths, entries))
+        }
+        del entries
         
-        # 상속 의존성
-        for class_info in file_info.get('classes', []):
-            if class_info.get('extends'):
-                dependency = {'type': 'extends', 'target': class_info['extends']}
-                
-                if class_info['extends'] in class_map:
-                    dependency['file'] = class_map[class_info['extends']]
-                    
-                dependencies.append(dependency)
-            
-            # 구현 의존성
-            for interface in class_info.get('implements', []):
-                dependency = {'type': 'implements', 'target': interface}
-                
-                if interface in class_map:
-                    dependency['file'] = class_map[interface]
-                    
-                dependencies.append(dependency)
+        revision = get_head_revision(project_path)
+        if revision:
+            project_structure['git_revision'] = revision
+        
+        # 관계 분석 단계 (심볼 항목으로 만든 테이블/메서드 인덱스로 파일 레코드를 하나씩 해석해 기록)
+        symbol_table = ProjectSymbolTable(project_structure)
+        method_index = build_method_index(project_structure, symbol_table)
+        source_store = body_options.get('source_store')
+        if source_store:
+            from source_store import SourceStore
+            source_store = SourceStore(source_store)
+        stored = 0
+        keep = impact_index or dependency_cycles
+        if output_json and not keep_call_sites:
+            call_sidecar = CallSiteWriter(call_sites_path(output_json))
+        
+        for i, (file_path, entry) in enumerate(project_structure['files'].items()):
+            file_info = spill.read(i)
+            if 'error' not in file_info:
+                analyze_file_dependencies(file_info, symbol_table)
+                if 'object_references' in file_info:
+                    analyze_file_object_references(file_info, symbol_table)
+                if 'calls' in file_info:
+                    analyze_file_method_calls(file_info, symbol_table, method_index, True)
+                    if call_sidecar:
+                        call_sidecar.write(file_info.get('source_hash'), file_info['calls'])
+                    if not keep_call_sites:
+                        file_info.pop('calls')
+            if source_store and file_info.get('source_hash'):
+                if source_store.put_file(os.path.join(project_path, file_path), file_info['source_hash']):
+                    stored += 1
+            if streaming:
+                writer.write_file_relationships(file_path, file_info)
+            elif writer:
+                writer.write_file(file_path, file_info)
+            if keep:
+                keep_relationships(entry, file_info)
+        if source_store:
+            print(f"소스 {stored}개를 {source_store.root}에 보관했습니다.")
         
-        file_info['dependencies'] = dependencies
+        # 예산과 별개로 파일/타입 수에 비례해 남는 구조 (analysis_pipeline 모듈 설명 참고)
+        resident = resident_sizes(project_structure, symbol_table, method_index, spill,
+                                  (java_files, file_sizes, relative_paths))
+        print(f"예산과 별개로 상주하는 구조 합계 {sum(resident.values()) / 1024 / 1024:.1f}MB (" +
+              ", ".join(f"{name} {size / 1024 / 1024:.1f}MB" for name, size in resident.items()) + ")")
+        
+        # 전이적 의존/영향 인덱스와 의존 순환 (심볼 항목에 옮겨 둔 관계 결과로 계산)
+        if impact_index:
+            from dependency_closure import add_impact_index
+            add_impact_index(project_structure, symbol_table, output_options.get('impact_closure'))
+        if dependency_cycles:
+            from dependency_scc import analyze_dependency_cycles
+            analyze_dependency_cycles(project_structure)
+        
+        if writer:
+            writer.write_trailer(project_structure)
+            print(f"프로젝트 구조가 {output_json}에 스트림으로 저장되었습니다.")
+    finally:
+        spill.close()
+        if call_sidecar:
+            call_sidecar.close()
+        if writer:
+            writer.close()
+    
+    return project_structure
+
+def restore_raw_object_references(file_info):
+    """분석이 끝난 파일 정보의 메서드 참조 목록으로 해석 전 object_references를 복원합니다."""
+    file_info['object_references'] = []
+    for class_info in file_info.get('classes', []):
+        add_object_references(file_info, class_info)
+
+def _source_matches(file_path, source_hash):
+    """파일의 현재 내용 해시가 source_hash와 같은지 확인합니다."""
+    try:
+        with open(file_path, 'rb') as f:
+            return content_hash(f.read()) == source_hash
+    except OSError:
+        return False
 
-def analyze_object_references(project_structure):
-    """객체 참조 관계를 분석합니다."""
-    # 클래스 맵 구성 (클래스 이름 -> 파일 경로)
-    class_map = {}
+def _file_uses_names(file_info, names, packages):
+    """파일의 임포트/상속/구현/객체 참조가 주어진 이름 인덱스(SymbolIndex)나 패키지 중 하나에 걸리는지 확인합니다."""
+    for import_path in file_info.get('imports', []):
+        if import_path.endswith('.*') and import_path[:-2] in packages:
+            return True
+        if names.is_internal_import(import_path):
+            return True
     
-    for file_path, file_info in project_structure['files'].items():
-        if 'error' in file_info:
-            continue
-            
-        package = file_info.get('package', '')
-        
-        for class_info in file_info.get('classes', []):
-            full_class_name = f"{package}.{class_info['name']}" if package else class_info['name']
-            class_map[full_class_name] = file_path
-            class_map[class_info['name']] = file_path
-            
-        for interface_info in file_info.get('interfaces', []):
-            full_interface_name = f"{package}.{interface_info['name']}" if package else interface_info['name']
-            class_map[full_interface_name] = file_path
-            class_map[interface_info['name']] = file_path
+    for class_info in file_info.get('classes', []):
+        if class_info.get('extends') in names or any(name in names for name in class_info.get('implements', [])):
+            return True
+        for method_info in class_info.get('methods', []):
+            if any(ref_obj in names for ref_obj in method_info.get('referenced_objects', [])):
+                return True
+    
+    return False
+
+def analyze_java_project_incremental(project_path, previous, base_revision=None, output_json=None,
+                                     max_workers=4, engine='process', extractor='walk', cache_path=None,
+                                     discovery_options=None, impact_index=False, dependency_cycles=False,
+                                     output_options=None, body_options=None):
+    """이전 분석 결과와 git 변경 내역으로 변경된 파일만 다시 분석합니다."""
+    previous_path = None
+    if not isinstance(previous, dict):
+        previous_path = previous
+        previous = load_analysis(previous)
+    
+    # 이전 결과도 새로 파싱한 파일과 같은 모델로 보관
+    previous['files'] = {path: as_file_info(file_info) for path, file_info in previous['files'].items()}
+    
+    base_revision = base_revision or previous.get('git_revision')
+    if not base_revision:
+        print("기준 리비전이 없어 전체 분석을 수행합니다.")
+        return analyze_java_project(project_path, output_json, max_workers, engine, extractor, cache_path,
+                                    discovery_options=discovery_options, impact_index=impact_index,
+                                    dependency_cycles=dependency_cycles, output_options=output_options,
+                                    body_options=body_options)
+    
+    try:
+        changed, deleted = get_changed_java_files(project_path, base_revision)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"git 변경 내역을 가져오지 못해 전체 분석을 수행합니다: {e}")
+        return analyze_java_project(project_path, output_json, max_workers, engine, extractor, cache_path,
+                                    discovery_options=discovery_options, impact_index=impact_index,
+                                    dependency_cycles=dependency_cycles, output_options=output_options,
+                                    body_options=body_options)
+    
+    print(f"{base_revision} 이후 변경된 Java 파일 {len(changed)}개, 삭제된 파일 {len(deleted)}개")
+    
+    old_files = previous['files']
+    old_bindings = ProjectSymbolTable(previous).bindings()
+    
+    # 변경된 파일만 다시 파싱 (전체 분석과 같은 탐색 규칙으로 제외되는 파일은 삭제로 취급)
+    options = discovery_options or {}
+    gitignore_cache = {}
+    excluded = {path for path in changed
+                if is_ignored_path(project_path, path, options.get('ignored_dirs', DEFAULT_IGNORED_DIRS),
+                                   options.get('use_gitignore', True), gitignore_cache,
+                                   options.get('build_dirs', DEFAULT_BUILD_DIRS))}
+    deleted = deleted | excluded
+    changed = sorted(path for path in changed - excluded if os.path.isfile(os.path.join(project_path, path)))
+    body_options = body_options or {}
+    results = parse_java_files([os.path.join(project_path, path) for path in changed],
+                               max_workers, engine, extractor, cache_path,
+                               body_ranges=body_options.get('body_ranges', False))
+    
+    files = {path: file_info for path, file_info in old_files.items()
+             if path not in deleted and path not in changed}
+    files.update(zip(changed, results))
+    new_paths = set(changed)
+    
+    # 이전 결과에 호출 지점(calls)이 없는 파일은 method_calls를 그대로 쓰되, 변경/삭제 파일의 선언이 바뀌었으면
+    # 바뀐 멤버 이름을 호출하는 파일(타입/상위 타입이 바뀌었으면 모든 파일)만 사이드카에서 호출 지점을 되살려 다시 해석
+    # (사이드카에 없거나 내용 해시가 다른 파일만 다시 파싱)
+    from call_graph import analyze_method_calls, calls_use_names, changed_call_members
+    call_sites = load_call_sites(call_sites_path(previous_path)) if previous_path else {}
+    changed_members, structural = changed_call_members(old_files, files, set(changed) | deleted)
+    restored = []
+    reparsed = []
+    if changed_members or structural:
+        for path, file_info in files.items():
+            if path in new_paths or 'error' in file_info or 'calls' in file_info:
+                continue
+            calls = call_sites.get(file_info.get('source_hash'))
+            if calls is not None and not structural and not calls_use_names(calls, changed_members):
+                continue
+            if calls is not None and _source_matches(os.path.join(project_path, path), file_info['source_hash']):
+                file_info['calls'] = calls
+                restored.append(path)
+            else:
+                reparsed.append(path)
+    if restored:
+        print(f"선언이 바뀌어 호출 지점을 사이드카에서 복원해 다시 해석할 파일 {len(restored)}개")
+    if reparsed:
+        print(f"선언이 바뀌어 호출 지점을 복원할 파일 {len(reparsed)}개를 다시 파싱합니다.")
+        files.update(zip(reparsed, parse_java_files([os.path.join(project_path, path) for path in reparsed],
+                                                    max_workers, engine, extractor, cache_path,
+                                                    body_ranges=body_options.get('body_ranges', False))))
+    
+    # 전체 분석과 같은 순서(절대 경로 정렬)로 병합해야 클래스 맵이 동일하게 구성됨
+    project_structure = {
+        'project_path': project_path,
+        'files': {path: files[path] for path in sorted(files, key=lambda path: os.path.join(project_path, path))}
+    }
+    revision = get_head_revision(project_path)
+    if revision:
+        project_structure['git_revision'] = revision
+    store_sources(project_structure, body_options.get('source_store'))
+    
+    # 클래스 맵에서 추가/삭제/이동된 이름에 걸리는 파일만 관계를 다시 계산
+    symbol_table = ProjectSymbolTable(project_structure)
+    bindings = symbol_table.bindings()
+    changed_names = {name for name in set(old_bindings) | set(bindings)
+                     if old_bindings.get(name) != bindings.get(name)}
+    changed_index = SymbolIndex(dict.fromkeys(changed_names))
+    changed_packages = {name.rpartition('.')[0] for name in changed_names}
+    
+    affected = set(changed) | set(reparsed)
+    
+    # 메서드별 참조 목록이 없는 파일(--body-ranges 결과)은 어떤 이름을 쓰는지 알 수 없으므로 클래스 맵이 바뀌면 다시 파싱
+    stale = []
+    if changed_names:
+        stale = [path for path, file_info in project_structure['files'].items()
+                 if path not in affected and 'error' not in file_info and not has_method_references(file_info)]
+    if stale:
+        print(f"클래스 맵이 바뀌어 참조를 복원할 파일 {len(stale)}개를 다시 파싱합니다.")
+        project_structure['files'].update(zip(stale, parse_java_files(
+            [os.path.join(project_path, path) for path in stale], max_workers, engine, extractor, cache_path,
+            body_ranges=body_options.get('body_ranges', False))))
+        affected.update(stale)
     
-    # 객체 참조 관계 분석
     for file_path, file_info in project_structure['files'].items():
-        if 'error' in file_info or 'object_references' not in file_info:
+        if file_path in affected or 'error' in file_info:
             continue
-            
-        object_references = []
-        
-        for ref in file_info.get('object_references', []):
-            ref_obj = ref['referenced_object']
-            
-            # 내부 프로젝트 객체인지 확인
-            if ref_obj in class_map:
-                object_references.append({
-                    'from_class': ref['class'],
-                    'from_method': ref['method'],
-                    'to_class': ref_obj,
-                    'to_file': class_map[ref_obj]
-                })
-        
-        file_info['object_references'] = object_references
+        if changed_names and _file_uses_names(file_info, changed_index, changed_packages):
+            affected.add(file_path)
+            if 'object_references' in file_info:
+                restore_raw_object_references(file_info)
+    
+    print(f"관계를 다시 계산할 파일 {len(affected)}개")
+    analyze_relationships(project_structure, affected, symbol_table)
+    analyze_object_references(project_structure, affected, symbol_table)
+    
+    # 호출 지점이 있는 파일(변경/다시 파싱/복원한 파일)만 다시 해석 (파싱 없음)
+    keep_call_sites = (output_options or {}).get('call_sites', False)
+    analyze_method_calls(project_structure, symbol_table, keep_call_sites=True)
+    if output_json and not keep_call_sites:
+        # 다시 해석하지 않은 파일의 호출 지점은 이전 사이드카에서 그대로 옮김
+        for file_info in project_structure['files'].values():
+            if 'calls' not in file_info and file_info.get('source_hash') in call_sites:
+                file_info['calls'] = call_sites[file_info['source_hash']]
+        write_call_sites(project_structure, call_sites_path(output_json))
+    elif not keep_call_sites:
+        for file_info in project_structure['files'].values():
+            file_info.pop('calls', None)
+    
+    # 전이적 의존/영향 인덱스 (선택)
+    if impact_index:
+        from dependency_closure import add_impact_index
+        add_impact_index(project_structure, symbol_table, (output_options or {}).get('impact_closure'))
+    
+    # 파일/패키지 수준 의존 순환과 축약 DAG (선택)
+    if dependency_cycles:
+        from dependency_scc import analyze_dependency_cycles
+        analyze_dependency_cycles(project_structure)
+    
+    # 저장 (확장자별 형식 또는 샤드 출력)
+    if output_json:
+        saved_path = write_output(project_structure, output_json, output_options)
+        print(f"프로젝트 구조가 {saved_path}에 저장되었습니다.")
+    
+    return project_structure
 
 if __name__ == "__main__":
-    import sys
+    import argparse
     import time
     
-    if len(sys.argv) < 2:
-        print("사용법: python java_ast_analyzer.py <분석할_프로젝트_경로> [결과_저장_JSON_파일]")
-        sys.exit(1)
+    arg_parser = argparse.ArgumentParser(description="tree-sitter 기반 Java 프로젝트 분석기")
+    arg_parser.add_argument("project_path", help="분석할 프로젝트 경로")
+    arg_parser.add_argument("output_json", nargs="?", default=None, help="결과 저장 파일 (.json, 스트림 .ndjson, 바이너리 .jab)")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                            help="병렬 파싱 워커 수 (기본값: CPU 코어 수)")
+    arg_parser.add_argument("--engine", choices=["process", "thread"], default="process",
+                            help="병렬 파싱 엔진 (기본값: process)")
+    arg_parser.add_argument("--extractor", choices=EXTRACTORS, default="walk",
+                            help="AST 정보 추출 엔진 (walk: 노드별 탐색, cursor: TreeCursor 단일 순회로 가장 빠름, "
+                                 "query: 선언 쿼리 기반 대안 구현으로 walk보다 빠르지 않음)")
+    arg_parser.add_argument("--backend", choices=["tree-sitter", "javalang", "javalang-llm"], default="tree-sitter",
+                            help="파서 백엔드 (javalang 계열은 공통 관계 분석만 적용, 본문/객체 참조/호출 없음)")
+    arg_parser.add_argument("--cache", default=None, metavar="CACHE_DB",
+                            help="파일 내용 해시 기반 파스 캐시(SQLite) 경로")
+    arg_parser.add_argument("--ignore-dir", action="append", default=[], metavar="NAME",
+                            help="탐색에서 제외할 디렉토리 이름 (기본 목록에 추가, 여러 번 지정 가능)")
+    arg_parser.add_argument("--include-dir", action="append", default=[], metavar="NAME",
+                            help="기본 제외 목록에서 뺄 디렉토리 이름 (예: build, 여러 번 지정 가능)")
+    arg_parser.add_argument("--no-default-ignores", action="store_true",
+                            help="기본 제외 디렉토리(VCS/IDE/빌드 산출물)를 쓰지 않고 --ignore-dir만 적용")
+    arg_parser.add_argument("--no-gitignore", action="store_true", help=".gitignore 규칙을 적용하지 않음")
+    arg_parser.add_argument("--discovery-jobs", type=int, default=DEFAULT_DISCOVERY_WORKERS,
+                            help=f"파일 탐색 디렉토리 스캔 스레드 수 (기본값: {DEFAULT_DISCOVERY_WORKERS})")
+    arg_parser.add_argument("--previous", default=None, metavar="PREVIOUS_JSON",
+                            help="이전 분석 결과 JSON (git 변경 파일만 다시 분석)")
+    arg_parser.add_argument("--base", default=None, metavar="REVISION",
+                            help="--previous 분석의 기준 git 리비전 (기본값: 이전 결과의 git_revision)")
+    arg_parser.add_argument("--impact-index", action="store_true",
+                            help="파일/클래스 수준 전이적 의존/영향 인덱스(SCC 축약 DAG)를 결과에 포함")
+    arg_parser.add_argument("--impact-closure", default=None, metavar="FILE",
+                            help="--impact-index의 요소별 도달 비트셋을 미리 계산해 별도 바이너리 파일로 저장 (결과 크기는 그대로)")
+    arg_parser.add_argument("--cycles", action="store_true",
+                            help="파일/패키지 수준 의존 순환(SCC)과 위상 레벨을 결과에 포함")
+    arg_parser.add_argument("--shard-by", choices=["package", "files"], default=None,
+                            help="결과를 output_json 디렉토리에 샤드(패키지별 또는 N개 파일별)와 manifest.json으로 저장")
+    arg_parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                            help=f"--shard-by files일 때 샤드당 파일 수 (기본값: {DEFAULT_SHARD_SIZE})")
+    arg_parser.add_argument("--shard-format", choices=["json", "ndjson", "jab"], default="json",
+                            help="샤드 파일 형식 (기본값: json)")
+    arg_parser.add_argument("--body-ranges", action="store_true",
+                            help="메서드 본문 텍스트 대신 (시작/끝 바이트, 시작/끝 줄)과 파일 소스 해시만 기록 "
+                                 "(본문 부분만 줄고 method_calls 등 관계 분석 결과는 그대로이므로 전체 결과는 본문 비중만큼 줄어듦)")
+    arg_parser.add_argument("--source-store", default=None, metavar="DIR",
+                            help="--body-ranges 결과의 소스를 보관할 내용 주소 저장소 디렉토리 (소스가 바뀌어도 본문 조회 가능)")
+    arg_parser.add_argument("--memory-budget", type=float, default=None, metavar="MB",
+                            help="메모리 예산(MB): 파싱 결과를 디스크로 내려 보내며 단계별로 분석 (.json/.ndjson 출력)")
+    arg_parser.add_argument("--keep-call-sites", action="store_true",
+                            help="해석 전 호출 지점(calls)을 결과에 남김 (기본값: method_calls만 저장)")
+    args = arg_parser.parse_args()
     
-    project_path = sys.argv[1]
-    output_json = sys.argv[2] if len(sys.argv) > 2 else None
+    # 기본 목록(VCS/IDE는 모든 깊이, 빌드 산출물은 프로젝트/모듈 루트 바로 아래)에서 --include-dir를 빼고 --ignore-dir를 더함
+    default_ignored_dirs = set() if args.no_default_ignores else DEFAULT_IGNORED_DIRS - set(args.include_dir)
+    default_build_dirs = set() if args.no_default_ignores else DEFAULT_BUILD_DIRS - set(args.include_dir)
+    discovery_options = {
+        'ignored_dirs': default_ignored_dirs | set(args.ignore_dir),
+        'build_dirs': default_build_dirs,
+        'use_gitignore': not args.no_gitignore,
+        'max_workers': args.discovery_jobs
+    }
+    output_options = {
+        'shard_by': args.shard_by,
+        'shard_size': args.shard_size,
+        'shard_format': args.shard_format,
+        'call_sites': args.keep_call_sites,
+        'impact_closure': args.impact_closure
+    }
     
     start_time = time.time()
-    analyze_java_project(project_path, output_json)
+    if args.backend != "tree-sitter":
+        from parser_backends import analyze_project
+        analyze_project(args.project_path, args.backend, args.output_json, args.jobs, args.cache,
+                        discovery_options, args.impact_index, args.cycles, output_options)
+    else:
+        analyze_java_project(args.project_path, args.output_json, max_workers=args.jobs, engine=args.engine,
+                             extractor=args.extractor, cache_path=args.cache,
+                             previous_json=args.previous, base_revision=args.base,
+                             discovery_options=discovery_options,
+                             impact_index=args.impact_index, dependency_cycles=args.cycles,
+                             output_options=output_options,
+                             body_options={
+                                 'body_ranges': args.body_ranges,
+                                 'source_store': args.source_store
+                             },
+                             memory_budget=args.memory_budget)
     end_time = time.time()
     
-    print(f"분석 완료! 실행 시간: {end_time - start_time:.2f}초") 
\ No newline at end of file
+    print(f"분석 완료! 실행 시간: {end_time - start_time:.2f}초")
@@ -0,0 +1,220 @@
+from java_ast_analyzer import (
+    get_node_text, build_method_references, add_object_references, set_method_body, modifier_keywords,
+    supertype_name, supertype_names, PARAMETER_TYPE_NODES
+)
+from code_model import FileInfo, TypeInfo, MethodInfo, FieldInfo, ParamInfo
+
+# extract_ast_info와 같은 규칙으로 타입 노드를 고르기 위한 노드 타입 집합
+RETURN_TYPE_NODES = ('type_identifier', 'void_type', 'primitive_type')
+FIELD_TYPE_NODES = ('type_identifier', 'primitive_type')
+
+def iter_children(cursor):
+    """커서를 자식 노드로 차례로 옮기며 각 자식을 반환하고, 끝나면 부모로 되돌립니다."""
+    if cursor.goto_first_child():
+        yield cursor.node
+        while cursor.goto_next_sibling():
+            yield cursor.node
+        cursor.goto_parent()
+
+def _first_child_text(cursor, source_code, node_type):
+    """지정한 타입의 첫 번째 자식 노드 텍스트를 반환합니다."""
+    text = None
+    for child in iter_children(cursor):
+        if text is None and child.type == node_type:
+            text = get_node_text(child, source_code)
+    return text
+
+def _visit_import(cursor, source_code):
+    """import_declaration 노드를 한 번 순회하며 임포트 경로를 추출합니다 (와일드카드는 '.*' 포함)."""
+    import_path = None
+    wildcard = False
+    for child in iter_children(cursor):
+        if import_path is None and child.type in ('scoped_identifier', 'identifier'):
+            import_path = get_node_text(child, source_code)
+        elif child.type == 'asterisk':
+            wildcard = True
+    if import_path and wildcard:
+        return import_path + '.*'
+    return import_path
+
+def _visit_formal_parameters(cursor, source_code):
+    """formal_parameters 노드를 한 번 순회하며 파라미터 정보를 추출합니다."""
+    parameters = []
+    for child in iter_children(cursor):
+        if child.type != 'formal_parameter':
+            continue
+
+        param_type = None
+        param_name = None
+        for n in iter_children(cursor):
+            if param_type is None and n.type in PARAMETER_TYPE_NODES:
+                param_type = get_node_text(n, source_code)
+            elif param_name is None and n.type == 'identifier':
+                param_name = get_node_text(n, source_code)
+
+        if param_name and param_type:
+            parameters.append(ParamInfo(
+                name=param_name,
+                type=param_type
+            ))
+    return parameters
+
+def _visit_method(cursor, source_code, with_body, body_ranges=False):
+    """method_declaration 노드를 한 번 순회하며 메서드 정보를 추출합니다."""
+    return_type = None
+    method_name = None
+    parameters = None
+    body_node = None
+
+    for child in iter_children(cursor):
+        node_type = child.type
+        if return_type is None and node_type in RETURN_TYPE_NODES:
+            return_type = get_node_text(child, source_code)
+        elif method_name is None and node_type == 'identifier':
+            method_name = get_node_text(child, source_code)
+        elif parameters is None and node_type == 'formal_parameters':
+            parameters = _visit_formal_parameters(cursor, source_code)
+        elif with_body and body_node is None and node_type == 'block':
+            body_node = child
+
+    if not method_name:
+        return None
+
+    method_info = MethodInfo(
+        name=method_name,
+        return_type=return_type,
+        parameters=parameters or []
+    )
+    if with_body:
+        set_method_body(method_info, body_node, source_code, body_ranges)
+        method_info['referenced_objects'], method_info['references'] = build_method_references(body_node, source_code)
+    return method_info
+
+def _visit_field(cursor, source_code, fields):
+    """field_declaration 노드를 한 번 순회하며 필드 정보를 추가합니다."""
+    field_type = None
+    names = []
+    for child in iter_children(cursor):
+        if field_type is None and child.type in FIELD_TYPE_NODES:
+            field_type = get_node_text(child, source_code)
+        elif child.type == 'variable_declarator':
+            names.append(_first_child_text(cursor, source_code, 'identifier'))
+
+    for field_name in names:
+        if field_name:
+            fields.append(FieldInfo(
+                name=field_name,
+                type=field_type
+            ))
+
+def _visit_class(cursor, source_code, body_ranges=False):
+    """class_declaration 노드를 한 번 순회하며 클래스 정보를 추출합니다."""
+    class_name = None
+    modifiers = []
+    extends = None
+    implements = None
+    fields = []
+    methods = []
+
+    for child in iter_children(cursor):
+        node_type = child.type
+        if class_name is None and node_type == 'identifier':
+            class_name = get_node_text(child, source_code)
+        elif node_type == 'modifiers':
+            modifiers = modifier_keywords(child, source_code)
+        elif extends is None and node_type == 'superclass':
+            extends = next((name for name in (supertype_name(n, source_code) for n in child.children) if name), '')
+        elif implements is None and node_type == 'super_interfaces':
+            implements = supertype_names(child, source_code)
+        elif node_type == 'class_body':
+            for body_child in iter_children(cursor):
+                if body_child.type == 'method_declaration':
+                    method_info = _visit_method(cursor, source_code, with_body=True, body_ranges=body_ranges)
+                    if method_info:
+                        methods.append(method_info)
+                elif body_child.type == 'field_declaration':
+                    _visit_field(cursor, source_code, fields)
+
+    if not class_name:
+        return None
+
+    return TypeInfo(
+        name=class_name,
+        modifiers=modifiers,
+        extends=extends or None,
+        implements=implements or [],
+        fields=fields,
+        methods=methods
+    )
+
+def _visit_interface(cursor, source_code):
+    """interface_declaration 노드를 한 번 순회하며 인터페이스 정보를 추출합니다."""
+    interface_name = None
+    modifiers = []
+    extends = None
+    methods = []
+
+    for child in iter_children(cursor):
+        node_type = child.type
+        if interface_name is None and node_type == 'identifier':
+            interface_name = get_node_text(child, source_code)
+        elif node_type == 'modifiers':
+            modifiers = modifier_keywords(child, source_code)
+        elif extends is None and node_type == 'extends_interfaces':
+            extends = supertype_names(child, source_code)
+        elif node_type == 'interface_body':
+            for body_child in iter_children(cursor):
+                if body_child.type == 'method_declaration':
+                    method_info = _visit_method(cursor, source_code, with_body=False)
+                    if method_info:
+                        methods.append(method_info)
+
+    if not interface_name:
+        return None
+
+    return TypeInfo(
+        name=interface_name,
+        modifiers=modifiers,
+        extends=extends or [],
+        methods=methods
+    )
+
+def extract_ast_info_cursor(tree, source_code, body_ranges=False):
+    """TreeCursor로 트리를 한 번만 순회하며 extract_ast_info와 같은 정보를 추출합니다."""
+    info = FileInfo(
+        package=None,
+        imports=[],
+        classes=[],
+        interfaces=[],
+        object_references=[]
+    )
+
+    package_seen = False
+    cursor = tree.walk()
+
+    for node in iter_children(cursor):
+        node_type = node.type
+        if node_type == 'package_declaration':
+            # 첫 번째 package 선언만 사용
+            if not package_seen:
+                info['package'] = _first_child_text(cursor, source_code, 'scoped_identifier')
+                package_seen = True
+
+        elif node_type == 'import_declaration':
+            import_path = _visit_import(cursor, source_code)
+            if import_path:
+                info['imports'].append(import_path)
+
+        elif node_type == 'class_declaration':
+            class_info = _visit_class(cursor, source_code, body_ranges)
+            if class_info:
+                # 객체 참조 정보 추가
+                add_object_references(info, class_info)
+                info['classes'].append(class_info)
+
+        elif node_type == 'interface_declaration':
+            interface_info = _visit_interface(cursor, source_code)
+            if interface_info:
+                info['interfaces'].append(interface_info)
+
+    return info
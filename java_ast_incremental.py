@@ -0,0 +1,291 @@
+import os
+
+from java_ast_analyzer import (
+    create_parser, extract_package_name, extract_imports, extract_class_method_info,
+    extract_class_info, extract_interface_info, add_object_references
+)
+from call_graph import TYPE_DECLARATION_NODES, extract_class_calls
+from code_model import FileInfo
+from parse_cache import content_hash
+
+def byte_to_point(source_code, byte_offset):
+    """바이트 오프셋을 tree-sitter 포인트 (행, 바이트 열)로 변환합니다."""
+    row = source_code.count(b"\n", 0, byte_offset)
+    line_start = source_code.rfind(b"\n", 0, byte_offset) + 1
+    return (row, byte_offset - line_start)
+
+def _common_prefix_length(a, b, limit):
+    """두 바이트 버퍼의 공통 접두사 길이를 이진 탐색(memcmp 비교)으로 구합니다."""
+    a, b = memoryview(a), memoryview(b)
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def _common_suffix_length(a, b, limit):
+    """두 바이트 버퍼의 공통 접미사 길이를 이진 탐색으로 구합니다."""
+    a, b = memoryview(a), memoryview(b)
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid:len(a) - low] == b[len(b) - mid:len(b) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+def compute_edit(old_source, new_source):
+    """이전/새 소스의 공통 앞뒤 부분을 제외한 단일 편집 구간을 계산합니다."""
+    if old_source == new_source:
+        return None
+
+    limit = min(len(old_source), len(new_source))
+    start_byte = _common_prefix_length(old_source, new_source, limit)
+    suffix = _common_suffix_length(old_source, new_source, limit - start_byte)
+
+    return {
+        'start_byte': start_byte,
+        'old_end_byte': len(old_source) - suffix,
+        'new_end_byte': len(new_source) - suffix
+    }
+
+def map_range(start_byte, end_byte, edit):
+    """편집 전 바이트 범위를 편집 후 좌표로 옮깁니다 (편집 구간과 겹치면 None)."""
+    if end_byte <= edit['start_byte']:
+        return (start_byte, end_byte)
+    if start_byte >= edit['old_end_byte']:
+        delta = edit['new_end_byte'] - edit['old_end_byte']
+        return (start_byte + delta, end_byte + delta)
+    return None
+
+def intersects(node, dirty_ranges):
+    """노드 범위가 변경 범위 중 하나와 겹치는지 확인합니다."""
+    return any(node.start_byte < end and start < node.end_byte for start, end in dirty_ranges)
+
+class IncrementalJavaAnalyzer:
+    """파일별 마지막 Tree와 소스를 유지하며 변경된 클래스/메서드만 다시 추출하는 분석기.
+
+    내부 Parser를 공유하므로 한 스레드에서만 사용해야 합니다.
+    """
+
+    def __init__(self):
+        self.parser = create_parser()
+        self.files = {}
+        self.last_stats = None
+
+    def analyze_file(self, file_path, source_code=None):
+        """파일 전체를 파싱하고 이후 증분 갱신을 위한 상태를 저장합니다."""
+        try:
+            if source_code is None:
+                source_code = self._read_source(file_path)
+            tree = self.parser.parse(source_code)
+            ast_info = self._extract(tree, source_code, file_path, [])
+        except Exception as e:
+            print(f"파싱 에러 ({file_path}): {e}")
+            self.files.pop(file_path, None)
+            return FileInfo(path=file_path, error=str(e))
+        return ast_info
+
+    def update_file(self, file_path, new_source=None):
+        """저장된 파일을 새 소스로 갱신합니다 (이전 트리를 재사용해 증분 파싱)."""
+        state = self.files.get(file_path)
+        if state is None:
+            return self.analyze_file(file_path, new_source)
+
+        try:
+            if new_source is None:
+                new_source = self._read_source(file_path)
+            edit = compute_edit(state['source'], new_source)
+            if edit is None:
+                self.last_stats = {'reparsed': False, 'reused': state['item_count'], 'extracted': 0}
+                return state['ast_info']
+            return self._apply(file_path, state, new_source, edit)
+        except Exception as e:
+            print(f"증분 파싱 에러 ({file_path}): {e}")
+            self.files.pop(file_path, None)
+            return FileInfo(path=file_path, error=str(e))
+
+    def apply_edit(self, file_path, start_byte, old_end_byte, new_text):
+        """에디터에서 받은 단일 편집(바이트 범위 교체)을 적용합니다."""
+        state = self.files[file_path]
+        if isinstance(new_text, str):
+            new_text = new_text.encode('utf-8')
+        old_source = state['source']
+        new_source = old_source[:start_byte] + new_text + old_source[old_end_byte:]
+        edit = {
+            'start_byte': start_byte,
+            'old_end_byte': old_end_byte,
+            'new_end_byte': start_byte + len(new_text)
+        }
+        return self._apply(file_path, state, new_source, edit)
+
+    def forget(self, file_path):
+        """파일 상태를 제거합니다 (삭제된 파일 등)."""
+        self.files.pop(file_path, None)
+
+    def _read_source(self, file_path):
+        """파일을 바이트로 읽습니다."""
+        with open(file_path, 'rb') as file:
+            return file.read()
+
+    def _apply(self, file_path, state, new_source, edit):
+        """이전 트리에 편집을 반영한 뒤 다시 파싱하고 변경 부분만 추출합니다."""
+        old_source = state['source']
+        old_tree = state['tree']
+        old_tree.edit(
+            start_byte=edit['start_byte'],
+            old_end_byte=edit['old_end_byte'],
+            new_end_byte=edit['new_end_byte'],
+            start_point=byte_to_point(old_source, edit['start_byte']),
+            old_end_point=byte_to_point(old_source, edit['old_end_byte']),
+            new_end_point=byte_to_point(new_source, edit['new_end_byte'])
+        )
+        new_tree = self.parser.parse(new_source, old_tree)
+
+        # 토큰 내용만 바뀐 경우(이름 변경, 리터럴 수정) changed_ranges가 비어 있으므로 편집 구간도 포함
+        dirty_ranges = [(r.start_byte, r.end_byte) for r in old_tree.changed_ranges(new_tree)]
+        dirty_ranges.append((edit['start_byte'], edit['new_end_byte']))
+
+        # 이전 선언 범위를 새 좌표로 옮겨 재사용 후보로 둠
+        reusable = {}
+        for kind, start_byte, end_byte, item in state['items']:
+            mapped = map_range(start_byte, end_byte, edit)
+            if mapped:
+                reusable[(kind,) + mapped] = item
+
+        return self._extract(new_tree, new_source, file_path, dirty_ranges, reusable)
+
+    def _extract(self, tree, source_code, file_path, dirty_ranges, reusable=None):
+        """변경 범위와 겹치지 않는 선언은 이전 결과를 재사용하며 AST 정보를 구성합니다."""
+        reusable = reusable or {}
+        items = []
+        stats = {'reparsed': True, 'reused': 0, 'extracted': 0}
+
+        def reuse(kind, node):
+            key = (kind, node.start_byte, node.end_byte)
+            if key in reusable and not intersects(node, dirty_ranges):
+                stats['reused'] += 1
+                return reusable[key]
+            return None
+
+        def remember(kind, node, item):
+            items.append((kind, node.start_byte, node.end_byte, item))
+            return item
+
+        root_node = tree.root_node
+        info = FileInfo(
+            package=extract_package_name(root_node, source_code),
+            imports=extract_imports(root_node, source_code),
+            classes=[],
+            interfaces=[],
+            object_references=[],
+            calls=[]
+        )
+
+        for node in root_node.children:
+            if node.type == 'class_declaration':
+                class_info = reuse('class', node)
+                if class_info is None:
+                    class_info = extract_class_info(node, source_code,
+                                                    self._class_methods(node, source_code, reuse, remember, stats))
+                    stats['extracted'] += 1
+                else:
+                    # 재사용한 클래스의 메서드 범위도 다음 갱신을 위해 기록
+                    self._remember_methods(node, class_info, remember)
+                if class_info:
+                    remember('class', node, class_info)
+                    # 객체 참조 정보 추가
+                    add_object_references(info, class_info)
+                    info['classes'].append(class_info)
+
+            elif node.type == 'interface_declaration':
+                interface_info = reuse('interface', node)
+                if interface_info is None:
+                    interface_info = extract_interface_info(node, source_code)
+                    stats['extracted'] += 1
+                if interface_info:
+                    remember('interface', node, interface_info)
+                    info['interfaces'].append(interface_info)
+
+            if node.type in TYPE_DECLARATION_NODES:
+                # 호출 지점은 필드 타입에 의존하므로 최상위 타입 단위로 재사용
+                calls = reuse('calls', node)
+                if calls is None:
+                    calls = extract_class_calls(node, source_code)
+                info['calls'].extend(remember('calls', node, calls))
+
+        info['source_hash'] = content_hash(source_code)
+        info['path'] = file_path
+
+        self.files[file_path] = {
+            'source': bytes(source_code),
+            'tree': tree,
+            'items': items,
+            'item_count': len(items),
+            'ast_info': info
+        }
+        self.last_stats = stats
+        return info
+
+    def _method_nodes(self, class_node):
+        """클래스 본문의 메서드 선언 노드를 순서대로 반환합니다."""
+        for child in class_node.children:
+            if child.type == 'class_body':
+                for body_child in child.children:
+                    if body_child.type == 'method_declaration':
+                        yield body_child
+
+    def _class_methods(self, class_node, source_code, reuse, remember, stats):
+        """클래스의 메서드 정보를 변경된 메서드만 다시 추출해 구성합니다."""
+        methods = []
+        for method_node in self._method_nodes(class_node):
+            method_info = reuse('method', method_node)
+            if method_info is None:
+                method_info = extract_class_method_info(method_node, source_code)
+                stats['extracted'] += 1
+            if method_info:
+                remember('method', method_node, method_info)
+                methods.append(method_info)
+        return methods
+
+    def _remember_methods(self, class_node, class_info, remember):
+        """재사용한 클래스의 메서드 노드와 정보를 짝지어 기록합니다."""
+        method_nodes = [node for node in self._method_nodes(class_node)
+                        if any(child.type == 'identifier' for child in node.children)]
+        for method_node, method_info in zip(method_nodes, class_info['methods']):
+            remember('method', method_node, method_info)
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("사용법: python java_ast_incremental.py <감시할_Java_파일>")
+        sys.exit(1)
+
+    file_path = sys.argv[1]
+    analyzer = IncrementalJavaAnalyzer()
+    analyzer.analyze_file(file_path)
+    last_mtime = os.path.getmtime(file_path)
+    print(f"{file_path} 변경을 감시합니다. (Ctrl+C로 종료)")
+
+    try:
+        while True:
+            time.sleep(0.5)
+            mtime = os.path.getmtime(file_path)
+            if mtime == last_mtime:
+                continue
+            last_mtime = mtime
+
+            start_time = time.perf_counter()
+            ast_info = analyzer.update_file(file_path)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            stats = analyzer.last_stats or {}
+            print(f"갱신 완료: {elapsed:.2f}ms (재사용 {stats.get('reused', 0)}개, "
+                  f"재추출 {stats.get('extracted', 0)}개, 클래스 {len(ast_info.get('classes', []))}개)")
+    except KeyboardInterrupt:
+        pass
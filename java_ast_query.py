@@ -0,0 +1,226 @@
+from collections import defaultdict
+
+from java_ast_analyzer import (
+    JAVA_LANGUAGE, get_node_text, build_method_references, add_object_references, set_method_body, modifier_keywords,
+    supertype_name, PARAMETER_TYPE_NODES
+)
+from code_model import FileInfo, TypeInfo, MethodInfo, FieldInfo, ParamInfo
+
+try:
+    # tree-sitter 0.25 이상: Query 생성자 + QueryCursor
+    from tree_sitter import Query, QueryCursor
+except ImportError:
+    Query = QueryCursor = None
+
+# extract_ast_info와 같은 규칙으로 타입 노드를 고르기 위한 노드 타입 집합
+RETURN_TYPE_NODES = ('type_identifier', 'void_type', 'primitive_type')
+FIELD_TYPE_NODES = ('type_identifier', 'primitive_type')
+
+# 선언 노드 자체에서 시작하는 Java S-expression 쿼리 묶음
+# - (program (...)) 처럼 상위 노드에서 시작하는 패턴은 파일 전체를 덮는 진행 중 매치를 남겨
+#   쿼리 커서가 메서드 본문 안쪽까지 내려가므로, 패턴은 모두 선언 노드에서 시작하고
+#   소속(클래스/메서드)은 Python 쪽에서 부모 노드로 찾음
+# - 매치 하나가 선언/메서드/필드 선언자 하나에 대응 (파라미터는 메서드 매치 안의 반복 캡처)
+QUERY_PATTERNS = [
+    ('package', "(package_declaration (scoped_identifier) @value) @decl"),
+    ('import', "(import_declaration [(scoped_identifier) (identifier)] @value (asterisk)? @wildcard) @decl"),
+    ('class', "(class_declaration (modifiers)? @modifiers name: (identifier) @name) @decl"),
+    ('class.extends', "(superclass (_) @value) @decl"),
+    ('class.implements', "(super_interfaces (type_list (_) @value)) @decl"),
+    ('interface', "(interface_declaration (modifiers)? @modifiers name: (identifier) @name) @decl"),
+    ('interface.extends', "(extends_interfaces (type_list (_) @value)) @decl"),
+    ('method', """
+        (method_declaration
+          type: (_) @type
+          name: (identifier) @name
+          parameters: (formal_parameters
+            [(formal_parameter type: (_) @param.type name: (identifier) @param.name) ","]*) @parameters
+          body: (block)? @body) @method"""),
+    ('field', """
+        (field_declaration
+          type: (_) @type
+          declarator: (variable_declarator name: (identifier) @name)) @field"""),
+]
+
+# 패턴이 시작될 수 있는 최대 깊이 (program > class > class_body > method)
+# 본문(block) 안쪽 노드에서는 매치를 시작하지 않고, 진행 중인 매치도 없으므로 커서가 본문으로 내려가지 않음
+QUERY_MAX_START_DEPTH = 3
+
+# 파일 최상위 선언 패턴 (기준 노드와 상관없이 문서 순서대로 모음, 부모가 program인 것만 사용)
+TOP_LEVEL_KEYS = ('package', 'import', 'class', 'interface')
+# 패턴 키별 기준 노드: 매치 노드에서 부모를 몇 단계 올라가면 소속 노드인지
+# (상위 타입 절 -> 타입 선언, 메서드/필드 -> 본문 -> 타입 선언)
+GROUP_PARENT_LEVELS = {
+    'class.extends': ('decl', 1),
+    'class.implements': ('decl', 1),
+    'interface.extends': ('decl', 1),
+    'method': ('method', 2),
+    'field': ('field', 2),
+}
+
+_query_pack = None
+
+def _compile(source):
+    """설치된 tree-sitter 버전에 맞게 쿼리를 컴파일합니다."""
+    if QueryCursor is not None:
+        return Query(JAVA_LANGUAGE, source)
+    return JAVA_LANGUAGE.query(source)
+
+def _pattern_is_supported(pattern):
+    """패턴이 현재 Java 문법에서 컴파일(매치) 가능한지 확인합니다."""
+    try:
+        _compile(pattern)
+    except Exception:
+        return False
+    return True
+
+def get_query_pack():
+    """Java 선언 추출용 쿼리를 프로세스당 한 번만 컴파일해 반환합니다."""
+    global _query_pack
+    if _query_pack is not None:
+        return _query_pack
+
+    keys = []
+    sources = []
+    for key, pattern in QUERY_PATTERNS:
+        # 현재 문법에 없는 노드 타입을 쓰는 패턴은 어차피 매치되지 않으므로 제외
+        if not _pattern_is_supported(pattern):
+            continue
+        keys.append(key)
+        sources.append(pattern)
+
+    _query_pack = (_compile("\n".join(sources)), keys)
+    return _query_pack
+
+def _run_matches(query, node):
+    """설치된 tree-sitter 버전에 맞게 쿼리 매치를 실행합니다."""
+    if QueryCursor is not None:
+        query_cursor = QueryCursor(query)
+        query_cursor.set_max_start_depth(QUERY_MAX_START_DEPTH)
+        return query_cursor.matches(node)
+    return query.matches(node)
+
+def _collect_matches(root_node):
+    """쿼리 매치 결과를 (패턴 키, 기준 노드 id)별로 모읍니다."""
+    query, keys = get_query_pack()
+    grouped = defaultdict(list)
+
+    for pattern_index, captures in _run_matches(query, root_node):
+        key = keys[pattern_index]
+        if key in TOP_LEVEL_KEYS:
+            if captures['decl'][0].parent.type != 'program':
+                continue
+            group_id = None
+        else:
+            capture_name, levels = GROUP_PARENT_LEVELS[key]
+            node = captures[capture_name][0]
+            for _ in range(levels):
+                node = node.parent
+            group_id = node.id
+        grouped[(key, group_id)].append(captures)
+
+    return grouped
+
+def _text_if_type(node, source_code, node_types):
+    """노드 타입이 허용 목록에 있을 때만 텍스트를 반환합니다."""
+    if node.type in node_types:
+        return get_node_text(node, source_code)
+    return None
+
+def _modifiers(captures, source_code):
+    """타입 선언 매치의 수정자 목록 (modifiers 노드가 없으면 빈 목록)."""
+    return modifier_keywords(captures['modifiers'][0], source_code) if captures.get('modifiers') else []
+
+def _method_info(captures, source_code, with_body, body_ranges=False):
+    """메서드 매치 하나로 메서드 정보를 구성합니다."""
+    parameters = []
+    # 반복 캡처는 파라미터 순서대로 타입/이름이 짝지어 들어 있음
+    for type_node, name_node in zip(captures.get('param.type', ()), captures.get('param.name', ())):
+        param_type = _text_if_type(type_node, source_code, PARAMETER_TYPE_NODES)
+        param_name = get_node_text(name_node, source_code)
+        if param_name and param_type:
+            parameters.append(ParamInfo(
+                name=param_name,
+                type=param_type
+            ))
+
+    method_info = MethodInfo(
+        name=get_node_text(captures['name'][0], source_code),
+        return_type=_text_if_type(captures['type'][0], source_code, RETURN_TYPE_NODES),
+        parameters=parameters
+    )
+    if with_body:
+        body_node = captures['body'][0] if captures.get('body') else None
+        set_method_body(method_info, body_node, source_code, body_ranges)
+        method_info['referenced_objects'], method_info['references'] = build_method_references(body_node, source_code)
+    return method_info
+
+def extract_ast_info_query(tree, source_code, body_ranges=False):
+    """사전 컴파일된 쿼리 매치로 extract_ast_info와 같은 정보를 추출합니다."""
+    grouped = _collect_matches(tree.root_node)
+
+    def sorted_matches(key, group_id, capture_name):
+        return sorted(grouped.get((key, group_id), []), key=lambda c: c[capture_name][0].start_byte)
+
+    def value_texts(key, group_id):
+        # 상위 타입은 제네릭 인자를 뺀 이름만 (타입이 아닌 노드는 supertype_name이 None)
+        names = (supertype_name(c['value'][0], source_code) for c in sorted_matches(key, group_id, 'value'))
+        return [name for name in names if name]
+
+    # 와일드카드 임포트는 '.*'까지 포함
+    imports = [get_node_text(c['value'][0], source_code) + ('.*' if c.get('wildcard') else '')
+               for c in sorted_matches('import', None, 'decl')]
+
+    info = FileInfo(
+        package=None,
+        imports=imports,
+        classes=[],
+        interfaces=[],
+        object_references=[]
+    )
+
+    # 첫 번째 package 선언의 이름만 사용
+    packages = sorted_matches('package', None, 'decl')
+    if packages:
+        info['package'] = get_node_text(packages[0]['value'][0], source_code)
+
+    for class_match in sorted_matches('class', None, 'decl'):
+        class_id = class_match['decl'][0].id
+        class_name = get_node_text(class_match['name'][0], source_code)
+
+        fields = []
+        for field_match in sorted_matches('field', class_id, 'name'):
+            fields.append(FieldInfo(
+                name=get_node_text(field_match['name'][0], source_code),
+                type=_text_if_type(field_match['type'][0], source_code, FIELD_TYPE_NODES)
+            ))
+
+        methods = [_method_info(method_match, source_code, with_body=True, body_ranges=body_ranges)
+                   for method_match in sorted_matches('method', class_id, 'method')]
+
+        extends = value_texts('class.extends', class_id)
+        class_info = TypeInfo(
+            name=class_name,
+            modifiers=_modifiers(class_match, source_code),
+            extends=extends[0] if extends else None,
+            implements=value_texts('class.implements', class_id),
+            fields=fields,
+            methods=methods
+        )
+
+        # 객체 참조 정보 추가
+        add_object_references(info, class_info)
+
+        info['classes'].append(class_info)
+
+    for interface_match in sorted_matches('interface', None, 'decl'):
+        interface_id = interface_match['decl'][0].id
+        info['interfaces'].append(TypeInfo(
+            name=get_node_text(interface_match['name'][0], source_code),
+            modifiers=_modifiers(interface_match, source_code),
+            extends=value_texts('interface.extends', interface_id),
+            methods=[_method_info(method_match, source_code, with_body=False)
+                        for method_match in sorted_matches('method', interface_id, 'method')]
+        ))
+
+    return info
@@ -0,0 +1,216 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# VCS/IDE/의존성 디렉토리 (어느 깊이에서든 하위로 내려가지 않음)
+DEFAULT_IGNORED_DIRS = frozenset([
+    '.git', '.hg', '.svn', '.idea', '.gradle', '.mvn', 'node_modules', '__pycache__'
+])
+
+# 빌드 산출물/생성 코드 디렉토리
+# - com/acme/build 같은 Java 패키지 이름과 겹치므로 프로젝트 루트나 빌드 파일이 있는
+#   모듈 루트 바로 아래에 있을 때만 제외
+DEFAULT_BUILD_DIRS = frozenset([
+    'build', 'target', 'out', 'generated', 'generated-sources', 'generated-test-sources'
+])
+
+# 이 파일이 있는 디렉토리를 모듈 루트로 취급
+BUILD_FILES = frozenset([
+    'pom.xml', 'build.gradle', 'build.gradle.kts', 'settings.gradle', 'settings.gradle.kts', 'build.xml'
+])
+
+# 디렉토리 스캔 스레드 수 (네트워크 마운트에서는 I/O 대기가 대부분이므로 CPU 수와 무관)
+DEFAULT_DISCOVERY_WORKERS = 8
+
+def _glob_to_regex(pattern):
+    """gitignore 글롭 패턴을 정규식 문자열로 변환합니다."""
+    regex = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith('**/', i):
+            regex.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == len(pattern):
+            regex.append('/.*')
+            i += 3
+        elif pattern.startswith('**', i):
+            regex.append('.*')
+            i += 2
+        elif char == '*':
+            regex.append('[^/]*')
+            i += 1
+        elif char == '?':
+            regex.append('[^/]')
+            i += 1
+        elif char == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                regex.append(re.escape(char))
+                i += 1
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                regex.append(f'[{body}]')
+                i = end + 1
+        elif char == '\\' and i + 1 < len(pattern):
+            regex.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            regex.append(re.escape(char))
+            i += 1
+    return ''.join(regex)
+
+def parse_gitignore(text, base_dir=''):
+    """.gitignore 내용을 (기준 디렉토리, 정규식, 부정 여부, 디렉토리 전용 여부) 규칙 목록으로 변환합니다."""
+    rules = []
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith('#'):
+            continue
+
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+
+        # 중간에 '/'가 있으면 .gitignore 위치 기준, 없으면 어느 깊이의 이름과도 매치
+        anchored = '/' in line
+        line = line.lstrip('/')
+        regex = _glob_to_regex(line)
+        if not anchored:
+            regex = '(?:.*/)?' + regex
+        rules.append((base_dir, re.compile(regex + r'\Z'), negate, dir_only))
+    return rules
+
+def is_gitignored(rules, relative_path, is_dir):
+    """'/'로 구분된 상대 경로가 gitignore 규칙에 의해 제외되는지 확인합니다 (마지막 매치 규칙 우선)."""
+    ignored = False
+    for base_dir, regex, negate, dir_only in rules:
+        if dir_only and not is_dir:
+            continue
+        if base_dir:
+            if not relative_path.startswith(base_dir + '/'):
+                continue
+            path = relative_path[len(base_dir) + 1:]
+        else:
+            path = relative_path
+        if regex.match(path):
+            ignored = not negate
+    return ignored
+
+def _read_gitignore(directory, relative_dir):
+    """디렉토리의 .gitignore를 읽어 규칙 목록을 반환합니다 (없으면 빈 목록)."""
+    try:
+        with open(os.path.join(directory, '.gitignore'), 'r', encoding='utf-8', errors='replace') as f:
+            return parse_gitignore(f.read(), relative_dir)
+    except OSError:
+        return []
+
+def _scan_directory(directory, relative_dir, rules, ignored_dirs, build_dirs, use_gitignore, extensions):
+    """디렉토리 하나를 scandir로 스캔해 (파일 (경로, 크기) 목록, 하위 디렉토리 작업 목록)을 반환합니다."""
+    if use_gitignore:
+        rules = rules + _read_gitignore(directory, relative_dir)
+
+    files = []
+    subdirs = []
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return files, subdirs
+
+    # 빌드 산출물 디렉토리 이름은 프로젝트/모듈 루트 바로 아래에서만 제외
+    if build_dirs and (not relative_dir or any(entry.name in BUILD_FILES for entry in entries)):
+        ignored_dirs = ignored_dirs | build_dirs
+
+    for entry in entries:
+        relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in ignored_dirs:
+                    continue
+                if use_gitignore and is_gitignored(rules, relative_path, True):
+                    continue
+                subdirs.append((entry.path, relative_path, rules))
+            elif entry.name.endswith(extensions) and entry.is_file():
+                if use_gitignore and is_gitignored(rules, relative_path, False):
+                    continue
+                files.append((entry.path, entry.stat().st_size))
+        except OSError:
+            continue
+
+    return files, subdirs
+
+def discover_java_files(project_path, ignored_dirs=DEFAULT_IGNORED_DIRS, use_gitignore=True,
+                        max_workers=DEFAULT_DISCOVERY_WORKERS, extensions=('.java',), build_dirs=DEFAULT_BUILD_DIRS):
+    """프로젝트에서 Java 파일을 찾아 경로순으로 정렬된 (경로, 크기) 목록을 반환합니다.
+    
+    ignored_dirs는 어느 깊이에서든, build_dirs는 프로젝트/모듈 루트 바로 아래에서만 제외합니다.
+    """
+    ignored_dirs = frozenset(ignored_dirs or ())
+    build_dirs = frozenset(build_dirs or ())
+    extensions = tuple(extensions)
+    found = []
+
+    if max_workers <= 1:
+        stack = [(project_path, '', [])]
+        while stack:
+            files, subdirs = _scan_directory(*stack.pop(), ignored_dirs, build_dirs, use_gitignore, extensions)
+            found.extend(files)
+            stack.extend(subdirs)
+    else:
+        # 디렉토리 하나를 작업 하나로 두고, 끝난 작업의 하위 디렉토리를 바로 제출
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(_scan_directory, project_path, '', [], ignored_dirs, build_dirs,
+                                       use_gitignore, extensions)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    found.extend(files)
+                    for subdir in subdirs:
+                        pending.add(executor.submit(_scan_directory, *subdir, ignored_dirs, build_dirs,
+                                                                 use_gitignore, extensions))
+
+    found.sort()
+    return found
+
+def find_java_files(project_path, **options):
+    """프로젝트 경로에서 모든 Java 파일을 찾습니다 (경로순 정렬)."""
+    return [file_path for file_path, _ in discover_java_files(project_path, **options)]
+
+def _is_module_root(directory):
+    """디렉토리에 빌드 파일(pom.xml, build.gradle 등)이 있는지 확인합니다."""
+    return any(os.path.isfile(os.path.join(directory, name)) for name in BUILD_FILES)
+
+def is_ignored_path(project_path, relative_path, ignored_dirs=DEFAULT_IGNORED_DIRS, use_gitignore=True,
+                    gitignore_cache=None, build_dirs=DEFAULT_BUILD_DIRS):
+    """프로젝트 기준 상대 경로의 파일이 탐색 규칙에 의해 제외되는지 확인합니다 (git 변경 목록 필터링용)."""
+    parts = relative_path.replace(os.sep, '/').split('/')
+    ignored_dirs = frozenset(ignored_dirs or ())
+    if any(part in ignored_dirs for part in parts[:-1]):
+        return True
+    build_dirs = frozenset(build_dirs or ())
+    for depth, part in enumerate(parts[:-1]):
+        if part in build_dirs and (depth == 0 or _is_module_root(os.path.join(project_path, *parts[:depth]))):
+            return True
+    if not use_gitignore:
+        return False
+
+    cache = gitignore_cache if gitignore_cache is not None else {}
+    rules = []
+    for depth in range(len(parts)):
+        relative_dir = '/'.join(parts[:depth])
+        if relative_dir not in cache:
+            cache[relative_dir] = _read_gitignore(os.path.join(project_path, *parts[:depth]), relative_dir)
+        rules = rules + cache[relative_dir]
+
+        # 상위 디렉토리가 제외되면 그 아래 파일도 모두 제외
+        path = '/'.join(parts[:depth + 1])
+        if is_gitignored(rules, path, depth < len(parts) - 1):
+            return True
+    return False
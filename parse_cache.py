@@ -0,0 +1,115 @@
+import json
+import zlib
+import sqlite3
+import hashlib
+from importlib import metadata
+
+# 변경 없는 파일이 한 번의 해시 + 한 번의 조회로 끝나도록 하는 파일별 ast_info 캐시 (SQLite)
+
+def get_package_version(package_name):
+    """설치된 패키지 버전을 반환합니다 (없으면 'unknown')."""
+    try:
+        return metadata.version(package_name)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+def make_namespace(analyzer_name, analyzer_version, *package_names):
+    """분석기 이름/버전과 파서(문법) 패키지 버전으로 캐시 네임스페이스를 만듭니다."""
+    parts = [f"{analyzer_name}={analyzer_version}"]
+    parts.extend(f"{name}={get_package_version(name)}" for name in package_names)
+    return ";".join(parts)
+
+def content_hash(source_code):
+    """파일 내용의 해시를 계산합니다."""
+    return hashlib.blake2b(source_code, digest_size=20).hexdigest()
+
+class ParseCache:
+    """(네임스페이스, 내용 해시) -> 파일별 ast_info를 저장하는 디스크 캐시.
+
+    SQLite 연결을 공유하므로 조회/저장은 분석을 조율하는 한 스레드에서만 호출해야 합니다.
+    """
+
+    def __init__(self, cache_path, namespace, commit_every=500):
+        self.namespace = namespace
+        self.commit_every = commit_every
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+
+        self.connection = sqlite3.connect(cache_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS parse_cache ("
+            " namespace TEXT NOT NULL,"
+            " content_hash TEXT NOT NULL,"
+            " ast_info BLOB NOT NULL,"
+            " PRIMARY KEY (namespace, content_hash))"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, key):
+        """내용 해시로 캐시된 ast_info를 반환합니다 (없으면 None)."""
+        row = self.connection.execute(
+            "SELECT ast_info FROM parse_cache WHERE namespace = ? AND content_hash = ?",
+            (self.namespace, key)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def lookup_file(self, file_path):
+        """파일을 한 번 읽어 해시를 구하고 (해시, 캐시된 ast_info 또는 None)을 반환합니다."""
+        try:
+            with open(file_path, 'rb') as file:
+                key = content_hash(file.read())
+        except OSError:
+            return None, None
+
+        ast_info = self.get(key)
+        if ast_info is not None:
+            # 같은 내용의 파일이 다른 경로에 있을 수 있으므로 경로는 조회 시점에 채움
+            ast_info['path'] = file_path
+        return key, ast_info
+
+    def put(self, key, ast_info):
+        """파일별 ast_info를 저장합니다 (에러 결과와 경로는 저장하지 않음)."""
+        if key is None or 'error' in ast_info:
+            return
+        record = {k: v for k, v in ast_info.items() if k != 'path'}
+        payload = zlib.compress(json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 1)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO parse_cache (namespace, content_hash, ast_info) VALUES (?, ?, ?)",
+            (self.namespace, key, payload)
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+
+    def flush(self):
+        """대기 중인 저장을 커밋합니다."""
+        if self._pending:
+            self.connection.commit()
+            self._pending = 0
+
+    def prune(self):
+        """현재 네임스페이스가 아닌(이전 분석기/문법 버전의) 항목을 삭제합니다."""
+        self.connection.execute("DELETE FROM parse_cache WHERE namespace != ?", (self.namespace,))
+        self.connection.commit()
+
+    def close(self):
+        """커밋 후 연결을 닫습니다."""
+        self.flush()
+        self.connection.close()
+
+    def summary(self):
+        """캐시 적중 통계 문자열을 반환합니다."""
+        total = self.hits + self.misses
+        return f"파스 캐시 적중 {self.hits}/{total}개"
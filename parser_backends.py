@@ -0,0 +1,148 @@
+import os
+import importlib
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+from parse_cache import ParseCache
+from code_model import as_file_info
+from analysis_io import write_output
+from java_file_discovery import discover_java_files
+from relationship_analysis import analyze_parsed_project
+
+# 파서 백엔드(javalang, tree-sitter)를 같은 분석 흐름에 끼워 쓰는 단계
+# - 탐색 -> 백엔드별 파싱(파스 캐시 포함) -> 공통 관계 분석(relationship_analysis) -> 저장
+# - 백엔드는 파일 하나를 FileInfo로 바꾸는 parse_file만 구현하면 되고,
+#   자체 병렬 파싱이 있는 백엔드는 iter_parse를 재정의
+
+class ParserBackend(ABC):
+    """파서 백엔드 공통 인터페이스."""
+
+    name = None
+
+    @property
+    @abstractmethod
+    def cache_namespace(self):
+        """파스 캐시 네임스페이스 (백엔드/버전이 다르면 캐시를 공유하지 않음)."""
+
+    @abstractmethod
+    def parse_file(self, file_path):
+        """파일 하나를 파싱해 FileInfo를 반환합니다 (실패하면 path와 error만 있는 FileInfo)."""
+
+    def iter_parse(self, java_files, max_workers=4, cache_path=None, file_sizes=None):
+        """파일들을 파싱해 (인덱스, FileInfo)를 반환합니다 (캐시 적중 파일이 먼저, 나머지는 스레드 풀에서 파싱)."""
+        cache = ParseCache(cache_path, self.cache_namespace) if cache_path else None
+        try:
+            cache_keys = {}
+            pending = []
+            for i, file_path in enumerate(java_files):
+                if cache:
+                    cache_keys[i], ast_info = cache.lookup_file(file_path)
+                    if ast_info is not None:
+                        yield i, as_file_info(ast_info)
+                        continue
+                pending.append(i)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(self.parse_file, [java_files[i] for i in pending])
+                for i, ast_info in zip(pending, results):
+                    if cache:
+                        cache.put(cache_keys.pop(i), ast_info.to_dict())
+                    yield i, ast_info
+
+            if cache:
+                print(cache.summary())
+        finally:
+            if cache:
+                cache.close()
+
+class JavalangBackend(ParserBackend):
+    """javalang 파서 (java_ast.py: 클래스/인터페이스/메서드 시그니처, 본문 없음)."""
+
+    name = 'javalang'
+    module_name = 'java_ast'
+
+    def __init__(self):
+        # 백엔드를 고를 때만 해당 파서 의존성을 불러옴
+        self.module = importlib.import_module(self.module_name)
+
+    @property
+    def cache_namespace(self):
+        return self.module.CACHE_NAMESPACE
+
+    def parse_file(self, file_path):
+        return as_file_info(self.module.process_java_file(file_path))
+
+class JavalangLlmBackend(JavalangBackend):
+    """javalang 파서 + 메서드 본문 + LLM 설명 (java_ast_v2.py, OpenAI API 필요)."""
+
+    name = 'javalang-llm'
+    module_name = 'java_ast_v2'
+
+class TreeSitterBackend(ParserBackend):
+    """tree-sitter 파서 (java_ast_analyzer.py: 본문, 필드, 객체 참조, 호출 지점 포함)."""
+
+    name = 'tree-sitter'
+
+    def __init__(self, extractor='walk', body_ranges=False, engine='process'):
+        import java_ast_analyzer
+        self.module = java_ast_analyzer
+        self.extractor = extractor
+        self.body_ranges = body_ranges
+        self.engine = engine
+
+    @property
+    def cache_namespace(self):
+        return self.module.RANGE_CACHE_NAMESPACE if self.body_ranges else self.module.CACHE_NAMESPACE
+
+    def parse_file(self, file_path):
+        return self.module.process_java_file(file_path, extractor=self.extractor, body_ranges=self.body_ranges)
+
+    def iter_parse(self, java_files, max_workers=4, cache_path=None, file_sizes=None):
+        # 프로세스 풀/청크 분할/캐시가 있는 기존 파싱 단계를 그대로 사용
+        return self.module.iter_parsed_files(java_files, max_workers, self.engine, self.extractor, cache_path,
+                                             file_sizes, self.body_ranges)
+
+BACKENDS = {
+    JavalangBackend.name: JavalangBackend,
+    JavalangLlmBackend.name: JavalangLlmBackend,
+    TreeSitterBackend.name: TreeSitterBackend
+}
+
+def get_backend(name, **options):
+    """이름으로 파서 백엔드를 만듭니다 (options는 백엔드 생성자 인자)."""
+    if isinstance(name, ParserBackend):
+        return name
+    if name not in BACKENDS:
+        raise ValueError(f"알 수 없는 파서 백엔드: {name} (선택: {', '.join(BACKENDS)})")
+    return BACKENDS[name](**options)
+
+def parse_project(project_path, backend, max_workers=4, cache_path=None, discovery_options=None):
+    """프로젝트의 Java 파일을 백엔드로 파싱해 {'project_path', 'files'}를 반환합니다 (파일은 경로순)."""
+    backend = get_backend(backend)
+    discovered = discover_java_files(project_path, **(discovery_options or {}))
+    java_files = [file_path for file_path, _ in discovered]
+    file_sizes = [size for _, size in discovered]
+    print(f"총 {len(java_files)}개의 Java 파일을 찾았습니다. (파서: {backend.name})")
+
+    results = [None] * len(java_files)
+    for i, ast_info in backend.iter_parse(java_files, max_workers, cache_path, file_sizes):
+        results[i] = ast_info
+    relative_paths = [os.path.relpath(file_path, project_path) for file_path in java_files]
+    return {
+        'project_path': project_path,
+        'files': dict(zip(relative_paths, results))
+    }
+
+def analyze_project(project_path, backend='tree-sitter', output_json=None, max_workers=4, cache_path=None,
+                    discovery_options=None, impact_index=False, dependency_cycles=False, output_options=None):
+    """백엔드로 파싱한 뒤 공통 관계 분석을 적용하고, output_json이 있으면 형식에 맞게 저장합니다."""
+    project_structure = parse_project(project_path, backend, max_workers, cache_path, discovery_options)
+    output_options = output_options or {}
+    analyze_parsed_project(project_structure, impact_index, dependency_cycles,
+                           output_options.get('call_sites', False), output_options.get('impact_closure'))
+
+    if output_json:
+        saved_path = write_output(project_structure, output_json, output_options)
+        print(f"프로젝트 구조가 {saved_path}에 저장되었습니다.")
+
+    return project_structure
@@ -0,0 +1,138 @@
+from git_diff import get_head_revision
+from symbol_table import ProjectSymbolTable
+from code_model import Dependency
+
+# 파서 백엔드와 무관하게 파싱이 끝난 project_structure에 적용하는 공통 관계 분석 단계
+# - 임포트/상속/구현 의존, 객체 참조, 메서드 호출(호출 지점이 있는 결과만), 선택적 인덱스/순환 분석
+
+def analyze_parsed_project(project_structure, impact_index=False, dependency_cycles=False, keep_call_sites=False,
+                           closure_path=None):
+    """파싱이 끝난 프로젝트에 git 리비전과 관계 분석 결과를 채웁니다 (keep_call_sites면 해석 전 호출 지점도 유지)."""
+    project_path = project_structure['project_path']
+    
+    # 다음 증분 분석의 기준 리비전으로 사용
+    revision = get_head_revision(project_path)
+    if revision:
+        project_structure['git_revision'] = revision
+    
+    # 심볼 테이블은 분석당 한 번만 만들어 모든 관계 분석 단계에서 공유
+    symbol_table = ProjectSymbolTable(project_structure)
+    
+    # 관계 분석
+    analyze_relationships(project_structure, symbol_table=symbol_table)
+    
+    # 객체 참조 관계 추가 분석
+    analyze_object_references(project_structure, symbol_table=symbol_table)
+    
+    # 메서드 호출 관계 (워커에서 추출한 호출 지점을 심볼 테이블로 해석, 호출 지점을 추출하지 않는 백엔드는 건너뜀)
+    if any('calls' in file_info for file_info in project_structure['files'].values()):
+        from call_graph import analyze_method_calls
+        analyze_method_calls(project_structure, symbol_table, keep_call_sites=keep_call_sites)
+    
+    # 전이적 의존/영향 인덱스 (선택)
+    if impact_index:
+        from dependency_closure import add_impact_index
+        add_impact_index(project_structure, symbol_table, closure_path)
+    
+    # 파일/패키지 수준 의존 순환과 축약 DAG (선택)
+    if dependency_cycles:
+        from dependency_scc import analyze_dependency_cycles
+        analyze_dependency_cycles(project_structure)
+    
+    return project_structure
+
+def analyze_file_dependencies(file_info, symbol_table):
+    """파일 하나의 임포트/상속/구현 의존성을 분석합니다."""
+    dependencies = []
+    scope = symbol_table.file_scope(file_info)
+    
+    # 임포트 의존성 (내부 프로젝트 내 임포트만 포함, 심볼 인덱스로 임포트 길이에 비례해 판정)
+    for import_path in file_info.get('imports', []):
+        if symbol_table.is_internal_import(import_path):
+            dependency = Dependency(type='import', target=import_path)
+            
+            # 임포트된 클래스(정적 임포트는 소유 클래스)가 프로젝트 내에 있는지 확인
+            declaration = symbol_table.resolve_import(import_path)
+            if declaration is not None:
+                dependency['file'] = declaration['file']
+                
+            dependencies.append(dependency)
+    
+    # 상속 의존성 (같은 이름의 클래스가 여러 개면 파일의 임포트/패키지로 구분)
+    for class_info in file_info.get('classes', []):
+        if class_info.get('extends'):
+            dependency = Dependency(type='extends', target=class_info['extends'])
+            
+            file_path = symbol_table.resolve_file(class_info['extends'], scope)
+            if file_path is not None:
+                dependency['file'] = file_path
+                
+            dependencies.append(dependency)
+        
+        # 구현 의존성
+        for interface in class_info.get('implements', []):
+            dependency = Dependency(type='implements', target=interface)
+            
+            file_path = symbol_table.resolve_file(interface, scope)
+            if file_path is not None:
+                dependency['file'] = file_path
+                
+            dependencies.append(dependency)
+    
+    # 인터페이스 확장 의존성
+    for interface_info in file_info.get('interfaces', []):
+        for parent in interface_info.get('extends', []):
+            dependency = Dependency(type='extends', target=parent)
+            
+            file_path = symbol_table.resolve_file(parent, scope)
+            if file_path is not None:
+                dependency['file'] = file_path
+                
+            dependencies.append(dependency)
+    
+    file_info['dependencies'] = dependencies
+
+def analyze_relationships(project_structure, file_paths=None, symbol_table=None):
+    """파일 간의 관계를 분석합니다 (file_paths가 주어지면 해당 파일만)."""
+    if symbol_table is None:
+        symbol_table = ProjectSymbolTable(project_structure)
+    
+    # 의존성 분석
+    for file_path, file_info in project_structure['files'].items():
+        if 'error' in file_info or (file_paths is not None and file_path not in file_paths):
+            continue
+        analyze_file_dependencies(file_info, symbol_table)
+
+def analyze_file_object_references(file_info, symbol_table):
+    """파일 하나의 객체 참조 중 프로젝트 내부 객체만 대상 파일과 연결합니다."""
+    object_references = []
+    scope = symbol_table.file_scope(file_info)
+    
+    for ref in file_info.get('object_references', []):
+        ref_obj = ref['referenced_object']
+        
+        # 내부 프로젝트 객체인지 확인
+        file_path = symbol_table.resolve_file(ref_obj, scope)
+        if file_path is not None:
+            object_references.append({
+                'from_class': ref['class'],
+                'from_method': ref['method'],
+                'to_class': ref_obj,
+                'to_file': file_path,
+                'kinds': ref.get('kinds', [])
+            })
+    
+    file_info['object_references'] = object_references
+
+def analyze_object_references(project_structure, file_paths=None, symbol_table=None):
+    """객체 참조 관계를 분석합니다 (file_paths가 주어지면 해당 파일만)."""
+    if symbol_table is None:
+        symbol_table = ProjectSymbolTable(project_structure)
+    
+    # 객체 참조 관계 분석
+    for file_path, file_info in project_structure['files'].items():
+        if 'error' in file_info or 'object_references' not in file_info:
+            continue
+        if file_paths is not None and file_path not in file_paths:
+            continue
+        analyze_file_object_references(file_info, symbol_table)
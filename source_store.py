@@ -0,0 +1,169 @@
+import os
+import mmap
+import threading
+from collections import OrderedDict
+
+from parse_cache import content_hash
+
+# 범위(body_range)만 기록한 메서드 본문을 필요할 때 소스에서 읽어 오는 단계
+# - 소스는 프로젝트 파일을 mmap으로 열고, 분석 시점의 source_hash와 다르면 내용 주소 저장소에서 찾음
+# - 저장소 레이아웃: <root>/<해시 앞 2자리>/<해시> (원본 바이트 그대로, mmap 가능)
+
+class SourceStore:
+    """내용 해시 -> 소스 바이트를 파일로 보관하는 내용 주소 저장소."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, source_hash):
+        return os.path.join(self.root, source_hash[:2], source_hash)
+
+    def __contains__(self, source_hash):
+        return os.path.exists(self.path(source_hash))
+
+    def put(self, source_code, source_hash=None):
+        """소스 바이트를 저장하고 해시를 반환합니다 (이미 있으면 쓰지 않음)."""
+        source_hash = source_hash or content_hash(source_code)
+        path = self.path(source_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 같은 내용을 동시에 쓰더라도 완성된 파일만 보이도록 임시 파일에서 교체
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(source_code)
+            os.replace(temp_path, path)
+        return source_hash
+
+    def put_file(self, file_path, source_hash=None):
+        """파일을 읽어 저장합니다 (source_hash가 주어졌는데 내용이 다르면 저장하지 않고 None)."""
+        if source_hash is not None and source_hash in self:
+            return source_hash
+        try:
+            with open(file_path, 'rb') as f:
+                source_code = f.read()
+        except OSError:
+            return None
+        actual_hash = content_hash(source_code)
+        if source_hash is not None and actual_hash != source_hash:
+            return None
+        return self.put(source_code, actual_hash)
+
+def store_project_sources(project_structure, store):
+    """source_hash가 있는 파일들의 소스를 저장소에 보관하고 저장된 파일 수를 반환합니다."""
+    project_path = project_structure['project_path']
+    stored = 0
+    for file_path, file_info in project_structure['files'].items():
+        source_hash = file_info.get('source_hash')
+        if source_hash and store.put_file(os.path.join(project_path, file_path), source_hash):
+            stored += 1
+    return stored
+
+class MethodBodyReader:
+    """메서드의 body_range를 소스에서 읽어 본문 텍스트로 돌려주는 지연 접근기.
+
+    파일별 소스는 처음 필요할 때 mmap으로 열어 해시를 확인하고, 최근 max_open개까지 열어 둡니다.
+    소스가 바뀌었고 저장소에도 없어 읽지 못한 본문은 None을 반환하고 missing에 셉니다.
+    여러 스레드에서 함께 호출할 수 있습니다.
+    """
+
+    def __init__(self, project_path, store=None, max_open=64):
+        self.project_path = project_path
+        self.store = store
+        self.max_open = max_open
+        self._sources = OrderedDict()
+        self._lock = threading.Lock()
+        self.missing = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open_verified(self, path, source_hash):
+        """파일을 mmap으로 열어 내용 해시가 같으면 (파일, mmap)을 반환합니다."""
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            return None
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 빈 파일은 mmap할 수 없음
+            f.close()
+            return None
+        if content_hash(buffer) != source_hash:
+            buffer.close()
+            f.close()
+            return None
+        return f, buffer
+
+    def _source(self, file_path, source_hash):
+        """분석 시점 내용(source_hash)의 소스 버퍼를 반환합니다 (프로젝트 파일, 저장소 순, 없으면 None).
+
+        호출하는 쪽에서 잠금을 잡고 있어야 합니다 (오래된 버퍼는 여기서 닫힘).
+        """
+        opened = self._sources.get(source_hash)
+        if opened is not None:
+            self._sources.move_to_end(source_hash)
+            return opened[1]
+
+        candidates = [os.path.join(self.project_path, file_path)]
+        if self.store is not None:
+            candidates.append(self.store.path(source_hash))
+        for path in candidates:
+            opened = self._open_verified(path, source_hash)
+            if opened is not None:
+                break
+        if opened is None:
+            return None
+
+        self._sources[source_hash] = opened
+        if len(self._sources) > self.max_open:
+            _, (f, buffer) = self._sources.popitem(last=False)
+            buffer.close()
+            f.close()
+        return opened[1]
+
+    def body(self, file_path, file_info, method_info):
+        """메서드 본문 텍스트를 반환합니다 (body가 있으면 그대로, 범위만 있으면 소스에서 읽음)."""
+        if 'body' in method_info:
+            return method_info['body']
+        body_range = method_info.get('body_range')
+        source_hash = file_info.get('source_hash')
+        if not body_range or not source_hash:
+            return None
+        with self._lock:
+            buffer = self._source(file_path, source_hash)
+            if buffer is None:
+                self.missing += 1
+                return None
+            data = buffer[body_range[0]:body_range[1]]
+        return data.decode('utf-8')
+
+    def close(self):
+        with self._lock:
+            for f, buffer in self._sources.values():
+                buffer.close()
+                f.close()
+            self._sources.clear()
+
+def warn_missing_bodies(reader):
+    """읽지 못한 본문이 있으면 경고를 출력하고 그 수를 반환합니다."""
+    if reader.missing:
+        hint = "" if reader.store is not None else " (분석 시 --source-store로 소스를 보관하고 같은 디렉토리를 지정하세요)"
+        print(f"경고: 소스가 바뀌었거나 없어 메서드 본문 {reader.missing}개를 읽지 못했습니다{hint}")
+    return reader.missing
+
+def materialize_bodies(project_structure, reader):
+    """범위만 기록된 메서드들에 본문 텍스트를 채우고, 읽지 못한 메서드 수를 반환합니다 (있으면 경고 출력)."""
+    missing = reader.missing
+    for file_path, file_info in project_structure['files'].items():
+        for key in ('classes', 'interfaces'):
+            for type_info in file_info.get(key, []):
+                for method_info in type_info.get('methods', []):
+                    if 'body' in method_info or 'body_range' not in method_info:
+                        continue
+                    method_info['body'] = reader.body(file_path, file_info, method_info)
+    warn_missing_bodies(reader)
+    return reader.missing - missing
@@ -0,0 +1,270 @@
+# 관계 분석 단계들이 공유하는 프로젝트 심볼 인덱스
+
+# 트라이 노드에서 값(파일 경로)을 저장하는 키 (이름 조각과 겹치지 않음)
+_VALUE = None
+
+def is_exported_type(type_info, file_path):
+    """최상위 타입이 다른 패키지에 공개되는지 확인합니다.
+
+    파싱한 수정자가 있으면 public 여부로 판단하고, 수정자가 없는 이전 형식 결과는
+    public 최상위 타입이 반드시 <이름>.java 파일에 있다는 규칙으로 추정합니다.
+    """
+    modifiers = type_info.get('modifiers')
+    if modifiers is not None:
+        return 'public' in modifiers
+    file_name = file_path.replace('\\', '/').rsplit('/', 1)[-1]
+    return file_name.rsplit('.', 1)[0] == type_info['name']
+
+def _member_names(type_info):
+    """타입이 선언한 메서드/필드 이름 집합 (정적 멤버 임포트 해석용)."""
+    names = {method_info['name'] for method_info in type_info.get('methods', [])}
+    names.update(field_info['name'] for field_info in type_info.get('fields', []))
+    return frozenset(names)
+
+class SymbolIndex:
+    """클래스 맵(이름 -> 파일 경로)을 한 번만 색인해 임포트를 임포트 길이에 비례하는 시간에 분류/해석합니다.
+
+    - names: 짧은 이름과 FQN을 모두 담는 dict
+    - package_trie: FQN을 '.' 조각 단위로 담은 트라이 (패키지/중첩 클래스 접두사 해석용)
+    """
+
+    def __init__(self, class_map):
+        self.names = dict(class_map)
+        self.package_trie = {}
+
+        for name, file_path in self.names.items():
+            node = self.package_trie
+            for segment in name.split('.'):
+                node = node.setdefault(segment, {})
+            node[_VALUE] = file_path
+
+    def __contains__(self, name):
+        return name in self.names
+
+    def lookup(self, name):
+        """이름(짧은 이름 또는 FQN)에 해당하는 파일 경로를 반환합니다 (없으면 None)."""
+        return self.names.get(name)
+
+    def has_name_suffix(self, import_path):
+        """임포트 문자열이 색인된 이름 중 하나로 끝나는지 확인합니다 (import_path.endswith(name)).
+
+        이름마다 글자 트라이를 두는 대신 임포트의 접미사를 이름 dict에서 찾음 (색인 메모리는 이름 수에만 비례)
+        """
+        names = self.names
+        return any(import_path[start:] in names for start in range(len(import_path)))
+
+    def is_internal_import(self, import_path):
+        """임포트가 프로젝트 내부 클래스를 가리키는지 분류합니다."""
+        if import_path in self.names:
+            return True
+        # 패키지의 일부만 있는 경우 체크 (임포트 조각 중 하나가 클래스 이름)
+        if any(segment in self.names for segment in import_path.split('.')):
+            return True
+        return self.has_name_suffix(import_path)
+
+    def resolve_prefix(self, qualified_name):
+        """조각 단위로 가장 길게 일치하는 FQN 접두사의 (이름, 파일 경로)를 반환합니다.
+
+        중첩 클래스 임포트(a.b.Outer.Inner)나 정적 멤버 임포트(a.b.Util.method)를 선언 파일로 연결할 때 사용합니다.
+        """
+        node = self.package_trie
+        matched = None
+        segments = qualified_name.split('.')
+        for depth, segment in enumerate(segments):
+            node = node.get(segment)
+            if node is None:
+                break
+            if _VALUE in node:
+                matched = ('.'.join(segments[:depth + 1]), node[_VALUE])
+        return matched
+
+    def is_project_package(self, package_name):
+        """패키지(또는 FQN 접두사)가 프로젝트 안에 선언된 타입을 포함하는지 확인합니다."""
+        node = self.package_trie
+        for segment in package_name.split('.'):
+            node = node.get(segment)
+            if node is None:
+                return False
+        return True
+
+class ProjectSymbolTable:
+    """분석 한 번에 한 번만 만드는 프로젝트 전체 심볼 테이블.
+
+    - declarations: FQN -> 선언 정보 {'name', 'fqn', 'package', 'kind', 'file', 'members'}
+    - simple_names: 짧은 이름 -> 같은 이름 선언 후보 목록 (패키지가 달라도 덮어쓰지 않음)
+    - packages: 패키지 -> 소속 선언 목록
+    - exports: 패키지 -> {짧은 이름: 선언} (다른 패키지에서 보이는 public 타입, 와일드카드 임포트 해석용)
+    - index: 이름 색인 (임포트 분류/접두사 해석용 SymbolIndex)
+    """
+
+    def __init__(self, project_structure=None):
+        self.declarations = {}
+        self.simple_names = {}
+        self.packages = {}
+        self.exports = {}
+        self._index = None
+
+        if project_structure is not None:
+            for file_path, file_info in project_structure['files'].items():
+                self.add_file(file_path, file_info)
+
+    def add_file(self, file_path, file_info):
+        """파일 하나의 클래스/인터페이스 선언을 테이블에 추가합니다."""
+        if 'error' in file_info:
+            return
+
+        package = file_info.get('package') or ''
+        for kind, key in (('class', 'classes'), ('interface', 'interfaces')):
+            for type_info in file_info.get(key, []):
+                name = type_info['name']
+                fqn = f"{package}.{name}" if package else name
+                declaration = {
+                    'name': name,
+                    'fqn': fqn,
+                    'package': package,
+                    'kind': kind,
+                    'file': file_path,
+                    'members': _member_names(type_info)
+                }
+                self.declarations[fqn] = declaration
+                self.simple_names.setdefault(name, []).append(declaration)
+                self.packages.setdefault(package, []).append(declaration)
+                if is_exported_type(type_info, file_path):
+                    self.exports.setdefault(package, {})[name] = declaration
+        self._index = None
+
+    @property
+    def index(self):
+        """짧은 이름과 FQN을 모두 담은 이름 색인을 반환합니다 (처음 사용할 때 한 번 생성)."""
+        if self._index is None:
+            names = dict(self.simple_names)
+            names.update(self.declarations)
+            self._index = SymbolIndex(names)
+        return self._index
+
+    def bindings(self):
+        """이름(짧은 이름/FQN) -> 선언 파일 경로 튜플 (증분 분석에서 바뀐 이름을 찾을 때 사용)."""
+        bindings = {name: tuple(declaration['file'] for declaration in candidates)
+                    for name, candidates in self.simple_names.items()}
+        bindings.update((fqn, (declaration['file'],)) for fqn, declaration in self.declarations.items())
+        return bindings
+
+    def is_internal_import(self, import_path):
+        """임포트가 프로젝트 내부 타입(또는 프로젝트 패키지 전체)을 가리키는지 분류합니다."""
+        if import_path.endswith('.*') and import_path[:-2] in self.packages:
+            return True
+        return self.index.is_internal_import(import_path)
+
+    def resolve_import(self, import_path):
+        """임포트가 가리키는 프로젝트 타입 선언을 반환합니다.
+
+        단일 타입 임포트는 그대로, 중첩 클래스/정적 멤버 임포트(a.b.Util.method, a.b.Util.*)는
+        패키지 트라이에서 가장 길게 일치하는 타입으로 해석합니다. 패키지 와일드카드는 None.
+        """
+        if import_path.endswith('.*'):
+            import_path = import_path[:-2]
+        declaration = self.declarations.get(import_path)
+        if declaration is not None:
+            return declaration
+
+        match = self.index.resolve_prefix(import_path)
+        if match is not None and isinstance(match[1], dict):
+            return match[1]
+        return None
+
+    def file_scope(self, file_info):
+        """파일의 패키지와 임포트로 이름 해석 문맥을 만듭니다 (파일당 한 번).
+
+        - imported: 단일 타입 임포트 (짧은 이름 -> 선언)
+        - wildcards: 와일드카드로 임포트한 프로젝트 패키지의 export 목록
+        - static_members: 정적 멤버 임포트 (멤버 이름 -> 소유 타입 선언, import static a.b.C.m)
+        - static_owners: 정적 와일드카드로 멤버를 가져온 타입 선언 목록 (import static a.b.C.*)
+
+        임포트 목록에는 static 여부가 없으므로, 프로젝트 타입 FQN 뒤에 이름이 하나 더 붙은 임포트와
+        타입 FQN의 와일드카드를 정적 멤버 임포트로 취급합니다.
+        """
+        imported = {}
+        wildcards = []
+        static_members = {}
+        static_owners = []
+        for import_path in file_info.get('imports', []):
+            if import_path.endswith('.*'):
+                owner = import_path[:-2]
+                exports = self.exports.get(owner)
+                if exports:
+                    wildcards.append(exports)
+                elif owner in self.declarations:
+                    static_owners.append(self.declarations[owner])
+                continue
+            declaration = self.declarations.get(import_path)
+            if declaration is not None:
+                imported[declaration['name']] = declaration
+                continue
+            owner, _, member = import_path.rpartition('.')
+            declaration = self.declarations.get(owner)
+            if declaration is not None:
+                static_members[member] = declaration
+        return {
+            'package': file_info.get('package') or '',
+            'imported': imported,
+            'wildcards': wildcards,
+            'static_members': static_members,
+            'static_owners': static_owners
+        }
+
+    def resolve(self, name, scope=None):
+        """파일 문맥에서 타입 이름을 선언으로 해석합니다 (모호하면 None).
+
+        1. FQN이면 그대로 찾음
+        2. 단일 타입 임포트 중 이름이 같은 것
+        3. 같은 패키지의 타입
+        4. 와일드카드 임포트한 패키지의 public 타입 (한 패키지에서만 제공될 때)
+        5. 정적 임포트한 멤버 이름이면 그 멤버의 소유 타입
+        6. 후보가 하나뿐인 짧은 이름
+        """
+        if not name:
+            return None
+        if '.' in name:
+            return self.declarations.get(name)
+
+        candidates = self.simple_names.get(name)
+        if scope is not None:
+            declaration = scope['imported'].get(name)
+            if declaration is not None:
+                return declaration
+
+            if candidates:
+                package = scope['package']
+                declaration = self.declarations.get(f"{package}.{name}" if package else name)
+                if declaration is not None:
+                    return declaration
+
+                provided = [exports[name] for exports in scope['wildcards'] if name in exports]
+                if len(provided) == 1:
+                    return provided[0]
+
+            declaration = self.resolve_static_member(name, scope)
+            if declaration is not None:
+                return declaration
+
+        if candidates and len(candidates) == 1:
+            return candidates[0]
+        return None
+
+    def resolve_static_member(self, name, scope):
+        """정적 임포트한 멤버(메서드/필드) 이름의 소유 타입 선언을 반환합니다 (없거나 모호하면 None).
+
+        단일 정적 임포트가 우선하고, 정적 와일드카드는 멤버를 선언한 타입이 하나일 때만 해석합니다.
+        """
+        declaration = scope['static_members'].get(name)
+        if declaration is not None:
+            return declaration
+        owners = [owner for owner in scope['static_owners'] if name in owner['members']]
+        if len(owners) == 1:
+            return owners[0]
+        return None
+
+    def resolve_file(self, name, scope=None):
+        """타입 이름이 선언된 파일 경로를 반환합니다 (해석되지 않으면 None)."""
+        declaration = self.resolve(name, scope)
+        return declaration['file'] if declaration is not None else None
@@ -0,0 +1,146 @@
+import os
+import random
+
+# 벤치마크용 가상 Java 프로젝트 생성기
+# - 같은 인자와 seed면 항상 같은 파일 내용을 생성 (커밋 간 성능 비교용)
+# - 파일마다 public 클래스 하나(C<i>)와 package-private 클래스(C<i>_<k>)를 두고,
+#   interface_ratio 비율의 파일은 인터페이스(I<i>)로 생성
+# - 임포트/필드/상속/구현/메서드 호출은 다른 파일의 타입을 가리켜 관계 분석 단계에도 부하가 걸리게 함
+
+# 패키지 한 단계에 두는 하위 패키지 수
+PACKAGE_FANOUT = 8
+# 패키지 하나에 두는 평균 파일 수
+FILES_PER_PACKAGE = 20
+
+def package_name(package_index, package_depth):
+    """패키지 번호를 package_depth 단계의 패키지 이름으로 바꿉니다 (최상위 단계는 번호가 커지면 계속 늘어남)."""
+    segments = []
+    for depth in range(package_depth):
+        value = package_index // (PACKAGE_FANOUT ** (package_depth - 1 - depth))
+        segments.append(f"m{value if depth == 0 else value % PACKAGE_FANOUT}")
+    return "com.synthetic." + ".".join(segments)
+
+def _type_name(index, interface_ratio):
+    """파일 번호의 대표 타입 이름 (인터페이스 파일이면 I<i>, 아니면 C<i>)."""
+    if interface_ratio and int((index + 1) * interface_ratio) != int(index * interface_ratio):
+        return f"I{index}"
+    return f"C{index}"
+
+def _method_body(rng, method_index, body_size, fields, methods_per_class):
+    """body_size개 문장의 메서드 본문 줄 목록을 만듭니다 (지역 변수, 필드 메서드 호출, 분기, 문자열 연결)."""
+    lines = ["        int result = value;"]
+    for statement in range(body_size):
+        kind = statement % 4
+        target = (method_index + statement + 1) % methods_per_class
+        if kind == 0 and fields:
+            field_type, field_name = fields[rng.randrange(len(fields))]
+            lines.append(f"        result += {field_name}.m{target}(result, label);")
+        elif kind == 1 and fields:
+            field_type, _ = fields[rng.randrange(len(fields))]
+            if field_type.startswith("C"):
+                lines.append(f"        {field_type} local{statement} = new {field_type}();")
+                lines.append(f"        result += local{statement}.m{target}(result + {statement}, label);")
+            else:
+                lines.append(f"        result += this.m{target}(result - {statement}, label);")
+        elif kind == 2:
+            lines.append(f"        if (result > {rng.randrange(1000)}) {{")
+            lines.append(f"            result = result % {rng.randrange(2, 97)};")
+            lines.append("        }")
+        else:
+            lines.append(f"        label = label + \"{statement}:\" + result;")
+    lines.append("        return result;")
+    return lines
+
+def generate_file(index, file_count, classes_per_file=1, methods_per_class=10, body_size=5, import_fanout=5,
+                  package_depth=3, interface_ratio=0.1, seed=0):
+    """파일 번호 하나의 (상대 경로, 소스 텍스트)를 만듭니다 (다른 파일을 만들지 않아도 결정적)."""
+    rng = random.Random(f"{seed}:{index}")
+    package_count = max(1, file_count // FILES_PER_PACKAGE)
+    package = package_name(index % package_count, package_depth)
+    type_name = _type_name(index, interface_ratio)
+
+    # 다른 파일의 대표 타입을 import_fanout개 임포트
+    targets = []
+    seen = {index}
+    for _ in range(min(import_fanout, file_count - 1)):
+        target = rng.randrange(file_count)
+        while target in seen:
+            target = (target + 1) % file_count
+        seen.add(target)
+        targets.append((target, package_name(target % package_count, package_depth),
+                        _type_name(target, interface_ratio)))
+
+    lines = [f"package {package};", ""]
+    lines += [f"import {target_package}.{target_type};" for _, target_package, target_type in targets]
+    lines += ["import java.util.List;", ""]
+
+    if type_name.startswith("I"):
+        # 상속 순환이 생기지 않도록 번호가 작은 타입만 상위 타입으로 사용
+        parents = [target_type for target, _, target_type in targets
+                   if target < index and target_type.startswith("I")][:2]
+        header = f"public interface {type_name}" + (f" extends {', '.join(parents)}" if parents else "")
+        lines.append(header + " {")
+        lines += [f"    int m{m}(int value, String label);" for m in range(methods_per_class)]
+        lines.append("}")
+        return os.path.join(*package.split('.'), f"{type_name}.java"), "\n".join(lines) + "\n"
+
+    fields = [(target_type, f"field{k}") for k, (_, _, target_type) in enumerate(targets[:3])]
+    classes = [target_type for target, _, target_type in targets if target < index and target_type.startswith("C")]
+    interfaces = [target_type for _, _, target_type in targets if target_type.startswith("I")]
+    for k in range(classes_per_file):
+        name = type_name if k == 0 else f"{type_name}_{k}"
+        header = ("public " if k == 0 else "") + f"class {name}"
+        if k == 0 and classes:
+            header += f" extends {classes[0]}"
+        elif k > 0:
+            header += f" extends {type_name}"
+        if k == 0 and interfaces:
+            header += f" implements {', '.join(interfaces[:2])}"
+        lines.append(header + " {")
+        lines += [f"    private {field_type} {field_name};" for field_type, field_name in fields]
+        lines.append("    private List<String> names;")
+        for m in range(methods_per_class):
+            lines += ["", f"    public int m{m}(int value, String label) {{"]
+            lines += _method_body(rng, m, body_size, fields, methods_per_class)
+            lines.append("    }")
+        lines += ["}", ""]
+    return os.path.join(*package.split('.'), f"{type_name}.java"), "\n".join(lines)
+
+def generate_project(output_dir, file_count, classes_per_file=1, methods_per_class=10, body_size=5, import_fanout=5,
+                     package_depth=3, interface_ratio=0.1, seed=0):
+    """output_dir에 가상 Java 프로젝트를 생성하고 생성한 소스 바이트 수를 반환합니다."""
+    total_bytes = 0
+    created_dirs = set()
+    for index in range(file_count):
+        relative_path, source = generate_file(index, file_count, classes_per_file, methods_per_class, body_size,
+                                              import_fanout, package_depth, interface_ratio, seed)
+        path = os.path.join(output_dir, relative_path)
+        directory = os.path.dirname(path)
+        if directory not in created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            created_dirs.add(directory)
+        data = source.encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(data)
+        total_bytes += len(data)
+    return total_bytes
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="벤치마크용 가상 Java 프로젝트 생성기 (같은 인자/seed면 같은 결과)")
+    arg_parser.add_argument("output_dir", help="생성할 프로젝트 디렉토리")
+    arg_parser.add_argument("--files", type=int, default=1000, help="파일 수 (기본값: 1000)")
+    arg_parser.add_argument("--classes-per-file", type=int, default=1, help="파일당 클래스 수 (기본값: 1)")
+    arg_parser.add_argument("--methods-per-class", type=int, default=10, help="클래스당 메서드 수 (기본값: 10)")
+    arg_parser.add_argument("--body-size", type=int, default=5, help="메서드 본문 문장 수 (기본값: 5)")
+    arg_parser.add_argument("--import-fanout", type=int, default=5, help="파일당 프로젝트 내부 임포트 수 (기본값: 5)")
+    arg_parser.add_argument("--package-depth", type=int, default=3, help="com.synthetic 아래 패키지 깊이 (기본값: 3)")
+    arg_parser.add_argument("--interface-ratio", type=float, default=0.1, help="인터페이스 파일 비율 (기본값: 0.1)")
+    arg_parser.add_argument("--seed", type=int, default=0, help="난수 seed (기본값: 0)")
+    args = arg_parser.parse_args()
+
+    total_bytes = generate_project(args.output_dir, args.files, args.classes_per_file, args.methods_per_class,
+                                   args.body_size, args.import_fanout, args.package_depth, args.interface_ratio,
+                                   args.seed)
+    print(f"{args.files}개 파일 ({total_bytes / 1024 / 1024:.1f}MB)을 {args.output_dir}에 생성했습니다.")
@@ -0,0 +1,68 @@
+import json
+import struct
+
+import pytest
+
+import java_ast_analyzer
+import synthetic_corpus
+from analysis_io import BINARY_MAGIC, write_binary, read_binary, write_analysis, load_analysis
+from code_model import model_default
+
+# 바이너리 분석 결과(.jab) 왕복 테스트 (benchmark.py format의 자동 검증판)
+# - 기록한 뒤 다시 읽은 결과가 같은 결과의 JSON 형태와 완전히 같아야 함
+
+def _as_json(value):
+    return json.loads(json.dumps(value, ensure_ascii=False, default=model_default))
+
+@pytest.fixture(scope="module")
+def project_structure(tmp_path_factory):
+    project_path = tmp_path_factory.mktemp("corpus")
+    synthetic_corpus.generate_project(str(project_path), 40, classes_per_file=2, methods_per_class=6)
+    return java_ast_analyzer.analyze_java_project(str(project_path), max_workers=1, engine='thread')
+
+def test_analysis_round_trip(project_structure, tmp_path):
+    path = str(tmp_path / "analysis.jab")
+    write_analysis(project_structure, path)
+    assert load_analysis(path) == _as_json(project_structure)
+
+def test_value_round_trip(tmp_path):
+    value = {
+        'files': {},
+        'empty_list': [],
+        'empty_dict': {},
+        'scalars': [None, True, False, 0, 1, -1, 2 ** 63 - 1, -2 ** 63, 0.5, -1e300, 'x'],
+        'bool_vs_int': {'a': True, 'b': 1, 'c': False, 'd': 0},
+        'unicode': ['한글 이름', 'emoji \U0001F600', ''],
+        'records': [{'name': 'a', 'line': 1}, {'name': 'b', 'line': 2}],
+        'mixed_records': [{'name': 'a'}, {'line': 1}, {'name': 'c', 'children': [{'name': 'd'}]}],
+        'nested': [[[]], [{}], [[1, [2, [3]]]]]
+    }
+    path = str(tmp_path / "value.jab")
+    write_binary(value, path)
+    result = read_binary(path)
+    assert result == value
+    assert [type(item) for item in result['scalars']] == [type(item) for item in value['scalars']]
+    assert [type(item) for item in result['bool_vs_int'].values()] == [bool, int, bool, int]
+    assert list(result['records'][1]) == ['name', 'line']
+
+def test_rejects_oversized_int(tmp_path):
+    with pytest.raises(ValueError):
+        write_binary({'files': {}, 'value': 2 ** 63}, str(tmp_path / "big.jab"))
+
+def test_rejects_bad_magic_and_version(tmp_path):
+    path = tmp_path / "value.jab"
+    write_binary({'files': {}}, str(path))
+    data = path.read_bytes()
+
+    path.write_bytes(b"XXXX" + data[len(BINARY_MAGIC):])
+    with pytest.raises(ValueError):
+        read_binary(str(path))
+
+    header_start = len(BINARY_MAGIC) + 4
+    (header_length,) = struct.unpack_from('<I', data, len(BINARY_MAGIC))
+    header = json.loads(data[header_start:header_start + header_length])
+    header['version'] += 1
+    encoded = json.dumps(header).encode('utf-8')
+    path.write_bytes(BINARY_MAGIC + struct.pack('<I', len(encoded)) + encoded + data[header_start + header_length:])
+    with pytest.raises(ValueError):
+        read_binary(str(path))
@@ -0,0 +1,70 @@
+import os
+
+import java_ast_analyzer
+from dependency_scc import cycle_members
+
+# 상위 타입(implements/extends) 추출과 이를 거치는 의존 순환 테스트
+# - tree-sitter-java는 super_interfaces/extends_interfaces 아래 type_list에 타입을 두므로
+#   제네릭/정규화된 이름까지 간선이 생겨야 함
+
+SOURCES = {
+    # Circle -> Round: 임포트 없이 정규화된 제네릭 타입으로 구현
+    "app/p/Circle.java": """package app.p;
+
+public class Circle implements app.q.Round<Circle>, Comparable<Circle> {
+    public int compareTo(Circle other) {
+        return 0;
+    }
+}
+""",
+    # Round -> Shape: 같은 패키지의 인터페이스 확장
+    "app/q/Round.java": """package app.q;
+
+public interface Round<T> extends Shape {
+}
+""",
+    # Shape -> Circle: 임포트
+    "app/q/Shape.java": """package app.q;
+
+import app.p.Circle;
+
+public interface Shape {
+    Circle unit();
+}
+""",
+    "app/q/Plain.java": """package app.q;
+
+public class Plain {
+}
+""",
+}
+
+def _write_project(root):
+    for relative_path, source in SOURCES.items():
+        path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(source)
+
+def _file_info(project_structure, relative_path):
+    return next(info for path, info in project_structure['files'].items() if path.endswith(relative_path))
+
+def test_supertype_edges_and_cycle(tmp_path):
+    _write_project(str(tmp_path))
+    for extractor in ('walk', 'cursor', 'query'):
+        project_structure = java_ast_analyzer.analyze_java_project(str(tmp_path), max_workers=1, engine='thread',
+                                                                   extractor=extractor, dependency_cycles=True)
+
+        circle = _file_info(project_structure, "Circle.java")
+        assert circle['classes'][0]['implements'] == ['app.q.Round', 'Comparable']
+        assert _file_info(project_structure, "Round.java")['interfaces'][0]['extends'] == ['Shape']
+
+        edges = {(dependency['type'], os.path.basename(dependency['file']))
+                 for path, info in project_structure['files'].items()
+                 for dependency in info['dependencies'] if dependency.get('file')}
+        assert ('implements', 'Round.java') in edges
+        assert ('extends', 'Shape.java') in edges
+
+        cycles = [sorted(os.path.basename(path) for path in members)
+                  for members in cycle_members(project_structure['dependency_cycles']['files'])]
+        assert cycles == [['Circle.java', 'Round.java', 'Shape.java']]
@@ -0,0 +1,88 @@
+import io
+import os
+import re
+import contextlib
+
+import pytest
+
+from graph import JavaProjectGraphLoader
+
+# graph.py IMPORTS 관계 테스트
+# - 공통 관계 분석의 dependencies에는 프로젝트 내부 임포트만 남으므로,
+#   외부 라이브러리 임포트까지 포함해 소스의 import 문마다 IMPORTS 관계가 하나씩 생겨야 함 (기존 동작)
+
+SOURCES = {
+    "com/sample/app/Main.java": """package com.sample.app;
+
+import java.util.List;
+import java.util.Map;
+import org.external.Client;
+import com.sample.util.Helper;
+
+public class Main {
+    private Helper helper;
+    public List<String> run(Map<String, String> input, Client client) { return null; }
+}
+""",
+    "com/sample/util/Helper.java": """package com.sample.util;
+
+import java.io.File;
+
+public class Helper {
+    public File file() { return null; }
+}
+""",
+    "com/sample/util/Plain.java": """package com.sample.util;
+
+public class Plain {
+}
+""",
+}
+
+IMPORT_STATEMENT = re.compile(r'^import\s+([\w.]+)\s*;', re.MULTILINE)
+
+class RecordingDriver:
+    """실행한 IMPORTS 쿼리의 (파일, 임포트) 쌍만 기록하는 Neo4j 드라이버 대역"""
+
+    def __init__(self):
+        self.imports = []
+
+    def session(self, database=None):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def run(self, query, parameters=None):
+        if ':IMPORTS]' in query:
+            self.imports.append((parameters['file_path'], parameters['import_target']))
+        return []
+
+    def close(self):
+        pass
+
+@pytest.mark.parametrize("module_name", ["java_ast", "java_ast_analyzer"])
+def test_imports_include_external(tmp_path, module_name):
+    module = pytest.importorskip(module_name)
+
+    project_path = tmp_path / "project"
+    expected = set()
+    for relative_path, source in SOURCES.items():
+        path = project_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding='utf-8')
+        expected.update((relative_path, target) for target in IMPORT_STATEMENT.findall(source))
+
+    output_json = str(tmp_path / "analysis.json")
+    driver = RecordingDriver()
+    with contextlib.redirect_stdout(io.StringIO()):
+        module.analyze_java_project(str(project_path), output_json, max_workers=1)
+        JavaProjectGraphLoader(None, None, None, driver=driver).load_project(output_json)
+
+    imports = {(os.path.relpath(file_path, project_path) if os.path.isabs(file_path) else file_path, target)
+               for file_path, target in driver.imports}
+    assert len(expected) == 5
+    assert imports == expected
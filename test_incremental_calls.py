@@ -0,0 +1,60 @@
+import json
+import subprocess
+
+import pytest
+
+import java_ast_analyzer
+import synthetic_corpus
+from code_model import model_default
+
+# git 증분 분석의 호출 재해석 테스트
+# - 메서드 선언이 바뀌어도 다른 파일은 다시 파싱하지 않고(호출 지점 사이드카), 결과는 전체 분석과 같아야 함
+
+DECLARING_FILE = "com/synthetic/m0/m0/m0/C24.java"
+
+def _git(project_path, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=project_path, check=True, stdout=subprocess.DEVNULL)
+
+def _dump(project_structure):
+    result = {key: value for key, value in project_structure.items() if key != 'git_revision'}
+    return json.dumps(result, sort_keys=True, ensure_ascii=False, default=model_default)
+
+@pytest.fixture
+def project(tmp_path):
+    project_path = tmp_path / "project"
+    synthetic_corpus.generate_project(str(project_path), 40)
+    _git(project_path, "init", "-q")
+    _git(project_path, "add", "-A")
+    _git(project_path, "commit", "-q", "-m", "init")
+    previous = tmp_path / "previous.json"
+    java_ast_analyzer.analyze_java_project(str(project_path), str(previous), max_workers=1, engine='thread')
+    return project_path, previous, tmp_path
+
+@pytest.mark.parametrize("old, new", [
+    ("public int m0(", "public int m0x("),
+    (" extends C21 {", " {")
+])
+def test_declaration_change_reuses_call_sites(project, monkeypatch, old, new):
+    project_path, previous, tmp_path = project
+    source_path = project_path / DECLARING_FILE
+    source = source_path.read_text(encoding='utf-8')
+    assert old in source
+    source_path.write_text(source.replace(old, new, 1), encoding='utf-8')
+
+    parsed = []
+    parse_java_files = java_ast_analyzer.parse_java_files
+
+    def counting_parse(java_files, *args, **kwargs):
+        parsed.extend(java_files)
+        return parse_java_files(java_files, *args, **kwargs)
+
+    monkeypatch.setattr(java_ast_analyzer, "parse_java_files", counting_parse)
+    incremental = java_ast_analyzer.analyze_java_project(str(project_path), str(tmp_path / "incremental.json"),
+                                                         max_workers=1, engine='thread', previous_json=str(previous))
+    monkeypatch.undo()
+    full = java_ast_analyzer.analyze_java_project(str(project_path), str(tmp_path / "full.json"),
+                                                  max_workers=1, engine='thread')
+
+    assert parsed == [str(source_path)]
+    assert _dump(incremental) == _dump(full)
@@ -0,0 +1,50 @@
+import json
+import threading
+
+import pytest
+
+import java_ast_analyzer
+import synthetic_corpus
+from code_model import model_default
+from java_file_discovery import find_java_files
+
+# 스레드별 Parser 풀 일관성 테스트 (benchmark.py threads의 자동 검증판)
+# - 같은 코퍼스를 1/4/16 스레드로 여러 번 파싱해도 순차 파싱 결과와 완전히 같아야 함
+
+THREAD_COUNTS = (1, 4, 16)
+
+def _dump(results):
+    return json.dumps(results, sort_keys=True, ensure_ascii=False, default=model_default)
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    project_path = tmp_path_factory.mktemp("corpus")
+    synthetic_corpus.generate_project(str(project_path), 60, classes_per_file=2, methods_per_class=8)
+    java_files = sorted(find_java_files(str(project_path)))
+    expected = _dump([java_ast_analyzer.process_java_file(file_path) for file_path in java_files])
+    return java_files, expected
+
+@pytest.mark.parametrize("thread_count", THREAD_COUNTS)
+def test_thread_parsing_matches_sequential(corpus, thread_count):
+    java_files, expected = corpus
+    # 파일 목록을 반복해 스레드들이 같은 파일을 동시에 파싱하게 함
+    results = java_ast_analyzer.parse_files_in_threads(java_files * 4, thread_count)
+    for start in range(0, len(results), len(java_files)):
+        assert _dump(results[start:start + len(java_files)]) == expected
+
+def test_thread_parsers_are_not_shared():
+    parsers = {}
+    barrier = threading.Barrier(4)
+
+    def worker(index):
+        barrier.wait()
+        parsers[index] = (java_ast_analyzer.get_thread_parser(), java_ast_analyzer.get_thread_parser())
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 같은 스레드에서는 같은 Parser, 스레드끼리는 서로 다른 Parser
+    assert all(first is second for first, second in parsers.values())
+    assert len({id(first) for first, _ in parsers.values()}) == 4